@@ -130,8 +130,9 @@ try:
             "content": base64.b64encode(attachment_content).decode('utf-8')
         })
     attachment_response = skribble.attachment.add(signature_request_id, attachments)
+    attachment_response.raise_for_errors()
     print(colored("Attachments added successfully:", "green"))
-    print(colored(attachment_response, "cyan"))
+    print(colored([upload.result for upload in attachment_response.succeeded], "cyan"))
 
     # Check if there are any attachments and delete all of them
     attachements_response = skribble.attachment.list(signature_request_id)
@@ -0,0 +1,87 @@
+"""
+Bytes on the wire with and without compression.
+
+Each scenario runs through every network transport against a local mock API that counts
+the bytes of the HTTP requests and responses it reads and writes (request and status
+lines, headers and bodies). "off" is a client with ``compress_responses=False``, which
+asks for uncompressed responses; "on" negotiates compressed responses and gzips request
+bodies (``compress_requests=True``).
+
+Scenarios: ``list`` (a page of 100 signature requests), ``create`` (a signature request with
+an uploaded document as base64), ``seal`` (the same upload through ``seal.create``) and
+``download`` (document content, which the API sends as is). Uploads are random bytes unless
+``--upload`` names a real PDF; random bytes are as incompressible as the compressed streams
+of a PDF, so the upload savings are those of undoing the base64 overhead.
+
+Usage:
+    python benchmarks/bench_compression.py [--requests 20] [--document-kb 256] [--upload contract.pdf]
+"""
+import argparse
+import base64
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import skribble
+from skribble.config import ClientConfig
+from skribble.transport import RequestsTransport, Urllib3Transport, HTTPXTransport
+from skribble.testing import MockSkribbleAPI, MockSkribbleServer
+
+TRANSPORTS = {"requests": RequestsTransport, "urllib3": Urllib3Transport, "httpx": HTTPXTransport}
+MODES = {"off": ClientConfig(compress_responses=False), "on": ClientConfig(compress_requests=True)}
+
+def operations(upload, document_ids):
+    signers = [{"account_email": "signer1@example.com"}, {"account_email": "signer2@example.com"}]
+    return {
+        "list": lambda i: skribble.signature_request.list(page_size=100),
+        "create": lambda i: skribble.signature_request.create({"title": f"Contract {i}", "content": upload, "signatures": signers}),
+        "seal": lambda i: skribble.seal.create({"title": f"Sealed {i}", "content": upload}),
+        "download": lambda i: skribble.document.download(document_ids[i % len(document_ids)])
+    }
+
+def measure(server, transport, config, scenario, upload, requests):
+    """
+    Return the bytes sent and received by the client per call, and the seconds per call.
+    """
+    client = server.client(config=config, transport=transport(config))
+    with client, skribble.use_client(client):
+        document_ids = [document["id"] for document in skribble.document.list()][:20]
+        operation = operations(upload, document_ids)[scenario]
+        # One untimed call logs in and opens a connection
+        operation(0)
+        received, sent = server.bytes_received, server.bytes_sent
+        started = time.perf_counter()
+        for i in range(requests):
+            operation(i)
+        elapsed = time.perf_counter() - started
+        return (server.bytes_received - received) / requests, (server.bytes_sent - sent) / requests, elapsed / requests
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20, help="calls per scenario, transport and mode")
+    parser.add_argument("--document-kb", type=int, default=256, help="size of uploaded and downloaded documents")
+    parser.add_argument("--upload", help="upload this file instead of random bytes")
+    parser.add_argument("--scenarios", default="list,create,seal,download")
+    args = parser.parse_args()
+
+    if args.upload:
+        with open(args.upload, "rb") as file:
+            upload = base64.b64encode(file.read()).decode()
+    else:
+        upload = base64.b64encode(os.urandom(args.document_kb * 1024)).decode()
+
+    api = MockSkribbleAPI(document_size=args.document_kb * 1024)
+    api.seed(100)
+    with MockSkribbleServer(api) as server:
+        print(f"{'scenario':<10} {'transport':<10} {'sent off':>10} {'sent on':>10} {'recv off':>10} {'recv on':>10} {'saved':>7} {'ms off':>7} {'ms on':>7}")
+        for scenario in args.scenarios.split(","):
+            for name, transport in TRANSPORTS.items():
+                sent_off, received_off, seconds_off = measure(server, transport, MODES["off"], scenario, upload, args.requests)
+                sent_on, received_on, seconds_on = measure(server, transport, MODES["on"], scenario, upload, args.requests)
+                saved = 1 - (sent_on + received_on) / (sent_off + received_off)
+                print(f"{scenario:<10} {name:<10} {sent_off:>10.0f} {sent_on:>10.0f} {received_off:>10.0f} {received_on:>10.0f} {saved:>7.1%} {seconds_off * 1000:>7.1f} {seconds_on * 1000:>7.1f}")
+
+if __name__ == "__main__":
+    main()
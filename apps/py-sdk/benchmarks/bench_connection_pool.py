@@ -0,0 +1,79 @@
+"""
+Throughput of SkribbleClient as the number of worker threads grows.
+
+Starts a local keep-alive HTTP server that answers like ``GET /signature-requests/{id}``
+and hammers it from a growing number of threads sharing one client, once with the
+``requests`` default pool size (10) and once with a pool sized for the thread count.
+
+Usage:
+    python benchmarks/bench_connection_pool.py [--requests 2000] [--threads 1,4,16,32,64]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from skribble.client import SkribbleClient
+from skribble.config import ClientConfig
+
+BODY = json.dumps({"id": "5c33d0cb-84", "title": "Benchmark", "status_overall": "OPEN", "signatures": []}).encode()
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate segments; without TCP_NODELAY every
+    # keep-alive response stalls ~40ms on the client's delayed ACK.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+def run(server, config, threads, total_requests):
+    client = SkribbleClient(access_token="benchmark", config=config)
+    client.BASE_URL = f"http://127.0.0.1:{server.server_port}"
+    server.connections = set()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda i: client._make_request("GET", f"/signature-requests/{i}"), range(total_requests)))
+    elapsed = time.perf_counter() - started
+    client.session.close()
+    return total_requests / elapsed, len(server.connections)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", default="1,4,16,32,64")
+    args = parser.parse_args()
+
+    # urllib3 logs a "connection pool is full" warning for every discarded connection
+    logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f"{'threads':>8} {'default req/s':>14} {'conns':>6} {'sized req/s':>12} {'conns':>6}")
+    for threads in [int(value) for value in args.threads.split(",")]:
+        default_rate, default_connections = run(server, ClientConfig(pool_maxsize=10), threads, args.requests)
+        sized_rate, sized_connections = run(server, ClientConfig(pool_maxsize=threads), threads, args.requests)
+        print(f"{threads:>8} {default_rate:>14.0f} {default_connections:>6} {sized_rate:>12.0f} {sized_connections:>6}")
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
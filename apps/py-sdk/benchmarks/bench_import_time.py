@@ -0,0 +1,69 @@
+"""
+Cold-start cost of the SDK: ``import skribble`` and the first use of the client, each measured
+in a fresh interpreter so nothing is served from an already populated ``sys.modules``.
+
+Also lists which heavy dependencies a plain ``import skribble`` pulls in; with lazy imports the
+list is empty and requests, pydantic and httpx load only once a client or model is used.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 15] [--max-ms 50]
+
+With ``--max-ms`` the script exits with status 1 when the median ``import skribble`` time
+exceeds the threshold, so it can guard against import-time regressions in CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+HEAVY_MODULES = ("requests", "pydantic", "email_validator", "httpx", "difflib")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import skribble
+imported = time.perf_counter()
+loaded = [name for name in {heavy!r} if name in sys.modules]
+{first_use}
+used = time.perf_counter()
+print(json.dumps({{"import": (imported - start) * 1000, "first_use": (used - imported) * 1000, "loaded": loaded}}))
+"""
+
+FIRST_USES = {
+    "SkribbleClient": "skribble.SkribbleClient",
+    "AsyncSkribbleClient": "skribble.AsyncSkribbleClient",
+    "signature_request": "skribble.signature_request.create",
+}
+
+def probe(first_use):
+    code = PROBE.format(heavy=HEAVY_MODULES, first_use=first_use)
+    env = dict(os.environ, PYTHONPATH=PACKAGE_ROOT, PYTHONDONTWRITEBYTECODE="1")
+    output = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if the median import time exceeds this")
+    args = parser.parse_args()
+
+    import_times = []
+    print(f"{'first use':<20} {'import ms':>10} {'first use ms':>13}")
+    for name, first_use in FIRST_USES.items():
+        results = [probe(first_use) for _ in range(args.runs)]
+        import_times.extend(result["import"] for result in results)
+        print(f"{name:<20} {statistics.median(r['import'] for r in results):>10.1f} {statistics.median(r['first_use'] for r in results):>13.1f}")
+
+    loaded = results[-1]["loaded"]
+    print(f"heavy modules loaded by 'import skribble': {', '.join(loaded) if loaded else 'none'}")
+
+    median = statistics.median(import_times)
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"median import time {median:.1f} ms exceeds --max-ms {args.max_ms:.1f}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+CPU time spent on JSON bodies: encoding a large base64 upload and decoding a large listing.
+
+Compares the previous path (``json=`` encoding in ``requests``, then ``response.text``
+followed by ``response.json()``, which decodes the body to a string twice) with the
+client's codecs, which encode to bytes once and decode straight from the received bytes.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--upload-mb 10] [--requests 10000]
+"""
+import argparse
+import base64
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from skribble.codec import JSONCodec, OrjsonCodec
+
+def previous_encode(payload):
+    # What requests does for json=
+    return json.dumps(payload, allow_nan=False).encode("utf-8")
+
+def previous_decode(content):
+    text = content.decode("utf-8")
+    if not text:
+        return None
+    # response.json() decodes the bytes again before parsing
+    return json.loads(content.decode("utf-8"))
+
+def best_of(function, argument, number=3):
+    return min(timeit.repeat(lambda: function(argument), number=number, repeat=5)) / number * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--upload-mb", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=10000)
+    args = parser.parse_args()
+
+    upload = {"title": "Contract", "content_type": "application/pdf", "content": base64.b64encode(os.urandom(args.upload_mb * 1024 * 1024)).decode()}
+    listing = json.dumps([
+        {"id": f"sr-{i}", "title": f"Contract {i}", "status_overall": "OPEN", "signatures": [{"sid": f"sig-{i}", "account_email": "signer@example.com", "status_code": "OPEN"}]}
+        for i in range(args.requests)
+    ]).encode()
+
+    paths = [("previous", previous_encode, previous_decode)]
+    stdlib = JSONCodec()
+    paths.append(("JSONCodec", stdlib.dumps, stdlib.loads))
+    try:
+        fast = OrjsonCodec()
+        paths.append(("OrjsonCodec", fast.dumps, fast.loads))
+    except ImportError:
+        print("orjson is not installed; skipping OrjsonCodec")
+
+    print(f"{'path':<12} {'encode upload ms':>17} {'decode listing ms':>18}")
+    for name, encode, decode in paths:
+        print(f"{name:<12} {best_of(encode, upload):>17.1f} {best_of(decode, listing):>18.1f}")
+
+if __name__ == "__main__":
+    main()
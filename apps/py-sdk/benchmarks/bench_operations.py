@@ -0,0 +1,166 @@
+"""
+Latency percentiles, throughput and peak memory of the SDK operations against a local
+stand-in for the Skribble v2 API (``skribble.testing``).
+
+The mock server runs in its own process, so its CPU time and allocations do not count
+against the client. Every scenario runs at each concurrency level through one shared
+client: ``create`` (signature request with an uploaded PDF), ``list`` (a page of signature
+requests), ``download`` (document content), ``preview`` (one page preview) and ``seal``.
+
+Peak memory is measured with ``tracemalloc`` in a second, shorter pass of the same
+workload, because tracing slows allocation-heavy code down and would skew the timings.
+
+Usage:
+    python benchmarks/bench_operations.py [--requests 200] [--concurrency 1,8,32]
+        [--latency 0.02] [--document-kb 256] [--scenarios create,list,download,preview,seal]
+        [--async] [--json results.json]
+"""
+import argparse
+import asyncio
+import base64
+import contextvars
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import skribble
+import skribble.aio
+from skribble.config import ClientConfig
+
+SCENARIOS = ("create", "list", "download", "preview", "seal")
+
+def start_server(args):
+    command = [
+        sys.executable, "-m", "skribble.testing",
+        "--latency", str(args.latency),
+        "--document-size", str(args.document_kb * 1024),
+        "--seed", str(args.seed)
+    ]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True, env=env)
+    return process, process.stdout.readline().strip()
+
+def operations(module, document_ids, upload):
+    """
+    One callable per scenario, taking the index of the call.
+    """
+    signers = [{"account_email": "signer1@example.com"}, {"account_email": "signer2@example.com"}]
+    return {
+        "create": lambda i: module.signature_request.create({"title": f"Contract {i}", "content": upload, "signatures": signers}),
+        "list": lambda i: module.signature_request.list(page_size=100),
+        "download": lambda i: module.document.download(document_ids[i % len(document_ids)]),
+        "preview": lambda i: module.document.preview(document_ids[i % len(document_ids)], 0),
+        "seal": lambda i: module.seal.create({"title": f"Sealed {i}", "content": upload})
+    }
+
+def run_sync(client, operation, requests, concurrency):
+    def timed(i):
+        started = time.perf_counter()
+        operation(i)
+        return time.perf_counter() - started
+
+    with skribble.use_client(client), ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Executor threads do not inherit the context that carries the client
+        context = contextvars.copy_context()
+        started = time.perf_counter()
+        latencies = list(executor.map(lambda i: context.copy().run(timed, i), range(requests)))
+        return latencies, time.perf_counter() - started
+
+async def run_async(client, operation, requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(i):
+        async with semaphore:
+            started = time.perf_counter()
+            await operation(i)
+            return time.perf_counter() - started
+
+    with skribble.aio.use_client(client):
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(timed(i) for i in range(requests)))
+        return latencies, time.perf_counter() - started
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def measure(args, base_url, scenario, concurrency, requests):
+    config = ClientConfig(pool_maxsize=max(concurrency, 10))
+    if args.use_async:
+        async def main():
+            client = skribble.aio.AsyncSkribbleClient(username="api_user", api_key="mock-api-key", config=config)
+            client.BASE_URL = base_url
+            async with client:
+                with skribble.aio.use_client(client):
+                    document_ids = [document["id"] for document in await skribble.aio.document.list()][:100]
+                operation = operations(skribble.aio, document_ids, args.upload)[scenario]
+                # One untimed call logs in and opens a connection
+                with skribble.aio.use_client(client):
+                    await operation(0)
+                return await run_async(client, operation, requests, concurrency)
+        return asyncio.run(main())
+
+    client = skribble.SkribbleClient(username="api_user", api_key="mock-api-key", config=config)
+    client.BASE_URL = base_url
+    with client, skribble.use_client(client):
+        document_ids = [document["id"] for document in skribble.document.list()][:100]
+        operation = operations(skribble, document_ids, args.upload)[scenario]
+        operation(0)
+        return run_sync(client, operation, requests, concurrency)
+
+def peak_memory(args, base_url, scenario, concurrency):
+    tracemalloc.start()
+    try:
+        measure(args, base_url, scenario, concurrency, max(concurrency * 2, args.requests // 4))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="calls per scenario and concurrency level")
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the mock API waits before answering")
+    parser.add_argument("--document-kb", type=int, default=256, help="size of uploaded and downloaded documents")
+    parser.add_argument("--seed", type=int, default=500, help="signature requests on the server before the run")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--async", dest="use_async", action="store_true", help="use the asynchronous client")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    args.upload = base64.b64encode(os.urandom(args.document_kb * 1024)).decode()
+
+    process, base_url = start_server(args)
+    results = []
+    try:
+        print(f"{'scenario':<10} {'conc':>5} {'ops/s':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'peak MiB':>9}")
+        for scenario in args.scenarios.split(","):
+            for concurrency in [int(level) for level in args.concurrency.split(",")]:
+                latencies, elapsed = measure(args, base_url, scenario, concurrency, args.requests)
+                result = {
+                    "scenario": scenario,
+                    "concurrency": concurrency,
+                    "throughput": len(latencies) / elapsed,
+                    "p50_ms": statistics.median(latencies) * 1000,
+                    "p90_ms": percentile(latencies, 0.90) * 1000,
+                    "p99_ms": percentile(latencies, 0.99) * 1000,
+                    "peak_mib": peak_memory(args, base_url, scenario, concurrency) / 2 ** 20
+                }
+                results.append(result)
+                print(f"{scenario:<10} {concurrency:>5} {result['throughput']:>9.1f} {result['p50_ms']:>8.1f} {result['p90_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['peak_mib']:>9.1f}")
+    finally:
+        process.terminate()
+        process.wait()
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump({"async": args.use_async, "latency": args.latency, "document_kb": args.document_kb, "results": results}, output, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Memory and time to turn a listing of signature requests into Python objects.
+
+Decodes a JSON listing and keeps the result as plain dicts (``typed=False``), as
+``SignatureRequestView`` objects (``typed=True``) and, for comparison, as pydantic
+models of the same response. Reports the memory retained by the result and the time
+to build it.
+
+Usage:
+    python benchmarks/bench_response_views.py [--requests 10000] [--signers 3]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pydantic import BaseModel
+from skribble.responses import SignatureRequestView
+
+class SignatureModel(BaseModel):
+    sid: str
+    account_email: Optional[str] = None
+    status_code: Optional[str] = None
+    notify: Optional[bool] = None
+    signed_at: Optional[str] = None
+
+class SignatureRequestModel(BaseModel):
+    id: str
+    title: str
+    message: Optional[str] = None
+    document_id: str
+    status_overall: Optional[str] = None
+    signatures: List[SignatureModel] = []
+    owner: str
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+def make_listing(requests, signers):
+    return json.dumps([
+        {
+            "id": f"sr-{i:08d}",
+            "title": f"Contract {i}",
+            "message": "Please sign",
+            "document_id": f"doc-{i:08d}",
+            "status_overall": "OPEN",
+            "signatures": [
+                {"sid": f"sig-{i}-{j}", "account_email": f"signer{j}@example.com", "status_code": "OPEN", "notify": True}
+                for j in range(signers)
+            ],
+            "owner": "api_benchmark",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z"
+        }
+        for i in range(requests)
+    ])
+
+def measure(build, listing):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build(listing)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return retained, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--signers", type=int, default=3)
+    args = parser.parse_args()
+    listing = make_listing(args.requests, args.signers)
+
+    builds = [
+        ("dicts", json.loads),
+        ("views", lambda listing: [SignatureRequestView(item) for item in json.loads(listing)]),
+        ("views, signers read", lambda listing: [view for view in (SignatureRequestView(item) for item in json.loads(listing)) if view.signatures is not None]),
+        ("pydantic models", lambda listing: [SignatureRequestModel(**item) for item in json.loads(listing)])
+    ]
+    print(f"{'result':<20} {'retained MB':>12} {'build ms':>9}")
+    for name, build in builds:
+        retained, elapsed = measure(build, listing)
+        print(f"{name:<20} {retained / 1e6:>12.1f} {elapsed * 1000:>9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Client-side cost per request of the interchangeable transports.
+
+Every transport sends the same calls (``signature_request.get`` and ``signature_request.list``)
+through one client. The network transports talk to a local mock API in a separate process
+over keep-alive connections. ``InMemoryTransport`` answers in-process from the same mock,
+and replayed recordings run at full CPU speed, so its numbers show the cost of the SDK
+itself without any socket I/O.
+
+Usage:
+    python benchmarks/bench_transports.py [--requests 2000] [--threads 1]
+"""
+import argparse
+import contextvars
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import skribble
+from skribble.client import SkribbleClient
+from skribble.config import ClientConfig
+from skribble.transport import RequestsTransport, Urllib3Transport, HTTPXTransport, InMemoryTransport
+from skribble.testing import MockSkribbleAPI
+
+def start_server():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.Popen([sys.executable, "-m", "skribble.testing", "--seed", "50"], stdout=subprocess.PIPE, text=True, env=env)
+    return process, process.stdout.readline().strip()
+
+def run(client, total_requests, threads):
+    with client, skribble.use_client(client):
+        signature_request_ids = [signature_request["id"] for signature_request in skribble.signature_request.list(page_size=50)]
+        calls = [
+            (lambda i: skribble.signature_request.get(signature_request_ids[i % len(signature_request_ids)])),
+            (lambda i: skribble.signature_request.list(page_size=10))
+        ]
+        started_cpu, started = time.process_time(), time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            # Executor threads do not inherit the context that carries the client
+            context = contextvars.copy_context()
+            list(executor.map(lambda i: context.copy().run(calls[i % 2], i), range(total_requests)))
+        return total_requests / (time.perf_counter() - started), (time.process_time() - started_cpu) / total_requests * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    config = ClientConfig(pool_maxsize=max(args.threads, 10))
+    api = MockSkribbleAPI()
+    api.seed(50)
+    process, base_url = start_server()
+    try:
+        print(f"{'transport':<20} {'req/s':>9} {'client CPU us/req':>18}")
+        for name, transport in [
+            ("RequestsTransport", RequestsTransport(config)),
+            ("Urllib3Transport", Urllib3Transport(config)),
+            ("HTTPXTransport", HTTPXTransport(config)),
+            ("InMemoryTransport", InMemoryTransport(api.handle))
+        ]:
+            client = SkribbleClient(username="api_user", api_key="mock-api-key", transport=transport)
+            if not isinstance(transport, InMemoryTransport):
+                client.BASE_URL = base_url
+            throughput, cpu = run(client, args.requests, args.threads)
+            print(f"{name:<20} {throughput:>9.0f} {cpu:>18.0f}")
+    finally:
+        process.terminate()
+        process.wait()
+
+if __name__ == "__main__":
+    main()
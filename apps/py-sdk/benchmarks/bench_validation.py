@@ -0,0 +1,54 @@
+"""
+Time spent validating a signature request payload before it is sent, by number of signers.
+
+Compares ``_validate_signature_request`` with the previous approach, which validated
+every signature on its own, dumped it to a dict and validated it again as part of the
+``SignatureRequest``.
+
+Usage:
+    python benchmarks/bench_validation.py [--signers 1,10,50,100,500] [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from skribble.models import SignatureRequest, Signature
+from skribble.signature_request.operations import _validate_signature_request
+
+def make_request(signers):
+    signatures = []
+    for i in range(signers):
+        if i % 2:
+            signatures.append({"account_email": f"signer{i}@example.com", "sequence": i % 999 + 1})
+        else:
+            signatures.append({"signer_identity_data": {"email_address": f"guest{i}@example.com", "first_name": "Guest", "last_name": str(i)}})
+    return {"title": "Benchmark", "message": "Please sign", "file_url": "https://example.com/contract.pdf", "signatures": signatures}
+
+def validate_twice(signature_request):
+    signatures = [Signature(**signature).model_dump(exclude_none=True) for signature in signature_request.get("signatures", [])]
+    return SignatureRequest(**{**signature_request, "signatures": signatures}).model_dump(exclude_none=True, by_alias=True)
+
+def best_of(function, payload, repeat):
+    number = max(1, repeat)
+    return min(timeit.repeat(lambda: function(payload), number=number, repeat=5)) / number
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signers", default="1,10,50,100,500")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'signers':>8} {'previous us':>12} {'current us':>11} {'speedup':>8}")
+    for signers in [int(value) for value in args.signers.split(",")]:
+        payload = make_request(signers)
+        assert validate_twice(payload) == _validate_signature_request(payload)
+        repeat = max(1, args.repeat // max(1, signers // 10))
+        previous = best_of(validate_twice, payload, repeat) * 1e6
+        current = best_of(_validate_signature_request, payload, repeat) * 1e6
+        print(f"{signers:>8} {previous:>12.1f} {current:>11.1f} {previous / current:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
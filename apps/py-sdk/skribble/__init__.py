@@ -1,25 +1,124 @@
-from .client import SkribbleClient
-from .models import SignatureRequest
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 from .exceptions import SkribbleAuthError, SkribbleAPIError, SkribbleValidationError, SkribbleOperationError
-from .client_manager import init, get_client
-from . import signature_request
-from . import attachment
-from . import document
-from . import seal
-from . import auth
+
+if TYPE_CHECKING:  # pragma: no cover - resolved eagerly for type checkers and IDEs only
+    from .client import SkribbleClient
+    from .models import SignatureRequest
+    from .client_manager import init, get_client, use_client
+    from .registry import ClientRegistry
+    from .retry import RetryPolicy
+    from .config import ClientConfig
+    from .concurrency import ItemResult, BatchResult
+    from .cache import ResponseCache, CacheStats
+    from .disk_cache import DiskCache
+    from .codec import JSONCodec, OrjsonCodec
+    from .hooks import RequestHooks, RequestInfo
+    from .transport import Transport, TransportError, RequestsTransport, Urllib3Transport, HTTPXTransport, InMemoryTransport
+    from .watcher import StatusWatcher, StatusChange
+    from .responses import SignatureRequestView, SignatureView, AttachmentView, DocumentView
+    from . import signature_request
+    from . import attachment
+    from . import document
+    from . import seal
+    from . import auth
+    from . import aio
+    from .aio import AsyncSkribbleClient
+    from .callbacks import CallbackReceiver, Callback
+
+# Public names and the module defining them. They are imported on first access (PEP 562),
+# so ``import skribble`` does not pay for requests, pydantic or httpx until they are used.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    'SkribbleClient': '.client',
+    'AsyncSkribbleClient': '.aio',
+    'SignatureRequest': '.models',
+    'RetryPolicy': '.retry',
+    'ClientConfig': '.config',
+    'ItemResult': '.concurrency',
+    'BatchResult': '.concurrency',
+    'ResponseCache': '.cache',
+    'CacheStats': '.cache',
+    'DiskCache': '.disk_cache',
+    'JSONCodec': '.codec',
+    'OrjsonCodec': '.codec',
+    'RequestHooks': '.hooks',
+    'RequestInfo': '.hooks',
+    'Transport': '.transport',
+    'TransportError': '.transport',
+    'RequestsTransport': '.transport',
+    'Urllib3Transport': '.transport',
+    'HTTPXTransport': '.transport',
+    'InMemoryTransport': '.transport',
+    'StatusWatcher': '.watcher',
+    'StatusChange': '.watcher',
+    'SignatureRequestView': '.responses',
+    'SignatureView': '.responses',
+    'AttachmentView': '.responses',
+    'DocumentView': '.responses',
+    'CallbackReceiver': '.callbacks',
+    'Callback': '.callbacks',
+    'init': '.client_manager',
+    'get_client': '.client_manager',
+    'use_client': '.client_manager',
+    'ClientRegistry': '.registry'
+}
+_LAZY_SUBMODULES = ('signature_request', 'attachment', 'document', 'seal', 'auth', 'aio')
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Later lookups find the attribute directly and no longer go through __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
 
 __all__ = [
     'SkribbleClient',
+    'AsyncSkribbleClient',
     'SignatureRequest',
+    'RetryPolicy',
+    'ClientConfig',
+    'ItemResult',
+    'BatchResult',
+    'ResponseCache',
+    'CacheStats',
+    'DiskCache',
+    'JSONCodec',
+    'OrjsonCodec',
+    'RequestHooks',
+    'RequestInfo',
+    'Transport',
+    'TransportError',
+    'RequestsTransport',
+    'Urllib3Transport',
+    'HTTPXTransport',
+    'InMemoryTransport',
+    'StatusWatcher',
+    'StatusChange',
+    'SignatureRequestView',
+    'SignatureView',
+    'AttachmentView',
+    'DocumentView',
+    'CallbackReceiver',
+    'Callback',
     'SkribbleAuthError',
     'SkribbleAPIError',
     'SkribbleValidationError',
     'SkribbleOperationError',
     'init',
     'get_client',
+    'use_client',
+    'ClientRegistry',
     'signature_request',
     'attachment',
     'document',
     'seal',
-    'auth'
-]
\ No newline at end of file
+    'auth',
+    'aio'
+]
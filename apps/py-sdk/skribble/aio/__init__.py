@@ -0,0 +1,60 @@
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover - resolved eagerly for type checkers and IDEs only
+    from .client import AsyncSkribbleClient
+    from .client_manager import init, get_client, use_client, close
+    from .registry import AsyncClientRegistry
+    from .watcher import AsyncStatusWatcher
+    from ..transport import AsyncTransport, HTTPXAsyncTransport, AsyncInMemoryTransport
+    from . import signature_request
+    from . import attachment
+    from . import document
+    from . import seal
+    from . import auth
+
+# Imported on first access, like the names of the ``skribble`` package
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    'AsyncSkribbleClient': '.client',
+    'AsyncClientRegistry': '.registry',
+    'AsyncStatusWatcher': '.watcher',
+    'AsyncTransport': '..transport',
+    'HTTPXAsyncTransport': '..transport',
+    'AsyncInMemoryTransport': '..transport',
+    'init': '.client_manager',
+    'get_client': '.client_manager',
+    'use_client': '.client_manager',
+    'close': '.client_manager'
+}
+_LAZY_SUBMODULES = ('signature_request', 'attachment', 'document', 'seal', 'auth')
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
+
+__all__ = [
+    'AsyncSkribbleClient',
+    'AsyncClientRegistry',
+    'AsyncStatusWatcher',
+    'AsyncTransport',
+    'HTTPXAsyncTransport',
+    'AsyncInMemoryTransport',
+    'init',
+    'get_client',
+    'use_client',
+    'close',
+    'signature_request',
+    'attachment',
+    'document',
+    'seal',
+    'auth'
+]
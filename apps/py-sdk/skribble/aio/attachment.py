@@ -0,0 +1,73 @@
+from typing import Dict, Any, AsyncIterable, AsyncIterator, Iterable, List, Union
+from .client_manager import get_client
+from ..streaming import DEFAULT_CHUNK_SIZE, Destination, async_write_chunks
+from ..concurrency import DEFAULT_CONCURRENCY, BatchResult, async_bounded_map
+from ..exceptions import SkribbleAPIError
+from ..responses import AttachmentView
+
+async def add(
+    signature_request_id: str,
+    attachments: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> BatchResult:
+    """
+    Add multiple attachments to a signature request.
+
+    Asynchronous version of :func:`skribble.attachment.add`.
+    """
+    client = get_client()
+    endpoint = f"/signature-requests/{signature_request_id}/attachments"
+    results = async_bounded_map(lambda attachment: client._make_request("POST", endpoint, data=attachment), attachments, concurrency)
+    return BatchResult("add_attachments", [result async for result in results])
+
+async def get(signature_request_id: str, attachment_id: str) -> bytes:
+    """
+    Download a specific attached file from a signature request.
+
+    Asynchronous version of :func:`skribble.attachment.get`.
+    """
+    response = await get_client()._request_raw("GET", f"/signature-requests/{signature_request_id}/attachments/{attachment_id}/content")
+    if response.status_code == 200:
+        return response.content
+    else:
+        raise SkribbleAPIError(f"Failed to get attachment: {response.text}")
+
+async def iter_download(signature_request_id: str, attachment_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Stream an attached file in chunks instead of loading it into memory.
+
+    Asynchronous version of :func:`skribble.attachment.iter_download`.
+    """
+    endpoint = f"/signature-requests/{signature_request_id}/attachments/{attachment_id}/content"
+    async with get_client()._stream("GET", endpoint, "Failed to get attachment") as response:
+        async for chunk in response.aiter_bytes(chunk_size):
+            yield chunk
+
+async def download_to(signature_request_id: str, attachment_id: str, destination: Destination, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream an attached file straight into a file path or binary file object.
+
+    Asynchronous version of :func:`skribble.attachment.download_to`.
+    """
+    return await async_write_chunks(iter_download(signature_request_id, attachment_id, chunk_size), destination)
+
+async def delete(signature_request_id: str, attachment_id: str) -> None:
+    """
+    Remove an attachment from a signature request.
+
+    Asynchronous version of :func:`skribble.attachment.delete`.
+    """
+    response = await get_client()._request_raw("DELETE", f"/signature-requests/{signature_request_id}/attachments/{attachment_id}")
+    if response.status_code not in [204, 200]:
+        raise SkribbleAPIError(f"Failed to delete attachment: {response.text}")
+
+async def list(signature_request_id: str, typed: bool = False) -> Union[List[Dict[str, str]], List[AttachmentView]]:
+    """
+    List all attachments for a signature request.
+
+    Asynchronous version of :func:`skribble.attachment.list`.
+    """
+    response = await get_client()._make_request("GET", f"/signature-requests/{signature_request_id}", cached=True)
+
+    attachments = response.get('attachments') or []
+    return [AttachmentView(attachment) for attachment in attachments] if typed else attachments
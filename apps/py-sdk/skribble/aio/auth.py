@@ -0,0 +1,14 @@
+from .client_manager import get_client
+from ..exceptions import SkribbleAuthError
+
+async def login() -> str:
+    """
+    Authenticate with the Skribble API and return the access token.
+
+    Asynchronous version of :func:`skribble.auth.login`.
+    """
+    try:
+        client = get_client()
+        return await client._authenticate()
+    except Exception as e:
+        raise SkribbleAuthError(f"Authentication failed: {str(e)}")
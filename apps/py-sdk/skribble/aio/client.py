@@ -0,0 +1,288 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator, List, Sequence
+from ..client import SkribbleClient, _http_error_message, _raise_for_status_code
+from ..exceptions import SkribbleAuthError, SkribbleAPIError
+from ..streaming import StreamingJSONBody, async_body
+from ..token_manager import AsyncTokenManager, DEFAULT_REFRESH_MARGIN
+from ..retry import RetryPolicy
+from ..config import ClientConfig
+from ..cache import ResponseCache
+from ..disk_cache import DiskCache
+from ..codec import JSONCodec, default_codec
+from ..hooks import RequestHooks, observe
+from ..compression import compress_request, is_replayable, rejects_compression
+from ..transport import AsyncTransport, TransportError, HTTPXAsyncTransport
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    httpx = None
+
+# Errors raised while a streamed body is read
+_STREAM_ERRORS = (TransportError, httpx.HTTPError) if httpx is not None else (TransportError,)
+
+class AsyncSkribbleClient:
+    BASE_URL: str = SkribbleClient.BASE_URL
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        retry_policy: Optional[RetryPolicy] = None,
+        config: Optional[ClientConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        json_codec: Optional[JSONCodec] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        transport: Optional[AsyncTransport] = None
+    ):
+        """
+        Initialize the asynchronous Skribble client.
+
+        All requests made through one client share a single pooled ``httpx.AsyncClient``
+        (unless another ``transport`` is given), so many concurrent calls on the same event loop reuse a bounded set of connections.
+        Tokens are refreshed ahead of expiry and on 401, and transient failures are retried,
+        exactly like :class:`~skribble.client.SkribbleClient`.
+
+        Args:
+            username (str, optional): The API username.
+            api_key (str, optional): The API key.
+            access_token (str, optional): A pre-authenticated access token.
+            refresh_margin (float): Seconds before expiry at which the access token is refreshed.
+            retry_policy (RetryPolicy, optional): Retry behaviour for transient failures. Defaults to ``RetryPolicy()``.
+            config (ClientConfig, optional): Connection pool, timeout and compression settings. Defaults to ``ClientConfig()``.
+            cache (ResponseCache, optional): Cache for read operations. Disabled by default.
+            disk_cache (DiskCache, optional): Persistent cache for document downloads and previews. Disabled by default.
+            json_codec (JSONCodec, optional): Encoder and decoder for JSON bodies. Defaults to orjson if installed,
+                otherwise the standard library.
+            hooks (Sequence[RequestHooks], optional): Receive timing, size and retry events for every request.
+            transport (AsyncTransport, optional): Sends the HTTP requests. Defaults to an ``HTTPXAsyncTransport``
+                built from ``config``.
+
+        Raises:
+            ImportError: If no ``transport`` is given and the optional ``httpx`` dependency is not installed.
+        """
+        self.username: Optional[str] = username
+        self.api_key: Optional[str] = api_key
+        self.config: ClientConfig = config if config is not None else ClientConfig()
+        self.transport: AsyncTransport = transport if transport is not None else HTTPXAsyncTransport(self.config)
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.cache: Optional[ResponseCache] = cache
+        self.disk_cache: Optional[DiskCache] = disk_cache
+        self.json_codec: JSONCodec = json_codec if json_codec is not None else default_codec()
+        self.hooks: List[RequestHooks] = list(hooks or [])
+        self._compress_requests: bool = self.config.compress_requests
+        self.token_manager: AsyncTokenManager = AsyncTokenManager(
+            login=self._login if username and api_key else None,
+            access_token=access_token,
+            refresh_margin=refresh_margin
+        )
+
+    @property
+    def session(self) -> Any:
+        """
+        The session of the transport, e.g. the ``httpx.AsyncClient`` of the default
+        :class:`~skribble.transport.HTTPXAsyncTransport`, or ``None`` if it has none.
+        """
+        return getattr(self.transport, "session", None)
+
+    @session.setter
+    def session(self, session: Any) -> None:
+        self.transport.session = session
+
+    @property
+    def access_token(self) -> Optional[str]:
+        return self.token_manager.token
+
+    @access_token.setter
+    def access_token(self, access_token: Optional[str]) -> None:
+        self.token_manager.set_token(access_token)
+
+    async def __aenter__(self) -> "AsyncSkribbleClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying connection pool.
+        """
+        await self.transport.aclose()
+
+    async def _authenticate(self) -> str:
+        return await self.token_manager.get_token()
+
+    async def _login(self) -> str:
+        # Imported here so constructing a client does not load pydantic
+        from ..models import AuthRequest
+        auth_data = AuthRequest(username=self.username, **{"api-key": self.api_key})
+        body = self.json_codec.dumps(auth_data.model_dump(by_alias=True))
+        observer = observe(self.hooks, "POST", "/access/login", body)
+        observer.start(0)
+        try:
+            response = await self.transport.send("POST", f"{self.BASE_URL}/access/login", headers={"Content-Type": "application/json"}, data=body)
+        except TransportError as req_err:
+            observer.error(req_err)
+            raise SkribbleAPIError(f"Request failed: {str(req_err)}")
+        observer.response(response)
+
+        if response.status_code == 200:
+            return response.text.strip()
+        elif response.status_code in [401, 403]:
+            raise SkribbleAuthError("Invalid credentials")
+        else:
+            raise SkribbleAPIError(response.text, status_code=response.status_code)
+
+    async def _send(self, method: str, endpoint: str, headers: Optional[Dict[str, str]] = None, idempotent: Optional[bool] = None, stream: bool = False, payload: Optional[Dict[str, Any]] = None, **kwargs) -> "httpx.Response":
+        """
+        Send an authenticated request, logging in again and replaying it once on a 401
+        if its body can be sent again.
+
+        With ``stream=True`` the body is not read and the caller must close the response.
+        ``payload`` is the decoded JSON body, used to invalidate cached responses.
+        """
+        token = await self._authenticate()
+        response = await self._send_with_retries(token, method, endpoint, headers, idempotent, stream, **kwargs)
+
+        if response.status_code == 401 and self.token_manager.can_refresh:
+            token = await self.token_manager.refresh(stale_token=token)
+            # A body read from a pipe is gone; the caller gets the 401 instead of an empty upload
+            if is_replayable(kwargs.get("data")):
+                await response.aclose()
+                response = await self._send_with_retries(token, method, endpoint, headers, idempotent, stream, **kwargs)
+
+        if self.cache is not None and method.upper() != "GET":
+            # A write through this client makes the cached reads of the resource stale
+            self.cache.invalidate(endpoint, payload)
+        return response
+
+    async def _send_with_retries(self, token: str, method: str, endpoint: str, headers: Optional[Dict[str, str]], idempotent: Optional[bool], stream: bool, **kwargs) -> "httpx.Response":
+        """
+        Send a request, retrying transient failures as allowed by the retry policy.
+
+        Asynchronous version of :meth:`skribble.client.SkribbleClient._send_with_retries`.
+        """
+        policy = self.retry_policy
+        body = kwargs.get("data")
+        can_retry = policy.allows(method, idempotent) and is_replayable(body)
+        started = policy.start()
+        attempt = 0
+        request_headers = {**(headers or {}), "Authorization": f"Bearer {token}"}
+        observer = observe(self.hooks, method, endpoint, body)
+
+        while True:
+            observer.start(attempt)
+            try:
+                response = await self.transport.send(method, f"{self.BASE_URL}{endpoint}", headers=request_headers, stream=stream, **kwargs)
+            except TransportError as req_err:
+                observer.error(req_err)
+                delay = policy.next_delay(attempt, started) if can_retry and req_err.retryable else None
+                if delay is None:
+                    raise SkribbleAPIError(f"Request failed: {str(req_err)}")
+            else:
+                observer.response(response, stream)
+                if not (can_retry and policy.is_retryable_status(response.status_code)):
+                    return response
+                delay = policy.next_delay(attempt, started, response.headers)
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            observer.retry(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None, body: Optional[StreamingJSONBody] = None, idempotent: Optional[bool] = None, cached: bool = False) -> Any:
+        if cached and self.cache is not None:
+            return await self._make_cached_request(method, endpoint, params)
+
+        headers = {}
+        content = body
+        if body is not None:
+            # Pre-encoded JSON that is streamed instead of serialized from ``data``
+            headers["Content-Type"] = "application/json"
+            if body.content_length is not None:
+                headers["Content-Length"] = str(body.content_length)
+        elif data is not None:
+            content = self.json_codec.dumps(data)
+            headers["Content-Type"] = "application/json"
+
+        response = await self._send_body(method, endpoint, headers, content, idempotent=idempotent, payload=data, params=params)
+
+        if response.status_code >= 200 and response.status_code < 300:
+            return self.json_codec.loads(response.content) if response.content else None
+
+        error_message = _http_error_message(response.status_code, f"{self.BASE_URL}{endpoint}")
+        try:
+            error_detail = self.json_codec.loads(response.content)
+            error_message += f"Error details: {error_detail}"
+        except ValueError:
+            error_message += f"Response text: {response.text}"
+
+        _raise_for_status_code(response.status_code, error_message)
+
+    async def _send_body(self, method: str, endpoint: str, headers: Dict[str, str], content: Any, **kwargs) -> Any:
+        """
+        Send a request with a JSON body, gzip-compressed if ``config.compress_requests`` is set.
+
+        Once the API rejects a compressed body, it is resent uncompressed and compression stays
+        off for the rest of the client's lifetime.
+        """
+        compressed = compress_request(headers, content, self.config.compress_min_size) if self._compress_requests else None
+        if compressed is None:
+            return await self._send(method, endpoint, headers=headers, data=async_body(content), **kwargs)
+
+        response = await self._send(method, endpoint, headers=compressed[0], data=async_body(compressed[1]), **kwargs)
+        if not rejects_compression(response):
+            return response
+        self._compress_requests = False
+        if not is_replayable(content):
+            # A body read from a pipe cannot be sent again; the caller gets the 415
+            return response
+        await response.aclose()
+        return await self._send(method, endpoint, headers=headers, data=async_body(content), **kwargs)
+
+    async def _make_cached_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> Any:
+        """
+        Serve a read from the response cache, fetching and storing it on a miss.
+        """
+        key = self.cache.key(endpoint, params)
+        found, value, generation = self.cache.lookup(key)
+        if found:
+            return value
+        value = await self._make_request(method, endpoint, params=params)
+        self.cache.store(key, value, generation)
+        return value
+
+    async def _request_raw(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> "httpx.Response":
+        """
+        Send an authenticated request and return the undecoded response.
+
+        Used for the binary endpoints (document content, page previews, attachments).
+        """
+        return await self._send(method, endpoint, headers=headers, params=params)
+
+    @asynccontextmanager
+    async def _stream(self, method: str, endpoint: str, error_message: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> AsyncIterator["httpx.Response"]:
+        """
+        Open a streamed request for a binary endpoint whose body has not been read yet.
+
+        A 304 Not Modified answer to a conditional request is passed through as well.
+
+        Raises:
+            SkribbleAPIError: If the API does not answer with 200.
+        """
+        response = await self._send(method, endpoint, headers=headers, params=params, stream=True)
+        try:
+            if response.status_code != 200 and not (response.status_code == 304 and headers):
+                await response.aread()
+                raise SkribbleAPIError(f"{error_message}: {response.text}", status_code=response.status_code)
+            yield response
+        except _STREAM_ERRORS as req_err:
+            raise SkribbleAPIError(f"Request failed: {str(req_err)}")
+        finally:
+            await response.aclose()
@@ -0,0 +1,86 @@
+from .client import AsyncSkribbleClient
+from ..exceptions import SkribbleAuthError, SkribbleValidationError, SkribbleAPIError
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_client = None
+
+# Client bound to the current asyncio task by use_client(); takes precedence over _client
+_scoped_client: ContextVar[Optional[AsyncSkribbleClient]] = ContextVar("skribble_async_client", default=None)
+
+async def init(username: Optional[str] = None, api_key: Optional[str] = None, access_token: Optional[str] = None, **client_options) -> str:
+    """
+    Initialize the asynchronous Skribble SDK client and return the access token.
+
+    Works like :func:`skribble.init`, but the resulting client is used by the
+    awaitable operations in ``skribble.aio``.
+
+    Args:
+        username (str, optional): The API username.
+        api_key (str, optional): The API key.
+        access_token (str, optional): A pre-authenticated access token.
+        **client_options: Extra keyword arguments passed to :class:`AsyncSkribbleClient`,
+            e.g. ``config`` or ``retry_policy``.
+
+    Returns:
+        str: The access token.
+
+    Raises:
+        SkribbleValidationError: If neither (username, api_key) pair nor access_token is provided.
+
+    Examples:
+        token = await skribble.aio.init(username="your_username", api_key="your_api_key")
+        result = await skribble.aio.signature_request.get("5c33d0cb-84...")
+    """
+    global _client
+    try:
+        if access_token:
+            _client = AsyncSkribbleClient(access_token=access_token, **client_options)
+            try:
+                # Perform a test request to verify the token
+                await _client._make_request("GET", "/signature-requests", params={"page_size": 1})
+                return access_token
+            except SkribbleAPIError as api_err:
+                if api_err.status_code == 500:
+                    raise SkribbleAuthError("Unable to validate access token. It may be expired or invalid.")
+                raise
+        elif username and api_key:
+            _client = AsyncSkribbleClient(username=username, api_key=api_key, **client_options)
+            return await _client._authenticate()
+        else:
+            raise SkribbleValidationError("Either (username, api_key) or access_token must be provided")
+    except SkribbleAuthError as auth_err:
+        raise SkribbleAuthError(f"{str(auth_err)}")
+    except SkribbleAPIError as api_err:
+        raise SkribbleAPIError(f"API error during initialization: {str(api_err)}", status_code=api_err.status_code)
+
+@contextmanager
+def use_client(client: AsyncSkribbleClient) -> Iterator[AsyncSkribbleClient]:
+    """
+    Asynchronous version of :func:`skribble.use_client`.
+
+    The binding is visible to the current task and to tasks created inside the block.
+    """
+    token = _scoped_client.set(client)
+    try:
+        yield client
+    finally:
+        _scoped_client.reset(token)
+
+def get_client() -> AsyncSkribbleClient:
+    client = _scoped_client.get()
+    if client is not None:
+        return client
+    if _client is None:
+        raise SkribbleValidationError("Skribble SDK not initialized. Call skribble.aio.init(...) first.")
+    return _client
+
+async def close() -> None:
+    """
+    Close the connection pool of the asynchronous client, if one was initialized.
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,178 @@
+import asyncio
+import functools
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional, Union
+from .client_manager import get_client
+from ..streaming import DEFAULT_CHUNK_SIZE, Destination, async_cached_download, async_write_chunks, iter_file, extract_content_source, request_payload
+from ..cache import ResponseCache
+from ..disk_cache import CachedFile
+from ..concurrency import DEFAULT_CONCURRENCY, ItemResult, async_bounded_map
+from ..document.operations import _poll_delay, _preview_content
+from ..retry import RetryPolicy
+from ..exceptions import SkribbleAPIError, SkribbleValidationError, SkribbleOperationError
+from ..models import Document, DocumentRequest
+from ..responses import DocumentView
+
+async def list(limit: Optional[int] = None, typed: bool = False) -> Union[List[Dict[str, Any]], List[DocumentView]]:
+    """
+    List all documents.
+
+    Asynchronous version of :func:`skribble.document.list`.
+    """
+    response = await get_client()._make_request("GET", "/documents")
+
+    if limit is not None:
+        response = response[:limit]
+    return [DocumentView(item) for item in response] if typed else response
+
+async def get(document_id: str, typed: bool = False) -> Union[Dict[str, Any], DocumentView]:
+    """
+    Get the document metadata.
+
+    Asynchronous version of :func:`skribble.document.get`.
+    """
+    response = await get_client()._make_request("GET", f"/documents/{document_id}", cached=True)
+    if typed:
+        return DocumentView(response)
+    return Document(**response).model_dump()
+
+async def delete(document_id: str) -> Dict[str, Any]:
+    """
+    Delete a document.
+
+    Asynchronous version of :func:`skribble.document.delete`.
+    """
+    try:
+        await get_client()._make_request("DELETE", f"/documents/{document_id}")
+        return {"status": "success", "message": f"Document {document_id} deleted successfully"}
+    except SkribbleAPIError as e:
+        return {"status": "error", "message": f"Failed to delete document: {str(e)}"}
+
+async def add(document_data: Dict[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Add a new document.
+
+    Asynchronous version of :func:`skribble.document.add`.
+    """
+    document_data, content_source = extract_content_source(document_data)
+    validated_request = DocumentRequest(**document_data)
+    client = get_client()
+    return await client._make_request("POST", "/documents", **request_payload(validated_request.model_dump(exclude_none=True), content_source, chunk_size, dumps=client.json_codec.dumps))
+
+async def download(document_id: str) -> bytes:
+    """
+    Download the document content.
+
+    Asynchronous version of :func:`skribble.document.download`.
+    """
+    client = get_client()
+    if client.disk_cache is not None:
+        return await async_cached_download(client, f"/documents/{document_id}/content", "Failed to download document", CachedFile.read)
+
+    response = await client._request_raw("GET", f"/documents/{document_id}/content")
+    if response.status_code == 200:
+        return response.content
+    else:
+        raise SkribbleAPIError(f"Failed to download document: {response.text}")
+
+async def iter_download(document_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Stream the document content in chunks instead of loading it into memory.
+
+    Asynchronous version of :func:`skribble.document.iter_download`.
+
+    Example:
+        >>> async for chunk in skribble.aio.document.iter_download("5c33d0cb-84..."):
+        ...     archive.write(chunk)
+    """
+    client = get_client()
+    if client.disk_cache is not None:
+        file = await async_cached_download(client, f"/documents/{document_id}/content", "Failed to download document", CachedFile.open)
+        for chunk in iter_file(file, chunk_size):
+            yield chunk
+        return
+
+    async with client._stream("GET", f"/documents/{document_id}/content", "Failed to download document") as response:
+        async for chunk in response.aiter_bytes(chunk_size):
+            yield chunk
+
+async def download_to(document_id: str, destination: Destination, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream the document content straight into a file path or binary file object.
+
+    Asynchronous version of :func:`skribble.document.download_to`.
+    """
+    return await async_write_chunks(iter_download(document_id, chunk_size), destination)
+
+async def download_mapped(document_id: str) -> memoryview:
+    """
+    Return the document content as a read-only memory-mapped view of the disk cache.
+
+    Asynchronous version of :func:`skribble.document.download_mapped`.
+    """
+    client = get_client()
+    if client.disk_cache is None:
+        raise SkribbleValidationError("download_mapped requires a disk cache. Pass disk_cache=DiskCache(...) to skribble.aio.init().")
+    return await async_cached_download(client, f"/documents/{document_id}/content", "Failed to download document", CachedFile.map)
+
+async def preview(document_id: str, page_id: int, scale: int = 20, max_retries: int = 5, retry_delay: int = 2) -> bytes:
+    """
+    Get the document page preview, polling while the preview is still being generated.
+
+    Asynchronous version of :func:`skribble.document.preview`. Waiting between polls
+    does not block the event loop.
+    """
+    return await _fetch_preview(get_client(), document_id, page_id, scale, max_retries, lambda attempt, response: retry_delay)
+
+def preview_all(
+    document_id: str,
+    scale: int = 20,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = 10,
+    initial_delay: float = 0.25,
+    max_delay: float = 8.0
+) -> AsyncIterator[ItemResult]:
+    """
+    Get the previews of all pages of a document, fetching up to ``concurrency`` pages at a time.
+
+    Asynchronous version of :func:`skribble.document.preview_all`.
+
+    Example:
+        >>> async for page in skribble.aio.document.preview_all("5c33d0cb-84..."):
+        ...     thumbnails[page.index] = page.result
+    """
+    async def page_ids() -> AsyncIterator[int]:
+        page_count = (await get(document_id)).get("page_count")
+        if page_count is None:
+            raise SkribbleOperationError("preview_all", f"The page count of document {document_id} is not known yet")
+        for page_id in range(page_count):
+            yield page_id
+
+    client = get_client()
+    poll_delay = functools.partial(_poll_delay, RetryPolicy(backoff_factor=initial_delay, max_backoff=max_delay))
+    return async_bounded_map(lambda page_id: _fetch_preview(client, document_id, page_id, scale, max_retries, poll_delay), page_ids(), concurrency, ordered=False)
+
+async def _fetch_preview(client: Any, document_id: str, page_id: int, scale: int, max_retries: int, poll_delay: Callable[[int, Any], float]) -> bytes:
+    cache_key = ResponseCache.key(f"/documents/{document_id}/pages/{page_id}", {"scale": scale})
+    if client.disk_cache is not None:
+        cached = client.disk_cache.get(cache_key)
+        if cached is not None:
+            try:
+                return cached.read()
+            except FileNotFoundError:
+                # Evicted by another process sharing the cache since the lookup
+                pass
+
+    for attempt in range(max_retries):
+        response = await client._request_raw("GET", f"/documents/{document_id}/pages/{page_id}", params={"scale": scale})
+
+        if response.status_code == 200:
+            return _preview_content(client, cache_key, response)
+        elif response.status_code == 202:
+            # The preview image is still being generated; poll again without blocking the event loop
+            if attempt + 1 < max_retries:
+                await asyncio.sleep(poll_delay(attempt, response))
+        else:
+            error_message = response.text if response.text else "No error message provided"
+            raise SkribbleAPIError(f"Failed to get document preview. Status code: {response.status_code}. Error: {error_message}")
+
+    raise SkribbleAPIError(f"Failed to get document preview after {max_retries} attempts")
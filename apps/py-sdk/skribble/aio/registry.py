@@ -0,0 +1,39 @@
+from .client import AsyncSkribbleClient
+from .client_manager import use_client
+from ..registry import _BaseClientRegistry
+
+class AsyncClientRegistry(_BaseClientRegistry):
+    """
+    Asynchronous version of :class:`skribble.ClientRegistry`.
+
+    Example:
+        >>> tenants = skribble.aio.AsyncClientRegistry()
+        >>> tenants.register("acme", username="api_acme", api_key="...")
+        >>> async def sync_tenant(tenant):
+        ...     with tenants.use(tenant):
+        ...         return await skribble.aio.signature_request.list()
+        >>> await asyncio.gather(*[sync_tenant(tenant) for tenant in tenants])
+    """
+
+    _client_class = AsyncSkribbleClient
+    _use_client = staticmethod(use_client)
+
+    async def remove(self, tenant: str) -> None:
+        """
+        Remove ``tenant`` and close its connection pool.
+        """
+        for client in self._pop(tenant):
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Remove all tenants and close their connection pools.
+        """
+        for client in self._pop():
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncClientRegistry":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
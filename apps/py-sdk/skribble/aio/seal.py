@@ -0,0 +1,45 @@
+from typing import Dict, Any, Optional, Union
+from .client_manager import get_client
+from ..exceptions import SkribbleValidationError, SkribbleAPIError
+from ..models import Seal
+from ..streaming import DEFAULT_CHUNK_SIZE, ContentSource, extract_content_source, request_payload
+
+async def create(seal_data: Dict[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Create a seal for a document.
+
+    Asynchronous version of :func:`skribble.seal.create`.
+    """
+    seal_data, content_source = extract_content_source(seal_data)
+    try:
+        validated_seal = Seal(**seal_data)
+    except ValueError as e:
+        raise SkribbleValidationError("Invalid seal data", str(e))
+
+    try:
+        client = get_client()
+        return await client._make_request("POST", "/seal", **request_payload(validated_seal.model_dump(exclude_none=True), content_source, chunk_size, dumps=client.json_codec.dumps))
+    except SkribbleAPIError as e:
+        raise SkribbleAPIError(f"Failed to create seal: {str(e)}")
+
+async def create_specific(content: Union[str, ContentSource], account_name: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Create a seal for a document with a specific seal.
+
+    Asynchronous version of :func:`skribble.seal.create_specific`.
+    """
+    seal_data = {
+        "content": content,
+        "account_name": account_name
+    }
+    seal_data, content_source = extract_content_source(seal_data)
+    try:
+        validated_seal = Seal(**seal_data)
+    except ValueError as e:
+        raise SkribbleValidationError("Invalid seal data", str(e))
+
+    try:
+        client = get_client()
+        return await client._make_request("POST", "/seal", **request_payload(validated_seal.model_dump(exclude_none=True), content_source, chunk_size, dumps=client.json_codec.dumps))
+    except SkribbleAPIError as e:
+        raise SkribbleAPIError(f"Failed to create specific seal: {str(e)}")
@@ -0,0 +1,279 @@
+from typing import Dict, Any, AsyncIterable, AsyncIterator, Iterable, List, Optional, Union
+from .client_manager import get_client
+from . import attachment as _attachment
+from ..streaming import DEFAULT_CHUNK_SIZE, Destination, extract_content_source, request_payload
+from ..signature_request.operations import (
+    _ALREADY_SIGNED,
+    _CANNOT_REPLACE_SIGNED,
+    _validate_signature_request,
+    _ensure_not_signed,
+    _list_params,
+    _merge_signers,
+    _operation_error
+)
+from ..concurrency import DEFAULT_CONCURRENCY, ItemResult, async_bounded_map
+from ..responses import SignatureRequestView
+from ..exceptions import SkribbleValidationError, SkribbleAPIError, SkribbleOperationError
+
+async def create(signature_request: Dict[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Create a new signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.create`.
+
+    Example:
+        >>> result = await skribble.aio.signature_request.create(request_data)
+        >>> print(result['id'])
+        '5c33d0cb-84...'
+    """
+    signature_request, content_source = extract_content_source(signature_request)
+    validated_request = _validate_signature_request(signature_request)
+    client = get_client()
+    return await client._make_request("POST", "/signature-requests", **request_payload(validated_request, content_source, chunk_size, dumps=client.json_codec.dumps))
+
+def create_many(
+    signature_requests: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[ItemResult]:
+    """
+    Create many signature requests, up to ``concurrency`` at a time.
+
+    Asynchronous version of :func:`skribble.signature_request.create_many`;
+    ``signature_requests`` may also be an asynchronous iterable.
+
+    Example:
+        >>> async for outcome in skribble.aio.signature_request.create_many(contracts(), concurrency=16):
+        ...     print(outcome.index, outcome.ok)
+    """
+    return async_bounded_map(lambda signature_request: create(signature_request, chunk_size), signature_requests, concurrency, ordered)
+
+async def get(signature_request_id: str, typed: bool = False) -> Union[Dict[str, Any], SignatureRequestView]:
+    """
+    Get details of a specific signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.get`.
+    """
+    response = await get_client()._make_request("GET", f"/signature-requests/{signature_request_id}", cached=True)
+    return SignatureRequestView(response) if typed else response
+
+async def delete(signature_request_id: str) -> Dict[str, Any]:
+    """
+    Delete a specific signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.delete`.
+    """
+    try:
+        await get_client()._make_request("DELETE", f"/signature-requests/{signature_request_id}")
+        return {"status": "success", "message": f"Signature request {signature_request_id} deleted successfully"}
+    except SkribbleAPIError as e:
+        return {"status": "error", "message": f"Failed to delete signature request: {str(e)}"}
+
+async def list(
+    account_email: Optional[str] = None,
+    search: Optional[str] = None,
+    signature_status: Optional[str] = None,
+    status_overall: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = 50,
+    typed: bool = False
+) -> Union[List[Dict[str, Any]], List[SignatureRequestView]]:
+    """
+    List signature requests with optional filtering and pagination.
+
+    Asynchronous version of :func:`skribble.signature_request.list`.
+    """
+    params = _list_params(account_email, search, signature_status, status_overall, page_number, page_size)
+    response = await get_client()._make_request("GET", "/signature-requests", params=params) or []
+    return [SignatureRequestView(item) for item in response] if typed else response
+
+def iter_all(
+    account_email: Optional[str] = None,
+    search: Optional[str] = None,
+    signature_status: Optional[str] = None,
+    status_overall: Optional[str] = None,
+    page_size: int = 50,
+    typed: bool = False
+) -> Union[AsyncIterator[Dict[str, Any]], AsyncIterator[SignatureRequestView]]:
+    """
+    Iterate over all signature requests matching the filters, fetching one page at a time.
+
+    Asynchronous version of :func:`skribble.signature_request.iter_all`.
+
+    Example:
+        >>> async for request in skribble.aio.signature_request.iter_all(status_overall="OPEN"):
+        ...     print(request['id'])
+    """
+    if page_size <= 0:
+        raise SkribbleValidationError("'page_size' must be greater than 0")
+    return _iter_all(account_email, search, signature_status, status_overall, page_size, typed)
+
+async def _iter_all(
+    account_email: Optional[str],
+    search: Optional[str],
+    signature_status: Optional[str],
+    status_overall: Optional[str],
+    page_size: int,
+    typed: bool
+) -> Union[AsyncIterator[Dict[str, Any]], AsyncIterator[SignatureRequestView]]:
+    page_number = 0
+    while True:
+        page = await list(account_email, search, signature_status, status_overall, page_number, page_size, typed)
+        for item in page:
+            yield item
+        if len(page) < page_size:
+            return
+        page_number += 1
+
+async def update(signature_request_id: str, updated_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Update a signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.update`.
+    """
+    updated_data["id"] = signature_request_id
+    return await get_client()._make_request("PUT", "/signature-requests", data=updated_data)
+
+async def add_signer(signature_request_id: str, signer_data: Dict[str, Any], signature_request: Optional[Dict[str, Any]] = None, check_signed: bool = True) -> Dict[str, Any]:
+    """
+    Add a signer to a signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.add_signer`.
+    """
+    try:
+        client = get_client()
+        await _check_not_signed(client, signature_request_id, signature_request, check_signed, "add_signer", _ALREADY_SIGNED)
+
+        return await client._make_request("POST", f"/signature-requests/{signature_request_id}/signatures", data=signer_data)
+    except SkribbleOperationError:
+        raise
+    except SkribbleAPIError as e:
+        raise _operation_error("add_signer", e, _ALREADY_SIGNED)
+    except Exception as e:
+        raise SkribbleOperationError("add_signer", f"Unexpected error: {str(e)}", e)
+
+async def remove_signer(signature_request_id: str, signer_id: str, signature_request: Optional[Dict[str, Any]] = None, check_signed: bool = True) -> Dict[str, Any]:
+    """
+    Remove a signer from a signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.remove_signer`.
+    """
+    try:
+        client = get_client()
+        await _check_not_signed(client, signature_request_id, signature_request, check_signed, "remove_signer", _ALREADY_SIGNED)
+
+        await client._make_request("DELETE", f"/signature-requests/{signature_request_id}/signatures/{signer_id}")
+
+        return {"status": "success", "message": f"Signer with ID {signer_id} removed successfully"}
+    except SkribbleOperationError:
+        raise
+    except SkribbleAPIError as e:
+        raise _operation_error("remove_signer", e, _ALREADY_SIGNED)
+    except Exception as e:
+        raise SkribbleOperationError("remove_signer", f"Unexpected error: {str(e)}", e)
+
+async def replace_signers(signature_request_id: str, signatures: List[Dict[str, Any]], signature_request: Optional[Dict[str, Any]] = None, check_signed: bool = True) -> Dict[str, Any]:
+    """
+    Replace all signers in a signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.replace_signers`.
+    """
+    try:
+        client = get_client()
+        await _check_not_signed(client, signature_request_id, signature_request, check_signed, "replace_signers", _CANNOT_REPLACE_SIGNED)
+
+        update_data = {
+            "id": signature_request_id,
+            "signatures": signatures
+        }
+
+        return await client._make_request("PUT", "/signature-requests", data=update_data)
+    except SkribbleOperationError:
+        raise
+    except SkribbleAPIError as e:
+        raise _operation_error("replace_signers", e, _CANNOT_REPLACE_SIGNED)
+    except Exception as e:
+        raise SkribbleOperationError("replace_signers", f"Unexpected error: {str(e)}", e)
+
+async def update_signers(
+    signature_request_id: str,
+    add: Optional[List[Dict[str, Any]]] = None,
+    remove: Optional[List[str]] = None,
+    signature_request: Optional[Dict[str, Any]] = None,
+    check_signed: bool = True
+) -> Dict[str, Any]:
+    """
+    Add and remove several signers in a single update.
+
+    Asynchronous version of :func:`skribble.signature_request.update_signers`.
+    """
+    try:
+        client = get_client()
+        if signature_request is None:
+            signature_request = await client._make_request("GET", f"/signature-requests/{signature_request_id}")
+        if check_signed:
+            _ensure_not_signed(signature_request, "update_signers", _ALREADY_SIGNED)
+
+        update_data = {
+            "id": signature_request_id,
+            "signatures": _merge_signers(signature_request.get('signatures', []), add or [], remove or [])
+        }
+        return await client._make_request("PUT", "/signature-requests", data=update_data)
+    except SkribbleOperationError:
+        raise
+    except SkribbleAPIError as e:
+        raise _operation_error("update_signers", e, _ALREADY_SIGNED)
+    except Exception as e:
+        raise SkribbleOperationError("update_signers", f"Unexpected error: {str(e)}", e)
+
+async def _check_not_signed(client: Any, signature_request_id: str, signature_request: Optional[Dict[str, Any]], check_signed: bool, operation: str, message: str) -> None:
+    if not check_signed:
+        return
+    if signature_request is None:
+        signature_request = await client._make_request("GET", f"/signature-requests/{signature_request_id}")
+    _ensure_not_signed(signature_request, operation, message)
+
+async def remind(signature_request_id: str) -> None:
+    """
+    Send a reminder to open signers of a signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.remind`.
+    """
+    await get_client()._make_request("POST", f"/signature-requests/{signature_request_id}/remind")
+
+async def withdraw(signature_request_id: str, message: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Withdraw a signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.withdraw`.
+    """
+    data = {"message": message} if message else None
+    response = await get_client()._make_request("POST", f"/signature-requests/{signature_request_id}/withdraw", data=data)
+    if response is None:
+        return {"status": "success", "message": "Signature request withdrawn successfully"}
+    return response
+
+async def get_attachment(signature_request_id: str, attachment_id: str) -> bytes:
+    """
+    Download a specific attached file from a signature request.
+
+    Asynchronous version of :func:`skribble.signature_request.get_attachment`.
+    """
+    return await _attachment.get(signature_request_id, attachment_id)
+
+def iter_attachment(signature_request_id: str, attachment_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Stream a specific attached file from a signature request in chunks.
+
+    Asynchronous version of :func:`skribble.signature_request.iter_attachment`.
+    """
+    return _attachment.iter_download(signature_request_id, attachment_id, chunk_size)
+
+async def get_attachment_to(signature_request_id: str, attachment_id: str, destination: Destination, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream a specific attached file from a signature request into a file path or binary file object.
+
+    Asynchronous version of :func:`skribble.signature_request.get_attachment_to`.
+    """
+    return await _attachment.download_to(signature_request_id, attachment_id, destination, chunk_size)
@@ -0,0 +1,78 @@
+import asyncio
+import inspect
+from typing import Any, AsyncIterator, Callable, List, Optional, Set
+from .client_manager import get_client
+from ..concurrency import async_bounded_map
+from ..watcher import StatusChange, _BaseStatusWatcher
+
+class AsyncStatusWatcher(_BaseStatusWatcher):
+    """
+    Asynchronous version of :class:`skribble.StatusWatcher`.
+
+    Example:
+        >>> watcher = skribble.aio.AsyncStatusWatcher(open_ids, interval=60)
+        >>> async for change in watcher.watch():
+        ...     print(change.signature_request_id, change.status)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Created in watch() so it belongs to the running event loop
+        self._stopped: Optional[asyncio.Event] = None
+
+    async def poll(self) -> List[StatusChange]:
+        """
+        Compare the watched requests with the previous poll once and return the changes.
+        """
+        changes: List[StatusChange] = []
+        if not self._snapshot:
+            return changes
+        client = get_client()
+
+        seen: Set[str] = set()
+        to_fetch: List[str] = []
+        page_number = 0
+        while True:
+            page = await client._make_request("GET", "/signature-requests", params=self._page_params(page_number)) or []
+            if self._scan(page, seen, to_fetch, changes):
+                break
+            page_number += 1
+
+        to_fetch.extend(self._unseen(seen))
+        if to_fetch:
+            fetch = lambda signature_request_id: client._make_request("GET", f"/signature-requests/{signature_request_id}")
+            self._resolve([outcome async for outcome in async_bounded_map(fetch, to_fetch, self.concurrency, ordered=False)], changes)
+        return changes
+
+    async def watch(self) -> AsyncIterator[StatusChange]:
+        """
+        Poll every ``interval`` seconds and yield the changes, until no request is left
+        to watch or :meth:`stop` is called.
+        """
+        self._stopped = asyncio.Event()
+        while self._snapshot and not self._stopped.is_set():
+            for change in await self.poll():
+                yield change
+            if self._snapshot:
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run(self, on_change: Callable[[StatusChange], Any]) -> None:
+        """
+        Like :meth:`watch`, but call ``on_change`` with every change; it may be a coroutine function.
+        """
+        async for change in self.watch():
+            result = on_change(change)
+            if inspect.isawaitable(result):
+                await result
+
+    def stop(self) -> None:
+        """
+        Stop :meth:`watch` or :meth:`run`.
+        """
+        if self._stopped is not None:
+            self._stopped.set()
+
+    __aiter__ = watch
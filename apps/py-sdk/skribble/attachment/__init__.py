@@ -1,6 +1,8 @@
 from .operations import (
     add,
     get,
+    iter_download,
+    download_to,
     delete,
     list
 )
@@ -8,6 +10,8 @@ from .operations import (
 __all__ = [
     "add",
     "get",
-    "delete"
+    "iter_download",
+    "download_to",
+    "delete",
     "list"
 ]
\ No newline at end of file
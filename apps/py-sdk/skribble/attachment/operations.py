@@ -1,19 +1,26 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Union
 from ..client_manager import get_client
+from ..streaming import DEFAULT_CHUNK_SIZE, Destination, open_download, iter_response, write_chunks
+from ..concurrency import DEFAULT_CONCURRENCY, BatchResult, bounded_map
 from ..exceptions import SkribbleValidationError, SkribbleAPIError
+from ..responses import AttachmentView
 
-def add(signature_request_id: str, attachments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def add(signature_request_id: str, attachments: Iterable[Dict[str, Any]], concurrency: int = DEFAULT_CONCURRENCY) -> BatchResult:
     """
     Add multiple attachments to a signature request.
 
+    Up to ``concurrency`` attachments are uploaded at the same time. Every attachment is
+    attempted even if others fail; the result tells which uploads went through.
+
     :param signature_request_id: The ID of the signature request.
     :type signature_request_id: str
-    :param attachments: A list of dictionaries containing attachment information.
-    :type attachments: List[Dict[str, Any]]
-    :return: A list of dictionaries containing the added attachment IDs.
-    :rtype: List[Dict[str, Any]]
-    :raises SkribbleValidationError: If the input data is invalid.
-    :raises SkribbleAPIError: If the API request fails.
+    :param attachments: Dictionaries containing attachment information.
+    :type attachments: Iterable[Dict[str, Any]]
+    :param concurrency: Maximum number of uploads in flight.
+    :type concurrency: int
+    :return: One result per attachment; ``result.succeeded`` holds the API responses with the attachment IDs.
+    :rtype: BatchResult
+    :raises SkribbleValidationError: If ``concurrency`` is less than 1.
 
     Example:
         >>> attachments = [
@@ -21,15 +28,13 @@ def add(signature_request_id: str, attachments: List[Dict[str, Any]]) -> List[Di
         ...     {"filename": "doc2.pdf", "content_type": "application/pdf", "content": "base64_content"}
         ... ]
         >>> result = skribble.attachment.add("5c33d0cb-84...", attachments)
-        >>> print(result)
+        >>> print([upload.result for upload in result.succeeded])
         [{'attachment_id': 'att_1'}, {'attachment_id': 'att_2'}]
+        >>> result.raise_for_errors()
     """
     client = get_client()
-    attachment_responses = []
-    for attachment in attachments:
-        response = client._make_request("POST", f"/signature-requests/{signature_request_id}/attachments", data=attachment)
-        attachment_responses.append(response)
-    return attachment_responses
+    endpoint = f"/signature-requests/{signature_request_id}/attachments"
+    return BatchResult("add_attachments", bounded_map(lambda attachment: client._make_request("POST", endpoint, data=attachment), attachments, concurrency))
 
 def get(signature_request_id: str, attachment_id: str) -> bytes:
     """
@@ -42,13 +47,48 @@ def get(signature_request_id: str, attachment_id: str) -> bytes:
     Returns:
         bytes: The content of the attachment file.
     """
-    client = get_client()
-    response = client.session.get(f"{client.BASE_URL}/signature-requests/{signature_request_id}/attachments/{attachment_id}/content", headers={"Authorization": f"Bearer {client._authenticate()}"})
+    response = get_client()._request_raw("GET", f"/signature-requests/{signature_request_id}/attachments/{attachment_id}/content")
     if response.status_code == 200:
         return response.content
     else:
         raise SkribbleAPIError(f"Failed to get attachment: {response.text}")
 
+def iter_download(signature_request_id: str, attachment_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Stream an attached file in chunks instead of loading it into memory.
+
+    Args:
+        signature_request_id (str): The ID of the signature request.
+        attachment_id (str): The ID of the attachment to download.
+        chunk_size (int): Maximum number of bytes per chunk.
+
+    Returns:
+        Iterator[bytes]: An iterator over the content of the attachment file.
+
+    Raises:
+        SkribbleAPIError: If the download fails.
+    """
+    response = open_download(get_client(), f"/signature-requests/{signature_request_id}/attachments/{attachment_id}/content", "Failed to get attachment")
+    return iter_response(response, chunk_size)
+
+def download_to(signature_request_id: str, attachment_id: str, destination: Destination, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream an attached file straight into a file path or binary file object.
+
+    Args:
+        signature_request_id (str): The ID of the signature request.
+        attachment_id (str): The ID of the attachment to download.
+        destination (Union[str, os.PathLike, BinaryIO]): A file path or a binary file object opened for writing.
+        chunk_size (int): Maximum number of bytes per chunk.
+
+    Returns:
+        int: The number of bytes written.
+
+    Raises:
+        SkribbleAPIError: If the download fails.
+    """
+    return write_chunks(iter_download(signature_request_id, attachment_id, chunk_size), destination)
+
 def delete(signature_request_id: str, attachment_id: str) -> None:
     """
     Remove an attachment from a signature request.
@@ -63,17 +103,19 @@ def delete(signature_request_id: str, attachment_id: str) -> None:
     Raises:
         SkribbleAPIError: If the deletion fails.
     """
-    client = get_client()
-    response = client.session.delete(f"{client.BASE_URL}/signature-requests/{signature_request_id}/attachments/{attachment_id}", headers={"Authorization": f"Bearer {client._authenticate()}"})
+    response = get_client()._request_raw("DELETE", f"/signature-requests/{signature_request_id}/attachments/{attachment_id}")
     if response.status_code not in [204, 200]:
         raise SkribbleAPIError(f"Failed to delete attachment: {response.text}")
 
-def list(signature_request_id: str) -> List[Dict[str, str]]:
+def list(signature_request_id: str, typed: bool = False) -> Union[List[Dict[str, str]], List[AttachmentView]]:
     """
     List all attachments for a signature request.
 
+    Served from the client's :class:`~skribble.cache.ResponseCache` if one is configured.
+
     Args:
         signature_request_id (str): The ID of the signature request.
+        typed (bool): Return :class:`~skribble.responses.AttachmentView` objects instead of dictionaries.
 
     Returns:
         List[Dict[str, str]]: A list of dictionaries containing the attachment information.
@@ -83,10 +125,8 @@ def list(signature_request_id: str) -> List[Dict[str, str]]:
         SkribbleAPIError: If the API request fails.
     """
     client = get_client()
-    response = client._make_request("GET", f"/signature-requests/{signature_request_id}")
+    response = client._make_request("GET", f"/signature-requests/{signature_request_id}", cached=True)
     
-    if 'attachments' in response:
-        return response['attachments']
-    else:
-        return []
+    attachments = response.get('attachments') or []
+    return [AttachmentView(attachment) for attachment in attachments] if typed else attachments
 
@@ -0,0 +1,127 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+class CacheStats(NamedTuple):
+    """
+    Counters of a :class:`ResponseCache`, as returned by :meth:`ResponseCache.stats`.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class ResponseCache:
+    """
+    In-process cache for the responses of read operations.
+
+    Caches ``signature_request.get``, ``document.get`` and ``attachment.list`` for ``ttl``
+    seconds, keeping at most ``maxsize`` entries and evicting the least recently used one
+    when full. Every write request made through the same client (update, signer changes,
+    withdraw, delete, new attachments) drops the cached entries of the resource it changes,
+    so a client never reads back stale data it wrote itself. Changes made elsewhere, e.g.
+    a signer signing, become visible after at most ``ttl`` seconds.
+
+    Args:
+        maxsize (int): Maximum number of cached responses.
+        ttl (float): Seconds a cached response is served.
+
+    Example:
+        >>> cache = ResponseCache(maxsize=2048, ttl=2.0)
+        >>> skribble.init(username, api_key, cache=cache)
+        >>> print(cache.stats().hit_rate)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self._clock: Callable[[], float] = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation; a response fetched across one is not stored
+        self._generation: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._invalidations: int = 0
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        if not params:
+            return endpoint
+        return endpoint + "?" + "&".join(f"{name}={params[name]}" for name in sorted(params))
+
+    def lookup(self, key: str) -> Tuple[bool, Any, int]:
+        """
+        Return ``(found, value, generation)``; pass ``generation`` to :meth:`store` after a miss.
+
+        The value is a copy, so callers may modify it freely.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, copy.deepcopy(value), self._generation
+                del self._entries[key]
+            self._misses += 1
+            return False, None, self._generation
+
+    def store(self, key: str, value: Any, generation: int) -> None:
+        """
+        Cache ``value`` unless an invalidation happened since the lookup that returned ``generation``.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (self._clock() + self.ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Drop the cached responses of the resource a write request to ``endpoint`` changes.
+
+        ``/signature-requests/{id}/signatures/{sid}`` affects ``/signature-requests/{id}`` and
+        everything below it. For a write to a collection (``PUT /signature-requests``) the
+        resource is identified by the ``id`` in the request body.
+        """
+        segments = endpoint.strip("/").split("/")
+        if len(segments) >= 2:
+            resource = f"/{segments[0]}/{segments[1]}"
+        elif isinstance(data, dict) and data.get("id"):
+            resource = f"/{segments[0]}/{data['id']}"
+        else:
+            resource = f"/{segments[0]}"
+
+        with self._lock:
+            self._generation += 1
+            stale = [key for key in self._entries if key == resource or key.startswith((resource + "/", resource + "?"))]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._invalidations, len(self._entries))
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._invalidations = 0
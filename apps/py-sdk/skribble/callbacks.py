@@ -0,0 +1,362 @@
+import asyncio
+import contextvars
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode
+from .exceptions import SkribbleValidationError
+from . import signature_request as _signature_request
+from .aio import signature_request as _async_signature_request
+
+#: Placeholders Skribble replaces in callback URLs before calling them.
+SIGNATURE_REQUEST_ID_PLACEHOLDER = "SKRIBBLE_SIGNATURE_REQUEST_ID"
+DOCUMENT_ID_PLACEHOLDER = "SKRIBBLE_DOCUMENT_ID"
+
+#: Callback events, one per ``callback_*_url`` of a signature request.
+EVENTS = ("success", "error", "update")
+
+#: Largest callback body accepted, in bytes.
+MAX_BODY_SIZE = 64 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+Handler = Callable[["Callback"], Union[None, Awaitable[None]]]
+
+class Callback:
+    """
+    A callback received from Skribble.
+
+    Attributes:
+        event (str): ``"success"``, ``"error"`` or ``"update"``.
+        signature_request_id (str): ID of the signature request the callback is about.
+        document_id (str, optional): ID of its document, if the callback URL asked for it.
+        payload (dict): All query parameters and body fields of the callback.
+    """
+
+    def __init__(self, event: str, signature_request_id: str, document_id: Optional[str] = None, payload: Optional[Dict[str, Any]] = None):
+        self.event: str = event
+        self.signature_request_id: str = signature_request_id
+        self.document_id: Optional[str] = document_id
+        self.payload: Dict[str, Any] = payload or {}
+        self._signature_request: Optional[Dict[str, Any]] = None
+
+    def fetch(self) -> Dict[str, Any]:
+        """
+        Get the signature request with :func:`skribble.signature_request.get`.
+
+        The callback itself only names the request; it is fetched on the first call and
+        reused afterwards, so handlers that do not need it cost no API call.
+        """
+        if self._signature_request is None:
+            self._signature_request = _signature_request.get(self.signature_request_id)
+        return self._signature_request
+
+    async def afetch(self) -> Dict[str, Any]:
+        """
+        Asynchronous version of :meth:`fetch`.
+        """
+        if self._signature_request is None:
+            self._signature_request = await _async_signature_request.get(self.signature_request_id)
+        return self._signature_request
+
+    def __repr__(self) -> str:
+        return f"Callback(event={self.event!r}, signature_request_id={self.signature_request_id!r})"
+
+class CallbackReceiver:
+    """
+    Receive the callbacks of signature requests instead of polling for their status.
+
+    Use :meth:`callback_urls` when creating a signature request to point its callbacks at
+    the receiver, and register handlers with :meth:`on`. The receiver is served as a WSGI
+    application (:meth:`wsgi`) or an ASGI application (:meth:`asgi`), or called from a view
+    of any web framework through :meth:`handle`.
+
+    Skribble delivers a callback again if it did not get a 2xx answer. A signature request
+    succeeds or fails only once, so a repeated ``success`` or ``error`` callback received
+    within ``dedup_ttl`` seconds is a redelivery and dispatched only once. ``update``
+    callbacks are identical for every change of a request, so they are all dispatched unless
+    ``update_dedup_ttl`` collapses repeats within a short window. If a handler raises, the
+    callback is answered with 500 and the redelivery is dispatched again.
+
+    Args:
+        dedup_ttl (float): Seconds during which a repeated ``success`` or ``error`` callback is ignored.
+        update_dedup_ttl (float): Seconds during which a repeated ``update`` callback is ignored;
+            0 dispatches every update.
+        max_tracked (int): Maximum number of callbacks remembered for deduplication.
+
+    Example:
+        >>> receiver = skribble.CallbackReceiver()
+        >>> @receiver.on("success")
+        ... def signed(callback):
+        ...     archive(callback.fetch())
+        >>> skribble.signature_request.create({**request_data, **receiver.callback_urls("https://example.com/skribble")})
+        >>> app = receiver.wsgi
+    """
+
+    def __init__(self, dedup_ttl: float = 3600.0, max_tracked: int = 10000, clock: Callable[[], float] = time.monotonic, update_dedup_ttl: float = 0.0):
+        self.dedup_ttl: float = dedup_ttl
+        self.update_dedup_ttl: float = update_dedup_ttl
+        self.max_tracked: int = max_tracked
+        self._clock: Callable[[], float] = clock
+        self._handlers: Dict[str, List[Handler]] = {event: [] for event in (*EVENTS, "*")}
+        self._delivered: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def callback_urls(base_url: str, include_document_id: bool = False) -> Dict[str, str]:
+        """
+        Build the ``callback_*_url`` fields of a signature request for a receiver served at ``base_url``.
+
+        Merge the result into the signature request passed to :func:`skribble.signature_request.create`.
+        """
+        urls = {}
+        separator = "&" if "?" in base_url else "?"
+        for event in EVENTS:
+            params = {"event": event, "signature_request_id": SIGNATURE_REQUEST_ID_PLACEHOLDER}
+            if include_document_id:
+                params["document_id"] = DOCUMENT_ID_PLACEHOLDER
+            urls[f"callback_{event}_url"] = f"{base_url}{separator}{urlencode(params)}"
+        return urls
+
+    def on(self, event: str, handler: Optional[Handler] = None) -> Any:
+        """
+        Register ``handler`` for ``event`` (``"success"``, ``"error"``, ``"update"`` or ``"*"`` for all).
+
+        Can be used as a decorator. Handlers may be coroutine functions when the receiver is
+        served through :meth:`asgi`.
+
+        Raises:
+            SkribbleValidationError: If the event is unknown.
+        """
+        if event not in self._handlers:
+            raise SkribbleValidationError(f"Unknown callback event '{event}'. Valid events are: {', '.join(EVENTS)}, *")
+
+        def register(handler: Handler) -> Handler:
+            self._handlers[event].append(handler)
+            return handler
+
+        return register(handler) if handler is not None else register
+
+    def parse(self, path: str, query_string: Union[str, bytes], body: bytes = b"", content_type: Optional[str] = None) -> Callback:
+        """
+        Build a :class:`Callback` from the parts of an HTTP request.
+
+        The event is taken from the ``event`` parameter or the last segment of the path, the
+        signature request ID from ``signature_request_id`` (or ``id``) in the query string,
+        a form body or a JSON body.
+
+        Raises:
+            SkribbleValidationError: If the request is not a valid callback.
+        """
+        if isinstance(query_string, bytes):
+            query_string = query_string.decode("latin-1")
+        payload: Dict[str, Any] = dict(parse_qsl(query_string))
+        media_type = (content_type or "").split(";")[0].strip().lower()
+        if body and media_type == "application/json":
+            try:
+                data = json.loads(body)
+            except ValueError:
+                raise SkribbleValidationError("Callback body is not valid JSON") from None
+            if isinstance(data, dict):
+                payload.update(data)
+        elif body and media_type == "application/x-www-form-urlencoded":
+            payload.update(parse_qsl(body.decode("utf-8", errors="replace")))
+
+        event = payload.get("event") or path.rstrip("/").rsplit("/", 1)[-1]
+        if event not in EVENTS:
+            raise SkribbleValidationError(f"Unknown callback event '{event}'")
+        signature_request_id = payload.get("signature_request_id") or payload.get("id")
+        if not signature_request_id or signature_request_id == SIGNATURE_REQUEST_ID_PLACEHOLDER:
+            raise SkribbleValidationError("Callback does not name a signature request")
+        document_id = payload.get("document_id")
+        if document_id == DOCUMENT_ID_PLACEHOLDER:
+            document_id = None
+        return Callback(event, str(signature_request_id), document_id, payload)
+
+    def dispatch(self, callback: Callback) -> bool:
+        """
+        Call the handlers of ``callback`` unless it is a repeated delivery; return whether they ran.
+        """
+        key = self._claim(callback)
+        if key is None:
+            return False
+        try:
+            for handler in self._handlers_for(callback):
+                result = handler(callback)
+                if inspect.isawaitable(result):
+                    if inspect.iscoroutine(result):
+                        result.close()
+                    raise SkribbleValidationError("Coroutine handlers require the receiver to be served through asgi()")
+        except BaseException:
+            self._release(key)
+            raise
+        return True
+
+    async def adispatch(self, callback: Callback) -> bool:
+        """
+        Asynchronous version of :meth:`dispatch`. Coroutine handlers are awaited, others run
+        in the default executor so they do not block the event loop.
+        """
+        key = self._claim(callback)
+        if key is None:
+            return False
+        loop = asyncio.get_running_loop()
+        try:
+            for handler in self._handlers_for(callback):
+                if inspect.iscoroutinefunction(handler):
+                    await handler(callback)
+                else:
+                    result = await loop.run_in_executor(None, contextvars.copy_context().run, handler, callback)
+                    if inspect.isawaitable(result):
+                        await result
+        except BaseException:
+            self._release(key)
+            raise
+        return True
+
+    def handle(self, method: str, path: str, query_string: Union[str, bytes], body: bytes = b"", content_type: Optional[str] = None) -> Tuple[int, str]:
+        """
+        Process one HTTP request and return the status code and text to answer with.
+
+        Framework-neutral entry point, e.g. for a Django or Flask view.
+        """
+        callback, error = self._parse_request(method, path, query_string, body, content_type)
+        if callback is None:
+            return error
+        try:
+            self.dispatch(callback)
+        except Exception:
+            return 500, "Callback handler failed"
+        return 200, "OK"
+
+    async def ahandle(self, method: str, path: str, query_string: Union[str, bytes], body: bytes = b"", content_type: Optional[str] = None) -> Tuple[int, str]:
+        """
+        Asynchronous version of :meth:`handle`.
+        """
+        callback, error = self._parse_request(method, path, query_string, body, content_type)
+        if callback is None:
+            return error
+        try:
+            await self.adispatch(callback)
+        except Exception:
+            return 500, "Callback handler failed"
+        return 200, "OK"
+
+    def wsgi(self, environ: Dict[str, Any], start_response: Callable[..., Any]) -> List[bytes]:
+        """
+        WSGI application receiving the callbacks.
+        """
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if length > MAX_BODY_SIZE:
+            status, text = 413, "Callback body too large"
+        else:
+            body = environ["wsgi.input"].read(length) if length > 0 else b""
+            status, text = self.handle(
+                environ.get("REQUEST_METHOD", "GET"),
+                environ.get("PATH_INFO", ""),
+                environ.get("QUERY_STRING", ""),
+                body,
+                environ.get("CONTENT_TYPE")
+            )
+        content = text.encode("utf-8")
+        start_response(f"{status} {_REASONS[status]}", [("Content-Type", "text/plain; charset=utf-8"), ("Content-Length", str(len(content)))])
+        return [content]
+
+    async def asgi(self, scope: Dict[str, Any], receive: Callable[[], Awaitable[Dict[str, Any]]], send: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        """
+        ASGI application receiving the callbacks.
+        """
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        too_large = False
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            if len(body) > MAX_BODY_SIZE:
+                too_large = True
+                break
+            if not message.get("more_body", False):
+                break
+
+        if too_large:
+            status, text = 413, "Callback body too large"
+        else:
+            headers = dict(scope.get("headers") or [])
+            content_type = headers.get(b"content-type")
+            status, text = await self.ahandle(
+                scope.get("method", "GET"),
+                scope.get("path", ""),
+                scope.get("query_string", b""),
+                body,
+                content_type.decode("latin-1") if content_type else None
+            )
+        content = text.encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", str(len(content)).encode())]
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    def _parse_request(self, method: str, path: str, query_string: Union[str, bytes], body: bytes, content_type: Optional[str]) -> Tuple[Optional[Callback], Tuple[int, str]]:
+        if method.upper() not in ("GET", "POST"):
+            return None, (405, "Method not allowed")
+        if len(body) > MAX_BODY_SIZE:
+            return None, (413, "Callback body too large")
+        try:
+            return self.parse(path, query_string, body, content_type), (200, "OK")
+        except SkribbleValidationError as e:
+            return None, (400, str(e))
+
+    def _handlers_for(self, callback: Callback) -> List[Handler]:
+        return [*self._handlers[callback.event], *self._handlers["*"]]
+
+    def _claim(self, callback: Callback) -> Optional[str]:
+        """
+        Remember ``callback`` as delivered and return its key, or ``None`` if it was already.
+
+        Entries are kept in arrival order with the time they expire; an entry that outlives
+        an older one is dropped once the older one has expired too.
+        """
+        key = hashlib.sha256(json.dumps(
+            [callback.event, callback.signature_request_id, callback.document_id, callback.payload],
+            sort_keys=True,
+            default=str
+        ).encode("utf-8")).hexdigest()
+        ttl = self.update_dedup_ttl if callback.event == "update" else self.dedup_ttl
+        now = self._clock()
+        with self._lock:
+            while self._delivered:
+                oldest, expires_at = next(iter(self._delivered.items()))
+                if expires_at > now and len(self._delivered) < self.max_tracked:
+                    break
+                del self._delivered[oldest]
+            if self._delivered.get(key, now) > now:
+                return None
+            if ttl > 0:
+                self._delivered[key] = now + ttl
+                self._delivered.move_to_end(key)
+        return key
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            self._delivered.pop(key, None)
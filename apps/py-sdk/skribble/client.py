@@ -1,71 +1,267 @@
-import requests
-from typing import Optional, Dict, Any, List
-from .models import AuthRequest
+import time
+from http import HTTPStatus
+from typing import Optional, Dict, Any, List, Sequence
 from .exceptions import SkribbleAuthError, SkribbleValidationError, SkribbleAPIError
+from .streaming import StreamingJSONBody
+from .token_manager import TokenManager, DEFAULT_REFRESH_MARGIN
+from .retry import RetryPolicy
+from .config import ClientConfig
+from .cache import ResponseCache
+from .disk_cache import DiskCache
+from .codec import JSONCodec, default_codec
+from .hooks import RequestHooks, observe
+from .compression import compress_request, is_replayable, rejects_compression
+from .transport import Transport, TransportError, default_transport
 
 class SkribbleClient:
     BASE_URL: str = "https://api.skribble.com/v2"
 
-    def __init__(self, username: Optional[str] = None, api_key: Optional[str] = None, access_token: Optional[str] = None):
+    def __init__(self, username: Optional[str] = None, api_key: Optional[str] = None, access_token: Optional[str] = None, refresh_margin: float = DEFAULT_REFRESH_MARGIN, retry_policy: Optional[RetryPolicy] = None, config: Optional[ClientConfig] = None, cache: Optional[ResponseCache] = None, disk_cache: Optional[DiskCache] = None, json_codec: Optional[JSONCodec] = None, hooks: Optional[Sequence[RequestHooks]] = None, transport: Optional[Transport] = None):
         """
         Initialize the Skribble client.
 
+        When username and API key are given, the access token is refreshed automatically
+        ``refresh_margin`` seconds before it expires, and a request rejected with 401 is
+        replayed once after logging in again. Transient failures are retried according to
+        ``retry_policy``.
+
         Args:
             username (str, optional): The API username.
             api_key (str, optional): The API key.
             access_token (str, optional): A pre-authenticated access token.
+            refresh_margin (float): Seconds before expiry at which the access token is refreshed.
+            retry_policy (RetryPolicy, optional): Retry behaviour for transient failures. Defaults to ``RetryPolicy()``.
+            config (ClientConfig, optional): Connection pool, timeout and compression settings. Defaults to ``ClientConfig()``.
+            cache (ResponseCache, optional): Cache for read operations. Disabled by default.
+            disk_cache (DiskCache, optional): Persistent cache for document downloads and previews. Disabled by default.
+            json_codec (JSONCodec, optional): Encoder and decoder for JSON bodies. Defaults to orjson if installed,
+                otherwise the standard library.
+            hooks (Sequence[RequestHooks], optional): Receive timing, size and retry events for every request.
+            transport (Transport, optional): Sends the HTTP requests. Defaults to a ``RequestsTransport``
+                built from ``config``, or an ``HTTPXTransport`` if ``config.http2`` is set.
         """
         self.username: Optional[str] = username
         self.api_key: Optional[str] = api_key
-        self.access_token: Optional[str] = access_token
-        self.session: requests.Session = requests.Session()
+        self.config: ClientConfig = config if config is not None else ClientConfig()
+        self.transport: Transport = transport if transport is not None else default_transport(self.config)
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.cache: Optional[ResponseCache] = cache
+        self.disk_cache: Optional[DiskCache] = disk_cache
+        self.json_codec: JSONCodec = json_codec if json_codec is not None else default_codec()
+        self.hooks: List[RequestHooks] = list(hooks or [])
+        self._compress_requests: bool = self.config.compress_requests
+        self.token_manager: TokenManager = TokenManager(
+            login=self._login if username and api_key else None,
+            access_token=access_token,
+            refresh_margin=refresh_margin
+        )
+
+    @property
+    def session(self) -> Any:
+        """
+        The session of the transport, e.g. the ``requests.Session`` of the default
+        :class:`~skribble.transport.RequestsTransport`, or ``None`` if it has none.
+        """
+        return getattr(self.transport, "session", None)
+
+    @session.setter
+    def session(self, session: Any) -> None:
+        self.transport.session = session
+
+    @property
+    def access_token(self) -> Optional[str]:
+        return self.token_manager.token
+
+    @access_token.setter
+    def access_token(self, access_token: Optional[str]) -> None:
+        self.token_manager.set_token(access_token)
+
+    def __enter__(self) -> "SkribbleClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying connection pool.
+        """
+        self.transport.close()
 
     def _authenticate(self) -> str:
-        if self.access_token:
-            return self.access_token
-        
-        if not self.username or not self.api_key:
-            raise SkribbleAuthError("Username and API key are required for authentication")
+        return self.token_manager.get_token()
 
+    def _login(self) -> str:
+        # Imported here so constructing a client does not load pydantic
+        from .models import AuthRequest
         auth_data = AuthRequest(username=self.username, **{"api-key": self.api_key})
-        response = self.session.post(f"{self.BASE_URL}/access/login", json=auth_data.dict(by_alias=True))
+        body = self.json_codec.dumps(auth_data.model_dump(by_alias=True))
+        observer = observe(self.hooks, "POST", "/access/login", body)
+        observer.start(0)
+        try:
+            response = self.transport.send("POST", f"{self.BASE_URL}/access/login", headers={"Content-Type": "application/json"}, data=body)
+        except TransportError as req_err:
+            observer.error(req_err)
+            raise SkribbleAPIError(f"Request failed: {str(req_err)}")
+        observer.response(response)
 
         if response.status_code == 200:
-            self.access_token = response.text.strip()
-            return self.access_token
+            return response.text.strip()
         elif response.status_code in [401, 403]:
             raise SkribbleAuthError("Invalid credentials")
         else:
             raise SkribbleAPIError(response.text, status_code=response.status_code)
 
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
-        if not self.access_token:
-            self.access_token = self._authenticate()
-        
-        headers = {"Authorization": f"Bearer {self.access_token}"}
+    def _send(self, method: str, endpoint: str, headers: Optional[Dict[str, str]] = None, idempotent: Optional[bool] = None, payload: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        Send an authenticated request, logging in again and replaying it once on a 401
+        if its body can be sent again.
+
+        ``payload`` is the decoded JSON body, if any; a write uses it to find the cached
+        responses it makes stale.
+        """
+        token = self._authenticate()
+        response = self._send_with_retries(token, method, endpoint, headers, idempotent, **kwargs)
 
-        try:
-            response = self.session.request(method, f"{self.BASE_URL}{endpoint}", json=data, headers=headers, params=params)
-            response.raise_for_status()  # This will raise an HTTPError for bad responses
+        if response.status_code == 401 and self.token_manager.can_refresh:
+            token = self.token_manager.refresh(stale_token=token)
+            # A body read from a pipe is gone; the caller gets the 401 instead of an empty upload
+            if is_replayable(kwargs.get("data")):
+                response.close()
+                response = self._send_with_retries(token, method, endpoint, headers, idempotent, **kwargs)
+
+        if self.cache is not None and method.upper() != "GET":
+            # A write through this client makes the cached reads of the resource stale
+            self.cache.invalidate(endpoint, payload)
+        return response
+
+    def _send_with_retries(self, token: str, method: str, endpoint: str, headers: Optional[Dict[str, str]], idempotent: Optional[bool], **kwargs) -> Any:
+        """
+        Send a request, retrying transient failures as allowed by the retry policy.
+
+        When retries are exhausted the last response is returned, or the last connection
+        error is raised as :class:`SkribbleAPIError`.
+        """
+        policy = self.retry_policy
+        body = kwargs.get("data")
+        can_retry = policy.allows(method, idempotent) and is_replayable(body)
+        started = policy.start()
+        attempt = 0
+        request_headers = {**(headers or {}), "Authorization": f"Bearer {token}"}
+        observer = observe(self.hooks, method, endpoint, body)
 
-            if response.status_code >= 200 and response.status_code < 300:
-                return response.json() if response.text else None
-        except requests.exceptions.HTTPError as http_err:
-            error_message = f"HTTP error occurred: {http_err}. "
+        while True:
+            observer.start(attempt)
             try:
-                error_detail = response.json()
-                error_message += f"Error details: {error_detail}"
-            except ValueError:
-                error_message += f"Response text: {response.text}"
-
-            if response.status_code in [401, 403]:
-                raise SkribbleAuthError(f"Invalid or expired token. {error_message}")
-            elif response.status_code == 400:
-                raise SkribbleValidationError(f"Validation error: {error_message}")
-            elif response.status_code == 404:
-                raise SkribbleAPIError(error_message, status_code=response.status_code)
+                response = self.transport.send(method, f"{self.BASE_URL}{endpoint}", headers=request_headers, **kwargs)
+            except TransportError as req_err:
+                observer.error(req_err)
+                delay = policy.next_delay(attempt, started) if can_retry and req_err.retryable else None
+                if delay is None:
+                    raise SkribbleAPIError(f"Request failed: {str(req_err)}")
             else:
-                raise SkribbleAPIError(error_message, status_code=response.status_code)
-        except requests.exceptions.RequestException as req_err:
-            raise SkribbleAPIError(f"Request failed: {str(req_err)}")
+                observer.response(response, kwargs.get("stream", False))
+                if not (can_retry and policy.is_retryable_status(response.status_code)):
+                    return response
+                delay = policy.next_delay(attempt, started, response.headers)
+                if delay is None:
+                    return response
+                response.close()
+
+            observer.retry(delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None, body: Optional[StreamingJSONBody] = None, idempotent: Optional[bool] = None, cached: bool = False) -> Any:
+        if cached and self.cache is not None:
+            return self._make_cached_request(method, endpoint, params)
+
+        headers = {}
+        content = body
+        if body is not None:
+            # Pre-encoded JSON that is streamed instead of serialized from ``data``
+            headers["Content-Type"] = "application/json"
+        elif data is not None:
+            content = self.json_codec.dumps(data)
+            headers["Content-Type"] = "application/json"
+
+        response = self._send_body(method, endpoint, headers, content, idempotent=idempotent, payload=data, params=params)
+
+        if response.status_code >= 200 and response.status_code < 300:
+            # Decoded straight from the received bytes, without building a str first
+            return self.json_codec.loads(response.content) if response.content else None
+
+        error_message = _http_error_message(response.status_code, f"{self.BASE_URL}{endpoint}")
+        try:
+            error_detail = self.json_codec.loads(response.content)
+            error_message += f"Error details: {error_detail}"
+        except ValueError:
+            error_message += f"Response text: {response.text}"
+
+        _raise_for_status_code(response.status_code, error_message)
+
+    def _send_body(self, method: str, endpoint: str, headers: Dict[str, str], content: Any, **kwargs) -> Any:
+        """
+        Send a request with a JSON body, gzip-compressed if ``config.compress_requests`` is set.
+
+        Once the API rejects a compressed body, it is resent uncompressed and compression stays
+        off for the rest of the client's lifetime.
+        """
+        compressed = compress_request(headers, content, self.config.compress_min_size) if self._compress_requests else None
+        if compressed is None:
+            return self._send(method, endpoint, headers=headers, data=content, **kwargs)
+
+        response = self._send(method, endpoint, headers=compressed[0], data=compressed[1], **kwargs)
+        if not rejects_compression(response):
+            return response
+        self._compress_requests = False
+        if not is_replayable(content):
+            # A body read from a pipe cannot be sent again; the caller gets the 415
+            return response
+        response.close()
+        return self._send(method, endpoint, headers=headers, data=content, **kwargs)
+
+    def _make_cached_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> Any:
+        """
+        Serve a read from the response cache, fetching and storing it on a miss.
+        """
+        key = self.cache.key(endpoint, params)
+        found, value, generation = self.cache.lookup(key)
+        if found:
+            return value
+        value = self._make_request(method, endpoint, params=params)
+        self.cache.store(key, value, generation)
+        return value
+
+    def _request_raw(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, stream: bool = False, headers: Optional[Dict[str, str]] = None) -> Any:
+        """
+        Send an authenticated request and return the undecoded response.
+
+        Used for the binary endpoints (document content, page previews, attachments). With
+        ``stream=True`` the body is not read until the caller consumes it.
+        """
+        return self._send(method, endpoint, headers=headers, params=params, stream=stream)
+
+def _http_error_message(status_code: int, url: str) -> str:
+    """
+    Start of the error message for an unsuccessful response, independent of the transport.
+    """
+    try:
+        reason = HTTPStatus(status_code).phrase
+    except ValueError:
+        reason = "Unknown Status"
+    return f"HTTP error occurred: {status_code} {reason} for url: {url}. "
+
+def _raise_for_status_code(status_code: int, error_message: str) -> None:
+    """
+    Map an unsuccessful HTTP status code to the matching SDK exception.
 
+    Shared by the synchronous and the asynchronous client so both surface
+    API failures in exactly the same way.
+    """
+    if status_code in [401, 403]:
+        raise SkribbleAuthError(f"Invalid or expired token. {error_message}")
+    elif status_code == 400:
+        raise SkribbleValidationError(f"Validation error: {error_message}")
+    else:
+        raise SkribbleAPIError(error_message, status_code=status_code)
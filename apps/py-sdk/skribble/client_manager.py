@@ -1,11 +1,22 @@
 from .client import SkribbleClient
-from .models import SignatureRequest, UpdateSignatureRequest, DocumentRequest, SealRequest, SignerRequest
 from .exceptions import SkribbleAuthError, SkribbleValidationError, SkribbleAPIError
-from typing import Optional, Dict, Any, List
+from .retry import RetryPolicy
+from .config import ClientConfig
+from .cache import ResponseCache
+from .disk_cache import DiskCache
+from .codec import JSONCodec
+from .hooks import RequestHooks
+from .transport import Transport
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, Iterator, List, Sequence
 
 _client = None
 
-def init(username: Optional[str] = None, api_key: Optional[str] = None, access_token: Optional[str] = None) -> str:
+# Client bound to the current thread or asyncio task by use_client(); takes precedence over _client
+_scoped_client: ContextVar[Optional[SkribbleClient]] = ContextVar("skribble_client", default=None)
+
+def init(username: Optional[str] = None, api_key: Optional[str] = None, access_token: Optional[str] = None, retry_policy: Optional[RetryPolicy] = None, config: Optional[ClientConfig] = None, cache: Optional[ResponseCache] = None, disk_cache: Optional[DiskCache] = None, json_codec: Optional[JSONCodec] = None, hooks: Optional[Sequence[RequestHooks]] = None, transport: Optional[Transport] = None) -> str:
     """
     Initialize the Skribble SDK client and return the access token.
 
@@ -17,6 +28,13 @@ def init(username: Optional[str] = None, api_key: Optional[str] = None, access_t
         username (str, optional): The API username.
         api_key (str, optional): The API key.
         access_token (str, optional): A pre-authenticated access token.
+        retry_policy (RetryPolicy, optional): Retry behaviour for transient failures.
+        config (ClientConfig, optional): Connection pool and timeout settings.
+        cache (ResponseCache, optional): Cache for read operations.
+        disk_cache (DiskCache, optional): Persistent cache for document downloads and previews.
+        json_codec (JSONCodec, optional): Encoder and decoder for JSON bodies.
+        hooks (Sequence[RequestHooks], optional): Receive timing, size and retry events for every request.
+        transport (Transport, optional): Sends the HTTP requests, e.g. ``Urllib3Transport()``.
 
     Returns:
         str: The access token.
@@ -39,17 +57,17 @@ def init(username: Optional[str] = None, api_key: Optional[str] = None, access_t
     global _client
     try:
         if access_token:
-            _client = SkribbleClient(access_token=access_token)
+            _client = SkribbleClient(access_token=access_token, retry_policy=retry_policy, config=config, cache=cache, disk_cache=disk_cache, json_codec=json_codec, hooks=hooks, transport=transport)
             try:
                 # Perform a test request to verify the token
-                _client._make_request("GET", "/signature-requests", params={"limit": 1})
+                _client._make_request("GET", "/signature-requests", params={"page_size": 1})
                 return access_token
             except SkribbleAPIError as api_err:
                 if api_err.status_code == 500:
                     raise SkribbleAuthError("Unable to validate access token. It may be expired or invalid.")
                 raise
         elif username and api_key:
-            _client = SkribbleClient(username=username, api_key=api_key)
+            _client = SkribbleClient(username=username, api_key=api_key, retry_policy=retry_policy, config=config, cache=cache, disk_cache=disk_cache, json_codec=json_codec, hooks=hooks, transport=transport)
             return _client._authenticate()
         else:
             raise SkribbleValidationError("Either (username, api_key) or access_token must be provided")
@@ -58,7 +76,37 @@ def init(username: Optional[str] = None, api_key: Optional[str] = None, access_t
     except SkribbleAPIError as api_err:
         raise SkribbleAPIError(f"API error during initialization: {str(api_err)}", status_code=api_err.status_code)
 
+@contextmanager
+def use_client(client: SkribbleClient) -> Iterator[SkribbleClient]:
+    """
+    Route all SDK operations in the current context through ``client``.
+
+    The binding is stored in a context variable, so it applies only to the current
+    thread or asyncio task (and to tasks it creates afterwards). This lets a service
+    that works for several Skribble accounts run their calls side by side, each with
+    its own connection pool and access token, without touching the client set up by
+    :func:`init`.
+
+    Args:
+        client (SkribbleClient): The client to use inside the ``with`` block.
+
+    Example:
+        >>> with skribble.use_client(SkribbleClient(username, api_key)):
+        ...     skribble.signature_request.list()
+    """
+    token = _scoped_client.set(client)
+    try:
+        yield client
+    finally:
+        _scoped_client.reset(token)
+
 def get_client() -> SkribbleClient:
+    """
+    Return the client bound by :func:`use_client`, or the one created by :func:`init`.
+    """
+    client = _scoped_client.get()
+    if client is not None:
+        return client
     if _client is None:
         raise SkribbleValidationError("Skribble SDK not initialized. Call skribble.init(...) first.")
     return _client
\ No newline at end of file
@@ -0,0 +1,52 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes responses with the standard library ``json`` module.
+
+    Subclass it and override :meth:`dumps` and :meth:`loads` to plug in another JSON library,
+    then pass an instance to the client as ``json_codec``.
+    """
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode ``value`` as UTF-8 JSON.
+        """
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document, given as bytes straight from the response or as a string.
+        """
+        return json.loads(data)
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec backed by `orjson <https://github.com/ijl/orjson>`_, which encodes and decodes
+    several times faster than the standard library, notably for large listings and base64 uploads.
+
+    Raises:
+        ImportError: If the optional ``orjson`` dependency is not installed.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install it with: pip install skribble-sdk[orjson]")
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+def default_codec() -> JSONCodec:
+    """
+    Return an :class:`OrjsonCodec` if orjson is installed, otherwise a :class:`JSONCodec`.
+    """
+    return OrjsonCodec() if orjson is not None else JSONCodec()
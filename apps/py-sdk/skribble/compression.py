@@ -0,0 +1,77 @@
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+#: Compression level of gzipped request bodies: zlib's default. On base64 documents it costs
+#: little more CPU time than the fastest level and gives slightly smaller bodies.
+GZIP_LEVEL: int = 6
+
+def gzip_compress(data: bytes) -> bytes:
+    """
+    Compress ``data`` into the gzip format, without a timestamp so equal input gives equal output.
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+class GzipBody:
+    """
+    A streamed request body, such as a :class:`~skribble.streaming.StreamingJSONBody`, that is
+    gzip-compressed chunk by chunk while it is sent.
+
+    The compressed size is not known up front, so the body goes out with chunked transfer encoding.
+    """
+
+    content_length: Optional[int] = None
+
+    def __init__(self, body: Any):
+        self._body = body
+
+    @property
+    def replayable(self) -> bool:
+        return self._body.replayable
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in self._body:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+def compress_request(headers: Dict[str, str], body: Any, min_size: int) -> Optional[Tuple[Dict[str, str], Any]]:
+    """
+    Return the headers and body of the gzip-compressed version of a request, or ``None`` if
+    there is no body or it is smaller than ``min_size`` bytes.
+    """
+    if body is None:
+        return None
+    if isinstance(body, bytes):
+        if len(body) < min_size:
+            return None
+        compressed = gzip_compress(body)
+    else:
+        if body.content_length is not None and body.content_length < min_size:
+            return None
+        compressed = GzipBody(body)
+    headers = {name: value for name, value in headers.items() if name.lower() != "content-length"}
+    headers["Content-Encoding"] = "gzip"
+    return headers, compressed
+
+def rejects_compression(response: Any) -> bool:
+    """
+    Whether the API refused a gzip-compressed request body.
+
+    A server that does not understand the body's encoding answers 415, and may list the
+    encodings it does accept in ``Accept-Encoding`` (RFC 7694); a 415 that lists gzip is
+    about something else.
+    """
+    if response.status_code != 415:
+        return False
+    accepted = response.headers.get("Accept-Encoding")
+    return accepted is None or "gzip" not in accepted.lower()
+
+def is_replayable(body: Any) -> bool:
+    return body is None or isinstance(body, bytes) or body.replayable
@@ -0,0 +1,196 @@
+import asyncio
+import collections
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque, Iterable, Iterator, List, NamedTuple, Optional, Set, Union
+from .exceptions import SkribbleValidationError, SkribbleOperationError
+
+#: Default number of requests a bulk operation keeps in flight.
+DEFAULT_CONCURRENCY = 8
+
+class ItemResult(NamedTuple):
+    """
+    Outcome of one item of a bulk operation.
+
+    Attributes:
+        index (int): Position of the item in the input.
+        item (Any): The input item.
+        result (Any): The return value of the operation, if it succeeded.
+        error (Exception, optional): The exception raised for this item, if it failed.
+    """
+    index: int
+    item: Any
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class BatchResult:
+    """
+    Outcome of a bulk operation that ran to completion.
+
+    Every item was attempted; ``succeeded`` and ``failed`` tell which ones went through,
+    so the caller can retry or clean up exactly the failed part.
+
+    Args:
+        operation (str): Name of the operation, used in error messages.
+        results (Iterable[ItemResult]): The per-item results, in any order.
+    """
+
+    def __init__(self, operation: str, results: Iterable[ItemResult]):
+        self.operation: str = operation
+        self.results: List[ItemResult] = sorted(results, key=lambda result: result.index)
+
+    @property
+    def succeeded(self) -> List[ItemResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[ItemResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    def raise_for_errors(self) -> None:
+        """
+        Raise :class:`SkribbleOperationError` if any item failed, chaining the first error.
+        """
+        failed = self.failed
+        if failed:
+            raise SkribbleOperationError(
+                self.operation,
+                f"{len(failed)} of {len(self.results)} items failed (indexes {[result.index for result in failed]})",
+                failed[0].error
+            ) from failed[0].error
+
+    def __iter__(self) -> Iterator[ItemResult]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __repr__(self) -> str:
+        return f"BatchResult(operation={self.operation!r}, succeeded={len(self.succeeded)}, failed={len(self.failed)})"
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise SkribbleValidationError("'concurrency' must be at least 1")
+
+def _call(function: Callable[[Any], Any], index: int, item: Any) -> ItemResult:
+    try:
+        return ItemResult(index, item, result=function(item))
+    except Exception as e:
+        return ItemResult(index, item, error=e)
+
+def bounded_map(function: Callable[[Any], Any], items: Iterable[Any], concurrency: int = DEFAULT_CONCURRENCY, ordered: bool = True) -> Iterator[ItemResult]:
+    """
+    Apply ``function`` to ``items`` on up to ``concurrency`` threads and yield an
+    :class:`ItemResult` per item.
+
+    ``items`` is consumed lazily, so at most a small multiple of ``concurrency`` items is
+    held in memory at once. Each call runs in a copy of the caller's context, so a client
+    bound with :func:`skribble.use_client` is used by the worker threads as well.
+    Exceptions are captured per item instead of stopping the batch.
+
+    Args:
+        function: The operation to apply to each item.
+        items: The input items; may be a generator.
+        concurrency (int): Maximum number of concurrent calls.
+        ordered (bool): Yield results in input order instead of as they complete.
+    """
+    _check_concurrency(concurrency)
+    # In order, finished results wait behind slower earlier items; allow some read-ahead
+    # so one slow item does not leave the other workers idle.
+    max_pending = 2 * concurrency if ordered else concurrency
+    source = enumerate(items)
+    pending: Deque[Future] = collections.deque()
+
+    def submit() -> bool:
+        for index, item in source:
+            pending.append(executor.submit(contextvars.copy_context().run, _call, function, index, item))
+            return True
+        return False
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="skribble")
+    try:
+        while len(pending) < max_pending and submit():
+            pass
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            result = future.result()
+            submit()
+            yield result
+    finally:
+        # Reached early when the caller stops iterating: drop the work that has not started
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+async def async_bounded_map(
+    function: Callable[[Any], Awaitable[Any]],
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True
+) -> AsyncIterator[ItemResult]:
+    """
+    Asynchronous version of :func:`bounded_map`; runs up to ``concurrency`` coroutines
+    at once. ``items`` may also be an asynchronous iterable.
+    """
+    _check_concurrency(concurrency)
+    max_pending = 2 * concurrency if ordered else concurrency
+    semaphore = asyncio.Semaphore(concurrency)
+    source = _aenumerate(items)
+    pending: Deque["asyncio.Task[ItemResult]"] = collections.deque()
+
+    async def call(index: int, item: Any) -> ItemResult:
+        async with semaphore:
+            try:
+                return ItemResult(index, item, result=await function(item))
+            except Exception as e:
+                return ItemResult(index, item, error=e)
+
+    async def submit() -> bool:
+        async for index, item in source:
+            pending.append(asyncio.ensure_future(call(index, item)))
+            return True
+        return False
+
+    try:
+        while len(pending) < max_pending and await submit():
+            pass
+        while pending:
+            if ordered:
+                task = pending.popleft()
+                result = await task
+            else:
+                done: Set[asyncio.Task] = (await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED))[0]
+                task = done.pop()
+                pending.remove(task)
+                result = task.result()
+            await submit()
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+async def _aenumerate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    index = 0
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield index, item
+            index += 1
+    else:
+        for item in items:
+            yield index, item
+            index += 1
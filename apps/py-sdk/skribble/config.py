@@ -0,0 +1,71 @@
+from typing import Optional, Tuple
+
+class ClientConfig:
+    """
+    Connection pool, timeout and compression settings for :class:`~skribble.client.SkribbleClient`
+    and :class:`~skribble.aio.AsyncSkribbleClient`.
+
+    The defaults suit a few dozen worker threads sharing one client. Raise ``pool_maxsize``
+    to at least the number of threads that call the API concurrently, otherwise surplus
+    connections are opened and discarded on every call ("connection pool is full").
+
+    Args:
+        pool_maxsize (int): Maximum number of connections kept open to the API host.
+        pool_connections (int): Number of per-host pools to keep (synchronous client only).
+        pool_block (bool): Wait for a free pooled connection instead of opening a throwaway
+            one when all ``pool_maxsize`` connections are busy (synchronous client only; the
+            asynchronous client always waits).
+        keep_alive (bool): Reuse connections between requests. Disable only when an
+            intermediary closes idle connections aggressively.
+        keepalive_expiry (float): Seconds an idle connection is kept open (asynchronous client only).
+        connect_timeout (float, optional): Seconds to wait for a connection to be established.
+        read_timeout (float, optional): Seconds to wait for the server between bytes received.
+        http2 (bool): Talk HTTP/2 to the API, so concurrent calls share a few multiplexed
+            connections instead of opening one connection (TCP and TLS handshake) each.
+            Requires ``pip install skribble-sdk[http2]``; the synchronous client then uses
+            :class:`~skribble.transport.HTTPXTransport` instead of ``requests``.
+        compress_responses (bool): Ask the API for compressed responses (gzip and deflate, plus
+            br and zstd when the ``brotli`` and ``zstandard`` packages are installed), which are
+            decompressed transparently. Large JSON listings shrink by an order of magnitude.
+        compress_requests (bool): Gzip JSON request bodies of at least ``compress_min_size``
+            bytes, such as the base64 documents uploaded by ``document.add``,
+            ``signature_request.create`` and ``seal.create``. If the API answers a compressed
+            body with 415 Unsupported Media Type, the client stops compressing and resends it as is.
+        compress_min_size (int): Smallest request body in bytes that is compressed.
+
+    Example:
+        >>> skribble.init(username, api_key, config=ClientConfig(pool_maxsize=64, read_timeout=120))
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 32,
+        pool_connections: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keepalive_expiry: float = 5.0,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+        http2: bool = False,
+        compress_responses: bool = True,
+        compress_requests: bool = False,
+        compress_min_size: int = 1024
+    ):
+        self.pool_maxsize: int = pool_maxsize
+        self.pool_connections: int = pool_connections
+        self.pool_block: bool = pool_block
+        self.keep_alive: bool = keep_alive
+        self.keepalive_expiry: float = keepalive_expiry
+        self.connect_timeout: Optional[float] = connect_timeout
+        self.read_timeout: Optional[float] = read_timeout
+        self.http2: bool = http2
+        self.compress_responses: bool = compress_responses
+        self.compress_requests: bool = compress_requests
+        self.compress_min_size: int = compress_min_size
+
+    @property
+    def timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        The ``(connect, read)`` timeout tuple as understood by ``requests``.
+        """
+        return (self.connect_timeout, self.read_timeout)
@@ -0,0 +1,273 @@
+import hashlib
+import mmap
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Union
+
+#: Default size cap of a :class:`DiskCache` in bytes.
+DEFAULT_MAX_SIZE: int = 512 * 1024 * 1024
+
+class CachedFile:
+    """
+    A file held by a :class:`DiskCache`.
+
+    Attributes:
+        path (str): Location of the file. Files are shared between keys with the same content
+            and must not be modified.
+        size (int): Size of the file in bytes.
+        etag (str, optional): ``ETag`` the API sent with the content, if any.
+        last_modified (str, optional): ``Last-Modified`` the API sent with the content, if any.
+    """
+
+    def __init__(self, path: str, size: int, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.path: str = path
+        self.size: int = size
+        self.etag: Optional[str] = etag
+        self.last_modified: Optional[str] = last_modified
+
+    def open(self) -> BinaryIO:
+        """
+        Open the file for reading.
+
+        Raises:
+            FileNotFoundError: If another process sharing the cache evicted the file since it
+                was looked up; treat it as a cache miss.
+        """
+        return open(self.path, "rb")
+
+    def read(self) -> bytes:
+        with self.open() as file:
+            return file.read()
+
+    def map(self) -> memoryview:
+        """
+        Memory-map the file read-only and return a view of it.
+
+        Nothing is copied into the Python heap; pages are loaded by the operating system
+        as they are accessed, and the mapping is released once the view is garbage collected.
+        """
+        if self.size == 0:
+            return memoryview(b"")
+        with self.open() as file:
+            return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Headers that ask the API to answer 304 Not Modified if the content is unchanged.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+class _CacheWriter:
+    """
+    Writes one download into the cache; see :meth:`DiskCache.writer`.
+    """
+
+    def __init__(self, cache: "DiskCache", key: str):
+        self._cache = cache
+        self._key = key
+        self._digest = hashlib.sha256()
+        self._size = 0
+        descriptor, self._partial_path = tempfile.mkstemp(dir=cache._tmp_dir, suffix=".part")
+        self._file = os.fdopen(descriptor, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self._digest.update(chunk)
+        self._size += len(chunk)
+
+    def commit(self, etag: Optional[str] = None, last_modified: Optional[str] = None) -> CachedFile:
+        self._file.close()
+        return self._cache._commit(self._key, self._partial_path, self._digest.hexdigest(), self._size, etag, last_modified)
+
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self._partial_path):
+            os.remove(self._partial_path)
+
+class DiskCache:
+    """
+    Persistent, content-addressed cache for document downloads and page previews.
+
+    The content behind a document ID (and a page ID and scale, for previews) never changes,
+    so once downloaded it is served from disk. Files are stored under the SHA-256 of their
+    content, so a document attached to several signature requests is kept only once.
+    When the total size exceeds ``max_size`` the least recently used entries are removed;
+    the entry just stored is always kept.
+
+    Several processes can share the directory: changes to the index and the files are made in
+    one SQLite write transaction at a time. A file handed out by :meth:`get` can still be evicted
+    by another process before it is opened, which :meth:`CachedFile.open` reports as
+    ``FileNotFoundError``; the download functions then fetch the content again.
+
+    Args:
+        directory (str | os.PathLike): Directory of the cache; created if missing.
+        max_size (int): Size cap in bytes.
+        revalidate (bool): Ask the API with a conditional request whether a cached download is
+            still current instead of trusting it. Only useful if the API sends ``ETag`` or
+            ``Last-Modified`` headers; entries without them are served as they are.
+
+    Example:
+        >>> skribble.init(username, api_key, disk_cache=DiskCache("~/.cache/skribble", max_size=2 * 1024 ** 3))
+        >>> pdf = skribble.document.download_mapped("5c33d0cb-84...")
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"], max_size: int = DEFAULT_MAX_SIZE, revalidate: bool = False):
+        self.directory: str = os.path.abspath(os.path.expanduser(os.fspath(directory)))
+        self.max_size: int = max_size
+        self.revalidate: bool = revalidate
+        self._objects_dir = os.path.join(self.directory, "objects")
+        self._tmp_dir = os.path.join(self.directory, "tmp")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._tmp_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(self.directory, "index.sqlite3"), timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, digest TEXT NOT NULL, size INTEGER NOT NULL, "
+            "etag TEXT, last_modified TEXT, accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest)")
+
+    def get(self, key: str) -> Optional[CachedFile]:
+        """
+        Return the cached file for ``key`` and mark it as recently used, or ``None``.
+        """
+        with self._transaction():
+            row = self._db.execute("SELECT digest, size, etag, last_modified FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            digest, size, etag, last_modified = row
+            path = self._object_path(digest)
+            if not os.path.exists(path):
+                # Removed behind our back, e.g. by another process evicting it
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return CachedFile(path, size, etag, last_modified)
+
+    def writer(self, key: str) -> _CacheWriter:
+        """
+        Start storing content for ``key`` chunk by chunk.
+
+        Call ``write(chunk)`` for every chunk, then ``commit()`` to add the file to the
+        cache or ``abort()`` to discard it.
+        """
+        return _CacheWriter(self, key)
+
+    def put(self, key: str, chunks: Iterable[bytes], etag: Optional[str] = None, last_modified: Optional[str] = None) -> CachedFile:
+        """
+        Store ``chunks`` as the content of ``key`` without holding it in memory as a whole.
+        """
+        writer = self.writer(key)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+        except BaseException:
+            writer.abort()
+            raise
+        return writer.commit(etag, last_modified)
+
+    def discard(self, key: str) -> None:
+        with self._transaction():
+            row = self._db.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._remove_unreferenced(row[0])
+
+    def clear(self) -> None:
+        with self._transaction():
+            digests = [row[0] for row in self._db.execute("SELECT DISTINCT digest FROM entries")]
+            self._db.execute("DELETE FROM entries")
+            for digest in digests:
+                self._remove_unreferenced(digest)
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of the cached files in bytes.
+        """
+        with self._lock:
+            return self._total_size()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _commit(self, key: str, partial_path: str, digest: str, size: int, etag: Optional[str], last_modified: Optional[str]) -> CachedFile:
+        path = self._object_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Object files are only deleted inside a write transaction, so the file found here
+        # cannot disappear before its index entry is written
+        with self._transaction():
+            if os.path.exists(path):
+                # Same content is already stored under another key
+                os.remove(partial_path)
+            else:
+                os.replace(partial_path, path)
+
+            previous = self._db.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, digest, size, etag, last_modified, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, digest, size, etag, last_modified, time.time())
+            )
+            if previous is not None and previous[0] != digest:
+                self._remove_unreferenced(previous[0])
+            self._evict(keep=key)
+        return CachedFile(path, size, etag, last_modified)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """
+        Hold this instance's lock and an immediate write transaction on the index, which
+        serializes the change with other processes sharing the cache.
+        """
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def _evict(self, keep: str) -> None:
+        total = self._total_size()
+        if total <= self.max_size:
+            return
+        for key, digest in self._db.execute("SELECT key, digest FROM entries WHERE key != ? ORDER BY accessed", (keep,)).fetchall():
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= self._remove_unreferenced(digest)
+            if total <= self.max_size:
+                return
+
+    def _total_size(self) -> int:
+        row = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM entries)").fetchone()
+        return row[0]
+
+    def _remove_unreferenced(self, digest: str) -> int:
+        """
+        Delete the file of ``digest`` unless another key still uses it; return the bytes freed.
+        """
+        if self._db.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+            return 0
+        path = self._object_path(digest)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return 0
+        return size
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._objects_dir, digest[:2], digest)
@@ -4,7 +4,11 @@ from .operations import (
     delete,
     add,
     download,
-    preview
+    iter_download,
+    download_to,
+    download_mapped,
+    preview,
+    preview_all
 )
 
 __all__ = [
@@ -13,5 +17,9 @@ __all__ = [
     "delete",
     "add",
     "download",
-    "preview"
+    "iter_download",
+    "download_to",
+    "download_mapped",
+    "preview",
+    "preview_all"
 ]
\ No newline at end of file
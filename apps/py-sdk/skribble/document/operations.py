@@ -1,17 +1,26 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, Iterator, List, Optional, Union
+import functools
 import time
 from ..client_manager import get_client
+from ..streaming import DEFAULT_CHUNK_SIZE, Destination, open_download, cached_download, iter_file, iter_response, write_chunks, extract_content_source, request_payload
+from ..cache import ResponseCache
+from ..disk_cache import CachedFile
+from ..concurrency import DEFAULT_CONCURRENCY, ItemResult, bounded_map
+from ..retry import RetryPolicy
 from ..exceptions import SkribbleValidationError, SkribbleOperationError, SkribbleAPIError
 from ..models import Document, DocumentRequest
+from ..responses import DocumentView
 
-def list(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+def list(limit: Optional[int] = None, typed: bool = False) -> Union[List[Dict[str, Any]], List[DocumentView]]:
     """
     List all documents.
 
     :param limit: The maximum number of documents to return. If None, returns all documents.
     :type limit: Optional[int]
+    :param typed: Return :class:`~skribble.responses.DocumentView` objects instead of dictionaries.
+    :type typed: bool
     :return: A list of documents.
-    :rtype: List[Dict[str, Any]]
+    :rtype: Union[List[Dict[str, Any]], List[DocumentView]]
 
     Example:
         >>> documents = skribble.document.list(limit=5)
@@ -21,24 +30,31 @@ def list(limit: Optional[int] = None) -> List[Dict[str, Any]]:
     response = get_client()._make_request("GET", "/documents")
     
     if limit is not None:
-        return response[:limit]
-    return response
+        response = response[:limit]
+    return [DocumentView(item) for item in response] if typed else response
 
-def get(document_id: str) -> Dict[str, Any]:
+def get(document_id: str, typed: bool = False) -> Union[Dict[str, Any], DocumentView]:
     """
     Get the document metadata.
 
+    Served from the client's :class:`~skribble.cache.ResponseCache` if one is configured.
+    With ``typed=True`` the response is wrapped as it is instead of being validated.
+
     :param document_id: The ID of the document to retrieve.
     :type document_id: str
+    :param typed: Return a :class:`~skribble.responses.DocumentView` instead of a dictionary.
+    :type typed: bool
     :return: The document metadata.
-    :rtype: Dict[str, Any]
+    :rtype: Union[Dict[str, Any], DocumentView]
 
     Example:
         >>> metadata = skribble.document.get("5c33d0cb-84...")
         >>> print(metadata['title'])
         'Sample Document'
     """
-    response = get_client()._make_request("GET", f"/documents/{document_id}")
+    response = get_client()._make_request("GET", f"/documents/{document_id}", cached=True)
+    if typed:
+        return DocumentView(response)
     return Document(**response).model_dump()
 
 def delete(document_id: str) -> Dict[str, Any]:
@@ -61,12 +77,18 @@ def delete(document_id: str) -> Dict[str, Any]:
     except SkribbleAPIError as e:
         return {"status": "error", "message": f"Failed to delete document: {str(e)}"}
 
-def add(document_data: Dict[str, Any]) -> Dict[str, Any]:
+def add(document_data: Dict[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
     """
     Add a new document.
 
+    ``content`` may be a base64 encoded string, a ``pathlib.Path`` or a binary file object.
+    Paths and file objects are base64 encoded incrementally while the request is sent, so
+    the document is never held in memory as a whole.
+
     :param document_data: The document data.
     :type document_data: Dict[str, Any]
+    :param chunk_size: Number of bytes read from a path or file object at a time.
+    :type chunk_size: int
     :return: The created document details.
     :rtype: Dict[str, Any]
 
@@ -79,14 +101,24 @@ def add(document_data: Dict[str, Any]) -> Dict[str, Any]:
         >>> result = skribble.document.add(document_data)
         >>> print(result['id'])
         'doc_789'
+
+        >>> result = skribble.document.add({
+        ...     "title": "Large Document",
+        ...     "content_type": "application/pdf",
+        ...     "content": pathlib.Path("contract.pdf")
+        ... })
     """
+    document_data, content_source = extract_content_source(document_data)
     validated_request = DocumentRequest(**document_data)
-    return get_client()._make_request("POST", "/documents", data=validated_request.model_dump(exclude_none=True))
+    client = get_client()
+    return client._make_request("POST", "/documents", **request_payload(validated_request.model_dump(exclude_none=True), content_source, chunk_size, dumps=client.json_codec.dumps))
 
 def download(document_id: str) -> bytes:
     """
     Download the document content.
 
+    Served from the client's :class:`~skribble.disk_cache.DiskCache` if one is configured.
+
     :param document_id: The ID of the document to download.
     :type document_id: str
     :return: The document content.
@@ -98,12 +130,90 @@ def download(document_id: str) -> bytes:
         12345
     """
     client = get_client()
-    response = client.session.get(f"{client.BASE_URL}/documents/{document_id}/content", headers={"Authorization": f"Bearer {client._authenticate()}"})
+    if client.disk_cache is not None:
+        return cached_download(client, f"/documents/{document_id}/content", "Failed to download document", CachedFile.read)
+
+    response = client._request_raw("GET", f"/documents/{document_id}/content")
     if response.status_code == 200:
         return response.content
     else:
         raise SkribbleAPIError(f"Failed to download document: {response.text}")
 
+def iter_download(document_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Stream the document content in chunks instead of loading it into memory.
+
+    The request is sent immediately, so API errors are raised by this call rather than
+    while iterating.
+
+    :param document_id: The ID of the document to download.
+    :type document_id: str
+    :param chunk_size: Maximum number of bytes per chunk.
+    :type chunk_size: int
+    :return: An iterator over the document content.
+    :rtype: Iterator[bytes]
+    :raises SkribbleAPIError: If the download fails.
+
+    Example:
+        >>> for chunk in skribble.document.iter_download("5c33d0cb-84...", chunk_size=1024 * 1024):
+        ...     archive.write(chunk)
+    """
+    client = get_client()
+    if client.disk_cache is not None:
+        return iter_file(cached_download(client, f"/documents/{document_id}/content", "Failed to download document", CachedFile.open), chunk_size)
+
+    response = open_download(client, f"/documents/{document_id}/content", "Failed to download document")
+    return iter_response(response, chunk_size)
+
+def download_mapped(document_id: str) -> memoryview:
+    """
+    Return the document content as a read-only memory-mapped view of the disk cache.
+
+    The document is downloaded into the cache on first use. The content is not copied
+    into memory, which makes this the cheapest way to serve large documents repeatedly,
+    e.g. by writing the view to a socket.
+
+    :param document_id: The ID of the document to download.
+    :type document_id: str
+    :return: A read-only view of the document content.
+    :rtype: memoryview
+    :raises SkribbleValidationError: If the client has no disk cache.
+    :raises SkribbleAPIError: If the download fails.
+
+    Example:
+        >>> skribble.init(username, api_key, disk_cache=DiskCache("/var/cache/skribble"))
+        >>> view = skribble.document.download_mapped("5c33d0cb-84...")
+        >>> bytes(view[:5])
+        b'%PDF-'
+    """
+    client = get_client()
+    if client.disk_cache is None:
+        raise SkribbleValidationError("download_mapped requires a disk cache. Pass disk_cache=DiskCache(...) to skribble.init().")
+    return cached_download(client, f"/documents/{document_id}/content", "Failed to download document", CachedFile.map)
+
+def download_to(document_id: str, destination: Destination, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream the document content straight into a file path or binary file object.
+
+    At most ``chunk_size`` bytes of the document are held in memory at any time.
+
+    :param document_id: The ID of the document to download.
+    :type document_id: str
+    :param destination: A file path or a binary file object opened for writing.
+    :type destination: Union[str, os.PathLike, BinaryIO]
+    :param chunk_size: Maximum number of bytes per chunk.
+    :type chunk_size: int
+    :return: The number of bytes written.
+    :rtype: int
+    :raises SkribbleAPIError: If the download fails.
+
+    Example:
+        >>> size = skribble.document.download_to("5c33d0cb-84...", "/archive/contract.pdf")
+        >>> print(size)
+        12345
+    """
+    return write_chunks(iter_download(document_id, chunk_size), destination)
+
 def preview(document_id: str, page_id: int, scale: int = 20, max_retries: int = 5, retry_delay: int = 2) -> bytes:
     """
     Get the document page preview with retry mechanism since the preview generation might take some time for newly added documents
@@ -121,32 +231,111 @@ def preview(document_id: str, page_id: int, scale: int = 20, max_retries: int =
     :return: The preview image content.
     :rtype: bytes
 
+    Finished previews are stored in the client's :class:`~skribble.disk_cache.DiskCache`
+    if one is configured.
+
     Example:
         >>> preview = skribble.document.preview("5c33d0cb-84...", page_id=0, scale=20)
         >>> print(len(preview))
         5678
     """
+    return _fetch_preview(get_client(), document_id, page_id, scale, max_retries, lambda attempt, response: retry_delay)
+
+def preview_all(
+    document_id: str,
+    scale: int = 20,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = 10,
+    initial_delay: float = 0.25,
+    max_delay: float = 8.0
+) -> Iterator[ItemResult]:
+    """
+    Get the previews of all pages of a document, fetching up to ``concurrency`` pages at a time.
+
+    The number of pages is taken from :func:`get`. Pages that are still being generated are
+    polled with exponential backoff (starting at ``initial_delay``, at most ``max_delay``
+    seconds, or as long as a ``Retry-After`` header asks), and every page is yielded as soon
+    as it is ready, so results arrive out of order.
+
+    :param document_id: The ID of the document.
+    :type document_id: str
+    :param scale: The scale of the previews (20 for thumbnail, 100 for full size).
+    :type scale: int
+    :param concurrency: Maximum number of pages fetched at the same time.
+    :type concurrency: int
+    :param max_retries: Maximum number of polls per page.
+    :type max_retries: int
+    :param initial_delay: Delay before the first re-poll of a page, in seconds.
+    :type initial_delay: float
+    :param max_delay: Upper bound for a single delay, in seconds.
+    :type max_delay: float
+    :return: One result per page; ``index`` is the page number and ``result`` the image content.
+    :rtype: Iterator[ItemResult]
+    :raises SkribbleOperationError: If the API does not report the number of pages.
+
+    Example:
+        >>> for page in skribble.document.preview_all("5c33d0cb-84...", scale=20):
+        ...     if page.ok:
+        ...         thumbnails[page.index] = page.result
+    """
+    page_count = get(document_id).get("page_count")
+    if page_count is None:
+        raise SkribbleOperationError("preview_all", f"The page count of document {document_id} is not known yet")
+
     client = get_client()
-    url = f"{client.BASE_URL}/documents/{document_id}/pages/{page_id}?scale={scale}"
-    
+    backoff = RetryPolicy(backoff_factor=initial_delay, max_backoff=max_delay)
+    poll_delay = functools.partial(_poll_delay, backoff)
+    return bounded_map(lambda page_id: _fetch_preview(client, document_id, page_id, scale, max_retries, poll_delay), range(page_count), concurrency, ordered=False)
+
+def _poll_delay(backoff: RetryPolicy, attempt: int, response: Any) -> float:
+    """
+    Delay before re-polling a preview that is still being generated.
+
+    Shared by the synchronous and asynchronous ``preview_all``.
+    """
+    retry_after = RetryPolicy.retry_after(response.headers)
+    return retry_after if retry_after is not None else backoff.backoff(attempt)
+
+def _fetch_preview(client: Any, document_id: str, page_id: int, scale: int, max_retries: int, poll_delay: Callable[[int, Any], float]) -> bytes:
+    """
+    Fetch one page preview, polling while it is being generated, and consult the disk cache.
+    """
+    cache_key = ResponseCache.key(f"/documents/{document_id}/pages/{page_id}", {"scale": scale})
+    if client.disk_cache is not None:
+        cached = client.disk_cache.get(cache_key)
+        if cached is not None:
+            try:
+                return cached.read()
+            except FileNotFoundError:
+                # Evicted by another process sharing the cache since the lookup
+                pass
+
     for attempt in range(max_retries):
-        response = client.session.get(url, headers={"Authorization": f"Bearer {client._authenticate()}"})
-        
+        response = client._request_raw("GET", f"/documents/{document_id}/pages/{page_id}", params={"scale": scale})
+
         if response.status_code == 200:
-            content_type = response.headers.get('Content-Type')
-            if content_type in ['image/png', 'image/webp']:
-                if response.content:
-                    return response.content
-                else:
-                    raise SkribbleAPIError("Received empty response for document preview")
-            else:
-                raise SkribbleAPIError(f"Unexpected content type: {content_type}")
+            return _preview_content(client, cache_key, response)
         elif response.status_code == 202:
-            # If the response status is 202, it means the preview image is still generating
-            # Wait for the specified retry_delay and try again
-            time.sleep(retry_delay)
+            # The preview image is still being generated; wait and poll again
+            if attempt + 1 < max_retries:
+                time.sleep(poll_delay(attempt, response))
         else:
             error_message = response.text if response.text else "No error message provided"
             raise SkribbleAPIError(f"Failed to get document preview. Status code: {response.status_code}. Error: {error_message}")
-    
-    raise SkribbleAPIError(f"Failed to get document preview after {max_retries} attempts")
\ No newline at end of file
+
+    raise SkribbleAPIError(f"Failed to get document preview after {max_retries} attempts")
+
+def _preview_content(client: Any, cache_key: str, response: Any) -> bytes:
+    """
+    Check a finished preview response and store it in the disk cache.
+
+    Shared by the synchronous and asynchronous preview operations.
+    """
+    content_type = response.headers.get('Content-Type')
+    if content_type not in ['image/png', 'image/webp']:
+        raise SkribbleAPIError(f"Unexpected content type: {content_type}")
+    if not response.content:
+        raise SkribbleAPIError("Received empty response for document preview")
+    if client.disk_cache is not None:
+        client.disk_cache.put(cache_key, [response.content])
+    return response.content
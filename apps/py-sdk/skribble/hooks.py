@@ -0,0 +1,203 @@
+import logging
+import time
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Path segment following a collection, and the placeholder it is reported as
+_ID_PLACEHOLDERS: Dict[str, str] = {
+    "signature-requests": "{signature_request_id}",
+    "signatures": "{signer_id}",
+    "attachments": "{attachment_id}",
+    "documents": "{document_id}",
+    "pages": "{page_id}"
+}
+
+# Action segments that follow an ID and are kept as they are
+_ACTIONS = frozenset(["content", "remind", "withdraw", "signatures", "attachments", "pages"])
+
+_OPERATIONS: Dict[Tuple[str, str], str] = {
+    ("POST", "/access/login"): "auth.login",
+    ("POST", "/signature-requests"): "signature_request.create",
+    ("GET", "/signature-requests"): "signature_request.list",
+    ("PUT", "/signature-requests"): "signature_request.update",
+    ("GET", "/signature-requests/{signature_request_id}"): "signature_request.get",
+    ("DELETE", "/signature-requests/{signature_request_id}"): "signature_request.delete",
+    ("POST", "/signature-requests/{signature_request_id}/signatures"): "signature_request.add_signer",
+    ("DELETE", "/signature-requests/{signature_request_id}/signatures/{signer_id}"): "signature_request.remove_signer",
+    ("POST", "/signature-requests/{signature_request_id}/remind"): "signature_request.remind",
+    ("POST", "/signature-requests/{signature_request_id}/withdraw"): "signature_request.withdraw",
+    ("POST", "/signature-requests/{signature_request_id}/attachments"): "attachment.add",
+    ("GET", "/signature-requests/{signature_request_id}/attachments/{attachment_id}/content"): "attachment.download",
+    ("DELETE", "/signature-requests/{signature_request_id}/attachments/{attachment_id}"): "attachment.delete",
+    ("GET", "/documents"): "document.list",
+    ("POST", "/documents"): "document.add",
+    ("GET", "/documents/{document_id}"): "document.get",
+    ("DELETE", "/documents/{document_id}"): "document.delete",
+    ("GET", "/documents/{document_id}/content"): "document.download",
+    ("GET", "/documents/{document_id}/pages/{page_id}"): "document.preview",
+    ("POST", "/seal"): "seal.create"
+}
+
+class RequestInfo(NamedTuple):
+    """
+    One attempt of an API request, as reported to :class:`RequestHooks`.
+
+    ``status_code``, ``response_bytes`` and ``duration`` are ``None`` until a response
+    arrives (``duration`` is also set when the attempt fails). ``response_bytes`` is the
+    ``Content-Length`` of a streamed download, whose body has not been read yet, and
+    ``None`` if the server did not send one.
+    """
+    operation: str
+    method: str
+    endpoint: str
+    path: str
+    attempt: int
+    request_bytes: Optional[int]
+    status_code: Optional[int] = None
+    response_bytes: Optional[int] = None
+    duration: Optional[float] = None
+
+class RequestHooks:
+    """
+    Receives the lifecycle events of the requests a client sends, e.g. to feed metrics.
+
+    Subclass it, override the events of interest and pass instances to the client as
+    ``hooks``. Every attempt is reported, so a call that is retried twice produces three
+    ``before_request`` events. Reads served from the response cache send no request and
+    produce no events.
+
+    Hooks run inline on the calling thread or event loop and should return quickly. An
+    exception raised by a hook is logged and does not affect the request.
+
+    Example:
+        >>> class Timings(RequestHooks):
+        ...     def after_response(self, info):
+        ...         histogram.labels(info.operation, info.status_code).observe(info.duration)
+        >>> skribble.init(username, api_key, hooks=[Timings()])
+    """
+
+    def before_request(self, info: RequestInfo) -> None:
+        """
+        Called before an attempt is sent.
+        """
+
+    def after_response(self, info: RequestInfo) -> None:
+        """
+        Called when an attempt received a response, whatever its status code.
+        """
+
+    def on_error(self, info: RequestInfo, error: BaseException) -> None:
+        """
+        Called when an attempt failed without a response, e.g. on a connection error or timeout.
+        """
+
+    def on_retry(self, info: RequestInfo, delay: float) -> None:
+        """
+        Called when the failed attempt ``info`` is retried after ``delay`` seconds.
+        """
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replace the IDs in an API path with named placeholders, e.g.
+    ``/documents/abc/content`` becomes ``/documents/{document_id}/content``.
+    """
+    segments = endpoint.split("?", 1)[0].split("/")
+    for index in range(2, len(segments)):
+        placeholder = _ID_PLACEHOLDERS.get(segments[index - 1])
+        if placeholder is not None and segments[index] not in _ACTIONS:
+            segments[index] = placeholder
+    return "/".join(segments)
+
+def operation_name(method: str, template: str) -> str:
+    """
+    Name of the SDK operation sending ``method`` to the endpoint ``template``, such as
+    ``document.download``, or ``"<METHOD> <template>"`` for an endpoint without a name.
+    """
+    method = method.upper()
+    return _OPERATIONS.get((method, template)) or f"{method} {template}"
+
+def body_size(body: Any) -> Optional[int]:
+    """
+    Number of bytes in a request body, or ``None`` if it is streamed with an unknown length.
+    """
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return getattr(body, "content_length", None)
+
+class RequestObserver:
+    """
+    Reports the attempts of one request to the client's hooks.
+
+    The clients create one per request through :func:`observe`, which returns a no-op
+    observer when no hooks are registered.
+    """
+    __slots__ = ("_hooks", "_operation", "_method", "_template", "_path", "_request_bytes", "_info", "_started")
+
+    def __init__(self, hooks: Sequence[RequestHooks], method: str, endpoint: str, request_bytes: Optional[int]):
+        self._hooks = hooks
+        self._method = method.upper()
+        self._template = endpoint_template(endpoint)
+        self._operation = operation_name(self._method, self._template)
+        self._path = endpoint
+        self._request_bytes = request_bytes
+        self._info: Optional[RequestInfo] = None
+        self._started = 0.0
+
+    def start(self, attempt: int) -> None:
+        self._info = RequestInfo(self._operation, self._method, self._template, self._path, attempt, self._request_bytes)
+        self._emit("before_request", self._info)
+        self._started = time.perf_counter()
+
+    def response(self, response: Any, stream: bool = False) -> None:
+        duration = time.perf_counter() - self._started
+        self._info = self._info._replace(status_code=response.status_code, response_bytes=_response_size(response, stream), duration=duration)
+        self._emit("after_response", self._info)
+
+    def error(self, error: BaseException) -> None:
+        self._info = self._info._replace(duration=time.perf_counter() - self._started)
+        self._emit("on_error", self._info, error)
+
+    def retry(self, delay: float) -> None:
+        self._emit("on_retry", self._info, delay)
+
+    def _emit(self, event: str, *args: Any) -> None:
+        for hook in self._hooks:
+            try:
+                getattr(hook, event)(*args)
+            except Exception:
+                logger.exception("Request hook %r failed in %s", hook, event)
+
+class _NoObserver:
+    __slots__ = ()
+
+    def start(self, attempt: int) -> None:
+        pass
+
+    def response(self, response: Any, stream: bool = False) -> None:
+        pass
+
+    def error(self, error: BaseException) -> None:
+        pass
+
+    def retry(self, delay: float) -> None:
+        pass
+
+_NO_OBSERVER = _NoObserver()
+
+def observe(hooks: Sequence[RequestHooks], method: str, endpoint: str, body: Any = None) -> Any:
+    """
+    Return a :class:`RequestObserver` for a request, or a shared no-op observer if there
+    are no ``hooks``.
+    """
+    if not hooks:
+        return _NO_OBSERVER
+    return RequestObserver(hooks, method, endpoint, body_size(body))
+
+def _response_size(response: Any, stream: bool) -> Optional[int]:
+    if not stream:
+        return len(response.content)
+    length = response.headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
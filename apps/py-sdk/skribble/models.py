@@ -1,8 +1,30 @@
-from typing import List, Optional, Literal, Dict
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Optional, Literal, Dict, Tuple
 from pydantic import BaseModel, Field, HttpUrl, EmailStr, validator, model_validator
-from difflib import get_close_matches
 from .exceptions import SkribbleValidationError
 
+@lru_cache(maxsize=None)
+def _field_names(model: type) -> FrozenSet[str]:
+    return frozenset(model.model_fields)
+
+def _unknown_field(model: type, values: Any) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Return the first key of ``values`` that is not a field of ``model`` and the closest
+    field name, if any, or ``None`` if all keys are fields.
+
+    The field names are computed once per model and close matches are only searched for
+    once an unknown key has been found, so a valid payload costs a single set comparison.
+    """
+    if not isinstance(values, dict):
+        return None
+    field_names = _field_names(model)
+    if field_names.issuperset(values):
+        return None
+    field = next(field for field in values if field not in field_names)
+    from difflib import get_close_matches
+    close_matches = get_close_matches(field, model.model_fields.keys(), n=1, cutoff=0.6)
+    return field, close_matches[0] if close_matches else None
+
 class AuthRequest(BaseModel):
     username: str = Field(..., description="API username")
     api_key: str = Field(..., alias="api-key", description="API key")
@@ -16,14 +38,13 @@ class SignerIdentityData(BaseModel):
 
     @model_validator(mode='before')
     def check_fields(cls, values):
-        valid_fields = cls.model_fields.keys()
-        for field in values:
-            if field not in valid_fields:
-                close_matches = get_close_matches(field, valid_fields, n=1, cutoff=0.6)
-                if close_matches:
-                    raise ValueError(f"Invalid field '{field}'. Did you mean '{close_matches[0]}'?")
-                else:
-                    raise ValueError(f"Invalid field '{field}'. Valid fields are: {', '.join(valid_fields)}")
+        unknown = _unknown_field(cls, values)
+        if unknown is not None:
+            field, close_match = unknown
+            if close_match:
+                raise ValueError(f"Invalid field '{field}'. Did you mean '{close_match}'?")
+            else:
+                raise ValueError(f"Invalid field '{field}'. Valid fields are: {', '.join(cls.model_fields.keys())}")
         return values
 
 class Image(BaseModel):
@@ -118,14 +139,14 @@ class SignatureRequest(BaseModel):
 
     @model_validator(mode='before')
     def check_fields(cls, values):
-        valid_fields = cls.model_fields.keys()
-        for field in values:
-            if field not in valid_fields:
-                close_matches = get_close_matches(field, valid_fields, n=1, cutoff=0.6)
-                if close_matches:
-                    raise SkribbleValidationError(f"Invalid field '{field}'. Did you mean '{close_matches[0]}'?", errors=[{"field": field, "message": f"Invalid field. Did you mean '{close_matches[0]}'?"}])
-                else:
-                    raise SkribbleValidationError(f"Invalid field '{field}'. Valid fields are: {', '.join(valid_fields)}", errors=[{"field": field, "message": f"Invalid field. Valid fields are: {', '.join(valid_fields)}"}])
+        unknown = _unknown_field(cls, values)
+        if unknown is not None:
+            field, close_match = unknown
+            valid_fields = cls.model_fields.keys()
+            if close_match:
+                raise SkribbleValidationError(f"Invalid field '{field}'. Did you mean '{close_match}'?", errors=[{"field": field, "message": f"Invalid field. Did you mean '{close_match}'?"}])
+            else:
+                raise SkribbleValidationError(f"Invalid field '{field}'. Valid fields are: {', '.join(valid_fields)}", errors=[{"field": field, "message": f"Invalid field. Valid fields are: {', '.join(valid_fields)}"}])
         return values
 
     @model_validator(mode='after')
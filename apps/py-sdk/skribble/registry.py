@@ -0,0 +1,122 @@
+import threading
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from .client import SkribbleClient
+from .client_manager import use_client
+from .exceptions import SkribbleValidationError
+
+class _BaseClientRegistry:
+    _client_class: Callable[..., Any]
+    _use_client: Callable[[Any], AbstractContextManager]
+
+    def __init__(self, **client_options):
+        self._client_options: Dict[str, Any] = client_options
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def register(self, tenant: str, username: Optional[str] = None, api_key: Optional[str] = None, access_token: Optional[str] = None, **client_options) -> Any:
+        """
+        Create a client for ``tenant`` and add it to the registry.
+
+        The client logs in lazily on its first request. ``client_options`` override the
+        registry-wide defaults for this tenant only.
+
+        Raises:
+            SkribbleValidationError: If no credentials are given or the tenant is already registered.
+        """
+        if not (access_token or (username and api_key)):
+            raise SkribbleValidationError("Either (username, api_key) or access_token must be provided")
+        options = {**self._client_options, **client_options}
+        return self.add(tenant, self._client_class(username=username, api_key=api_key, access_token=access_token, **options))
+
+    def add(self, tenant: str, client: Any) -> Any:
+        """
+        Add an existing client for ``tenant``.
+        """
+        with self._lock:
+            if tenant in self._clients:
+                raise SkribbleValidationError(f"Tenant '{tenant}' is already registered")
+            self._clients[tenant] = client
+        return client
+
+    def get(self, tenant: str) -> Any:
+        """
+        Return the client of ``tenant``.
+
+        Raises:
+            SkribbleValidationError: If the tenant is not registered.
+        """
+        try:
+            return self._clients[tenant]
+        except KeyError:
+            raise SkribbleValidationError(f"Tenant '{tenant}' is not registered") from None
+
+    def use(self, tenant: str) -> AbstractContextManager:
+        """
+        Route SDK operations in the current context through the client of ``tenant``.
+        """
+        return self._use_client(self.get(tenant))
+
+    def _pop(self, tenant: Optional[str] = None) -> List[Any]:
+        with self._lock:
+            if tenant is None:
+                clients = list(self._clients.values())
+                self._clients.clear()
+                return clients
+            if tenant not in self._clients:
+                raise SkribbleValidationError(f"Tenant '{tenant}' is not registered")
+            return [self._clients.pop(tenant)]
+
+    @property
+    def tenants(self) -> List[str]:
+        return list(self._clients)
+
+    def __contains__(self, tenant: object) -> bool:
+        return tenant in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tenants)
+
+class ClientRegistry(_BaseClientRegistry):
+    """
+    A set of :class:`SkribbleClient` instances, one per tenant.
+
+    Each client keeps its own connection pool and access token, so requests for
+    different Skribble accounts never wait for each other. Combine it with
+    :meth:`use` to run the module-level operations for a given tenant.
+
+    Args:
+        **client_options: Default keyword arguments for every client, e.g. ``config`` or ``retry_policy``.
+
+    Example:
+        >>> tenants = skribble.ClientRegistry(config=ClientConfig(pool_maxsize=8))
+        >>> tenants.register("acme", username="api_acme", api_key="...")
+        >>> with tenants.use("acme"):
+        ...     skribble.signature_request.list()
+    """
+
+    _client_class = SkribbleClient
+    _use_client = staticmethod(use_client)
+
+    def remove(self, tenant: str) -> None:
+        """
+        Remove ``tenant`` and close its connection pool.
+        """
+        for client in self._pop(tenant):
+            client.close()
+
+    def close(self) -> None:
+        """
+        Remove all tenants and close their connection pools.
+        """
+        for client in self._pop():
+            client.close()
+
+    def __enter__(self) -> "ClientRegistry":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,165 @@
+from typing import Any, Dict, Generic, Optional, Tuple, Type, TypeVar, overload
+
+T = TypeVar("T")
+V = TypeVar("V", bound="ResponseView")
+
+class _Field(Generic[T]):
+    """
+    A top-level key of the response, read from the wrapped dict on access.
+    """
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> "_Field[T]": ...
+    @overload
+    def __get__(self, instance: "ResponseView", owner: Optional[type] = None) -> T: ...
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance._data.get(self.name)
+
+class _Views(Generic[V]):
+    """
+    A list of nested objects, wrapped in views the first time it is accessed.
+    """
+    __slots__ = ("name", "view")
+
+    def __init__(self, view: Type[V]):
+        self.view = view
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> "_Views[V]": ...
+    @overload
+    def __get__(self, instance: "ResponseView", owner: Optional[type] = None) -> Tuple[V, ...]: ...
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if instance._nested is None:
+            instance._nested = {}
+        views = instance._nested.get(self.name)
+        if views is None:
+            views = instance._nested[self.name] = tuple(self.view(item) for item in instance._data.get(self.name) or ())
+        return views
+
+class ResponseView:
+    """
+    Read-only, typed view of an API response.
+
+    Wraps the decoded JSON without copying or validating it: fields are read from the
+    response when accessed, and nested lists such as ``signatures`` are only wrapped on
+    first access. Views use ``__slots__``, so each one costs a few dozen bytes on top of the
+    response itself. Fields the API did not send read as ``None``; keys without an
+    attribute are available with ``view["key"]``.
+    """
+    __slots__ = ("_data", "_nested")
+    _repr_fields: Tuple[str, ...] = ("id",)
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data: Dict[str, Any] = data
+        self._nested: Optional[Dict[str, Tuple[Any, ...]]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the underlying response. It is not a copy.
+        """
+        return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._data == other._data
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={self._data.get(name)!r}" for name in self._repr_fields)
+        return f"{type(self).__name__}({fields})"
+
+class SignatureView(ResponseView):
+    """
+    A signer of a signature request, see :class:`SignatureRequestView`.
+    """
+    __slots__ = ()
+    _repr_fields = ("sid", "status_code")
+
+    sid: _Field[str] = _Field()
+    account_email: _Field[Optional[str]] = _Field()
+    signer_identity_data: _Field[Optional[Dict[str, Any]]] = _Field()
+    sequence: _Field[Optional[int]] = _Field()
+    status_code: _Field[Optional[str]] = _Field()
+    notify: _Field[Optional[bool]] = _Field()
+    signed_at: _Field[Optional[str]] = _Field()
+    signed_quality: _Field[Optional[str]] = _Field()
+    signed_legislation: _Field[Optional[str]] = _Field()
+    last_viewed_at: _Field[Optional[str]] = _Field()
+
+class AttachmentView(ResponseView):
+    """
+    An attachment of a signature request.
+    """
+    __slots__ = ()
+    _repr_fields = ("attachment_id", "filename")
+
+    attachment_id: _Field[str] = _Field()
+    filename: _Field[Optional[str]] = _Field()
+    content_type: _Field[Optional[str]] = _Field()
+
+class SignatureRequestView(ResponseView):
+    """
+    A signature request as returned by the API.
+
+    Example:
+        >>> request = skribble.signature_request.get("5c33d0cb-84...", typed=True)
+        >>> print(request.status_overall, [signer.status_code for signer in request.signatures])
+    """
+    __slots__ = ()
+    _repr_fields = ("id", "title", "status_overall")
+
+    id: _Field[str] = _Field()
+    title: _Field[str] = _Field()
+    message: _Field[Optional[str]] = _Field()
+    document_id: _Field[str] = _Field()
+    legislation: _Field[Optional[str]] = _Field()
+    quality: _Field[Optional[str]] = _Field()
+    signing_url: _Field[Optional[str]] = _Field()
+    status_overall: _Field[Optional[str]] = _Field()
+    signatures: _Views[SignatureView] = _Views(SignatureView)
+    attachments: _Views[AttachmentView] = _Views(AttachmentView)
+    cc_email_addresses: _Field[Optional[list]] = _Field()
+    owner: _Field[str] = _Field()
+    read_access: _Field[Optional[list]] = _Field()
+    write_access: _Field[Optional[list]] = _Field()
+    created_at: _Field[Optional[str]] = _Field()
+    updated_at: _Field[Optional[str]] = _Field()
+
+class DocumentView(ResponseView):
+    """
+    Metadata of a document as returned by the API.
+    """
+    __slots__ = ()
+    _repr_fields = ("id", "title")
+
+    id: _Field[str] = _Field()
+    parent_id: _Field[Optional[str]] = _Field()
+    title: _Field[str] = _Field()
+    content_type: _Field[str] = _Field()
+    size: _Field[int] = _Field()
+    page_count: _Field[Optional[int]] = _Field()
+    page_width: _Field[Optional[int]] = _Field()
+    page_height: _Field[Optional[int]] = _Field()
+    owner: _Field[str] = _Field()
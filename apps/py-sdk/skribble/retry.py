@@ -0,0 +1,126 @@
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Mapping, Optional
+
+#: HTTP methods that can be repeated without changing the result.
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+#: Status codes that indicate a transient failure.
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Transient failures (the status codes in ``retry_statuses`` and connection errors) are
+    retried with exponential backoff and full jitter, honoring ``Retry-After`` when the
+    API sends it. Only idempotent methods are retried unless ``retry_non_idempotent`` is
+    set, because repeating e.g. a POST could create a signature request twice. All attempts
+    of one call, including the waits between them, must fit into ``total_timeout``.
+
+    Args:
+        max_retries (int): Maximum number of retries after the first attempt. 0 disables retries.
+        backoff_factor (float): Base delay in seconds, doubled with every retry.
+        max_backoff (float): Upper bound for a single delay in seconds.
+        total_timeout (float, optional): Time budget in seconds for all attempts of one call.
+        retry_statuses (Iterable[int]): Status codes that are retried.
+        retry_non_idempotent (bool): Also retry POST requests.
+        respect_retry_after (bool): Wait as long as the ``Retry-After`` header asks.
+        jitter (bool): Randomize delays to avoid synchronized retries from many workers.
+
+    Example:
+        >>> skribble.init(username, api_key, retry_policy=RetryPolicy(max_retries=5, total_timeout=120))
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        total_timeout: Optional[float] = 60.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        retry_non_idempotent: bool = False,
+        respect_retry_after: bool = True,
+        jitter: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_retries: int = max_retries
+        self.backoff_factor: float = backoff_factor
+        self.max_backoff: float = max_backoff
+        self.total_timeout: Optional[float] = total_timeout
+        self.retry_statuses: frozenset = frozenset(retry_statuses)
+        self.retry_non_idempotent: bool = retry_non_idempotent
+        self.respect_retry_after: bool = respect_retry_after
+        self.jitter: bool = jitter
+        self._clock: Callable[[], float] = clock
+
+    def start(self) -> float:
+        """
+        Return the start time of a call, to be passed to :meth:`next_delay`.
+        """
+        return self._clock()
+
+    def allows(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """
+        Whether requests with ``method`` may be retried at all.
+
+        ``idempotent`` overrides the method-based default for a single call.
+        """
+        if self.max_retries <= 0:
+            return False
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return idempotent or self.retry_non_idempotent
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def next_delay(self, attempt: int, started: float, headers: Optional[Mapping[str, str]] = None) -> Optional[float]:
+        """
+        Return how long to wait before retry number ``attempt + 1``, or ``None`` to give up.
+
+        Args:
+            attempt (int): Number of retries already made for this call.
+            started (float): Value returned by :meth:`start` for this call.
+            headers (Mapping[str, str], optional): Headers of the failed response, if any.
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        delay = self.backoff(attempt)
+        retry_after = self.retry_after(headers) if self.respect_retry_after and headers else None
+        if retry_after is not None:
+            delay = retry_after
+
+        if self.total_timeout is not None and self._clock() - started + delay > self.total_timeout:
+            return None
+        return delay
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Exponential backoff for retry number ``attempt + 1``, with full jitter if enabled.
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Parse a ``Retry-After`` header given in seconds or as an HTTP date.
+        """
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
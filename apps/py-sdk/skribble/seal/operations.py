@@ -1,14 +1,20 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from ..client_manager import get_client
 from ..exceptions import SkribbleValidationError, SkribbleAPIError
 from ..models import Seal
+from ..streaming import DEFAULT_CHUNK_SIZE, ContentSource, extract_content_source, request_payload
 
-def create(seal_data: Dict[str, Any]) -> Dict[str, Any]:
+def create(seal_data: Dict[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
     """
     Create a seal for a document.
 
+    ``content`` may be a base64 encoded string, a ``pathlib.Path`` or a binary file object.
+    Paths and file objects are base64 encoded incrementally while the request is sent.
+
     :param seal_data: The seal data.
     :type seal_data: Dict[str, Any]
+    :param chunk_size: Number of bytes read from a path or file object at a time.
+    :type chunk_size: int
     :return: The created seal details.
     :rtype: Dict[str, Any]
     :raises SkribbleValidationError: If the input data is invalid.
@@ -25,24 +31,28 @@ def create(seal_data: Dict[str, Any]) -> Dict[str, Any]:
         >>> print(result)
         {'document_id': '5c33d0cb-84...', 'status': 'success'}
     """
+    seal_data, content_source = extract_content_source(seal_data)
     try:
         validated_seal = Seal(**seal_data)
     except ValueError as e:
         raise SkribbleValidationError("Invalid seal data", str(e))
     
     try:
-        return get_client()._make_request("POST", "/seal", data=validated_seal.model_dump(exclude_none=True))
+        client = get_client()
+        return client._make_request("POST", "/seal", **request_payload(validated_seal.model_dump(exclude_none=True), content_source, chunk_size, dumps=client.json_codec.dumps))
     except SkribbleAPIError as e:
         raise SkribbleAPIError(f"Failed to create seal: {str(e)}")
 
-def create_specific(content: str, account_name: Optional[str] = None) -> Dict[str, Any]:
+def create_specific(content: Union[str, ContentSource], account_name: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
     """
     Create a seal for a document with a specific seal.
 
-    :param content: Base64 encoded PDF file.
-    :type content: str
+    :param content: Base64 encoded PDF file, or a ``pathlib.Path``/binary file object to stream it from.
+    :type content: Union[str, os.PathLike, BinaryIO]
     :param account_name: The name of the account Skribble set up for your organization seal.
     :type account_name: Optional[str]
+    :param chunk_size: Number of bytes read from a path or file object at a time.
+    :type chunk_size: int
     :return: The created seal details.
     :rtype: Dict[str, Any]
     :raises SkribbleValidationError: If the input data is invalid.
@@ -58,12 +68,14 @@ def create_specific(content: str, account_name: Optional[str] = None) -> Dict[st
         "content": content,
         "account_name": account_name
     }
+    seal_data, content_source = extract_content_source(seal_data)
     try:
         validated_seal = Seal(**seal_data)
     except ValueError as e:
         raise SkribbleValidationError("Invalid seal data", str(e))
     
     try:
-        return get_client()._make_request("POST", "/seal", data=validated_seal.model_dump(exclude_none=True))
+        client = get_client()
+        return client._make_request("POST", "/seal", **request_payload(validated_seal.model_dump(exclude_none=True), content_source, chunk_size, dumps=client.json_codec.dumps))
     except SkribbleAPIError as e:
         raise SkribbleAPIError(f"Failed to create specific seal: {str(e)}")
\ No newline at end of file
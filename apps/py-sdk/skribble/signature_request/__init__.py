@@ -1,27 +1,37 @@
 from .operations import (
     create,
+    create_many,
     get,
     delete,
     list,
+    iter_all,
     update,
     add_signer,
     remove_signer,
     replace_signers,
+    update_signers,
     remind,
     withdraw,
-    get_attachment
+    get_attachment,
+    iter_attachment,
+    get_attachment_to
 )
 
 __all__ = [
     "create",
+    "create_many",
     "get",
     "delete",
     "list",
+    "iter_all",
     "update",
     "add_signer",
     "remove_signer",
     "replace_signers",
+    "update_signers",
     "remind",
     "withdraw",
-    "get_attachment"
+    "get_attachment",
+    "iter_attachment",
+    "get_attachment_to"
 ]
\ No newline at end of file
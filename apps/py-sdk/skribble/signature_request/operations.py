@@ -1,15 +1,26 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union
 from ..models import SignatureRequest, Signature, SignerIdentityData
+from ..responses import SignatureRequestView
 from ..client_manager import get_client
+from ..streaming import DEFAULT_CHUNK_SIZE, Destination, open_download, iter_response, write_chunks, extract_content_source, request_payload
+from ..concurrency import DEFAULT_CONCURRENCY, ItemResult, bounded_map
 from ..exceptions import SkribbleValidationError, SkribbleAPIError, SkribbleOperationError
 from pydantic import ValidationError
 
-def create(signature_request: Dict[str, Any]) -> Dict[str, Any]:
+_ALREADY_SIGNED = "One of the signers has already signed the document"
+_CANNOT_REPLACE_SIGNED = "Cannot replace signers: One or more signers have already signed the document"
+
+def create(signature_request: Dict[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
     """
     Create a new signature request.
 
+    ``content`` may be a base64 encoded string, a ``pathlib.Path`` or a binary file object.
+    Paths and file objects are base64 encoded incrementally while the request is sent.
+
     :param signature_request: The signature request data.
     :type signature_request: Dict[str, Any]
+    :param chunk_size: Number of bytes read from a path or file object at a time.
+    :type chunk_size: int
     :return: The created signature request details.
     :rtype: Dict[str, Any]
     :raises SkribbleValidationError: If the input data is invalid.
@@ -25,41 +36,96 @@ def create(signature_request: Dict[str, Any]) -> Dict[str, Any]:
         >>> print(result['id'])
         '5c33d0cb-84...'
     """
+    signature_request, content_source = extract_content_source(signature_request)
+    validated_request = _validate_signature_request(signature_request)
+    client = get_client()
+    return client._make_request("POST", "/signature-requests", **request_payload(validated_request, content_source, chunk_size, dumps=client.json_codec.dumps))
+
+def create_many(
+    signature_requests: Iterable[Dict[str, Any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[ItemResult]:
+    """
+    Create many signature requests, up to ``concurrency`` at a time.
+
+    Each request is validated and submitted like :func:`create`. ``signature_requests`` is
+    read lazily, so a generator can feed a batch of any size without holding it in memory.
+    A failing item does not stop the batch: its exception is reported in the result.
+
+    :param signature_requests: The signature request data, e.g. a generator.
+    :type signature_requests: Iterable[Dict[str, Any]]
+    :param concurrency: Maximum number of requests in flight.
+    :type concurrency: int
+    :param ordered: Yield results in input order; ``False`` yields them as they complete.
+    :type ordered: bool
+    :param chunk_size: Number of bytes read from a path or file object at a time.
+    :type chunk_size: int
+    :return: One result per input item with ``index``, ``item``, ``result`` and ``error``.
+    :rtype: Iterator[ItemResult]
+    :raises SkribbleValidationError: If ``concurrency`` is less than 1.
+
+    Example:
+        >>> for outcome in skribble.signature_request.create_many(contracts(), concurrency=16):
+        ...     if outcome.ok:
+        ...         print(outcome.result['id'])
+        ...     else:
+        ...         print(f"Contract {outcome.index} failed: {outcome.error}")
+    """
+    return bounded_map(lambda signature_request: create(signature_request, chunk_size), signature_requests, concurrency, ordered)
+
+def _validate_signature_request(signature_request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a signature request payload and return the body to send to the API.
+
+    Shared by the synchronous and asynchronous ``create`` operations.
+    """
     try:
-        # Validate signatures separately
+        # Validate signatures separately, so a bad signer gets its own error message
         validated_signatures = []
         for signature in signature_request.get('signatures', []):
             try:
-                validated_signature = Signature(**signature)
-                validated_signatures.append(validated_signature.model_dump(exclude_none=True))
+                validated_signatures.append(Signature(**signature))
             except ValidationError as e:
                 raise SkribbleValidationError(f"Invalid signature data: {e}")
 
-        # Replace the original signatures with validated ones
-        signature_request['signatures'] = validated_signatures
-
-        # Validate the entire signature request
-        validated_request = SignatureRequest(**signature_request)
+        # Validate the entire signature request. The signatures are passed as models,
+        # which are taken as they are instead of being dumped and validated again.
+        validated_request = SignatureRequest(**{**signature_request, 'signatures': validated_signatures})
     except ValidationError as e:
         raise SkribbleValidationError("Invalid signature request data", e.errors())
-    
-    return get_client()._make_request("POST", "/signature-requests", data=validated_request.model_dump(exclude_none=True, by_alias=True))
 
-def get(signature_request_id: str) -> Dict[str, Any]:
+    return validated_request.model_dump(exclude_none=True, by_alias=True)
+
+def _ensure_not_signed(signature_request: Dict[str, Any], operation: str, message: str) -> None:
+    """
+    Raise if any signer of the given signature request has already signed.
+    """
+    for signer in signature_request.get('signatures', []):
+        if signer.get('status_code') == 'SIGNED':
+            raise SkribbleOperationError(operation, message, None)
+
+def get(signature_request_id: str, typed: bool = False) -> Union[Dict[str, Any], SignatureRequestView]:
     """
     Get details of a specific signature request.
 
+    Served from the client's :class:`~skribble.cache.ResponseCache` if one is configured.
+
     :param signature_request_id: The ID of the signature request to retrieve.
     :type signature_request_id: str
+    :param typed: Return a :class:`~skribble.responses.SignatureRequestView` instead of a dictionary.
+    :type typed: bool
     :return: The signature request details.
-    :rtype: Dict[str, Any]
+    :rtype: Union[Dict[str, Any], SignatureRequestView]
 
     Example:
         >>> details = skribble.signature_request.get("5c33d0cb-84...")
         >>> print(details['title'])
         'Test Request'
     """
-    return get_client()._make_request("GET", f"/signature-requests/{signature_request_id}")
+    response = get_client()._make_request("GET", f"/signature-requests/{signature_request_id}", cached=True)
+    return SignatureRequestView(response) if typed else response
 
 def delete(signature_request_id: str) -> Dict[str, Any]:
     """
@@ -87,11 +153,14 @@ def list(
     signature_status: Optional[str] = None,
     status_overall: Optional[str] = None,
     page_number: Optional[int] = None,
-    page_size: int = 50
-) -> List[Dict[str, Any]]:
+    page_size: int = 50,
+    typed: bool = False
+) -> Union[List[Dict[str, Any]], List[SignatureRequestView]]:
     """
     List signature requests with optional filtering and pagination.
 
+    Filtering and pagination are applied by the API, so only the requested page is transferred.
+
     :param account_email: Filter on the field signatures[].account_email
     :type account_email: Optional[str]
     :param search: Filter on the field title to search for documents containing the search term
@@ -104,8 +173,10 @@ def list(
     :type page_number: Optional[int]
     :param page_size: Number of items per page (must be greater than or equal to 0, default is 50)
     :type page_size: int
+    :param typed: Return :class:`~skribble.responses.SignatureRequestView` objects instead of dictionaries.
+    :type typed: bool
     :return: A list of signature request details.
-    :rtype: List[Dict[str, Any]]
+    :rtype: Union[List[Dict[str, Any]], List[SignatureRequestView]]
 
     Example:
         >>> requests = skribble.signature_request.list(
@@ -118,22 +189,85 @@ def list(
         >>> print(len(requests))
         10
     """
+    params = _list_params(account_email, search, signature_status, status_overall, page_number, page_size)
+    response = get_client()._make_request("GET", "/signature-requests", params=params) or []
+    return [SignatureRequestView(item) for item in response] if typed else response
+
+def iter_all(
+    account_email: Optional[str] = None,
+    search: Optional[str] = None,
+    signature_status: Optional[str] = None,
+    status_overall: Optional[str] = None,
+    page_size: int = 50,
+    typed: bool = False
+) -> Union[Iterator[Dict[str, Any]], Iterator[SignatureRequestView]]:
+    """
+    Iterate over all signature requests matching the filters, fetching one page at a time.
+
+    The next page is only requested once the current one has been consumed, so memory use
+    depends on ``page_size`` rather than on the number of signature requests in the account.
+
+    :param account_email: Filter on the field signatures[].account_email
+    :type account_email: Optional[str]
+    :param search: Filter on the field title to search for documents containing the search term
+    :type search: Optional[str]
+    :param signature_status: Filter on the field signatures[].status_code with one of the valid Signature states
+    :type signature_status: Optional[str]
+    :param status_overall: Filter on the field status_overall with one of the valid Signature states
+    :type status_overall: Optional[str]
+    :param page_size: Number of items fetched per request (must be greater than 0, default is 50)
+    :type page_size: int
+    :param typed: Yield :class:`~skribble.responses.SignatureRequestView` objects instead of dictionaries.
+    :type typed: bool
+    :return: An iterator over signature request details.
+    :rtype: Union[Iterator[Dict[str, Any]], Iterator[SignatureRequestView]]
+    :raises SkribbleValidationError: If ``page_size`` is not positive.
+
+    Example:
+        >>> for request in skribble.signature_request.iter_all(status_overall="OPEN", page_size=100):
+        ...     print(request['id'])
+    """
+    if page_size <= 0:
+        raise SkribbleValidationError("'page_size' must be greater than 0")
+    return _iter_all(account_email, search, signature_status, status_overall, page_size, typed)
+
+def _iter_all(
+    account_email: Optional[str],
+    search: Optional[str],
+    signature_status: Optional[str],
+    status_overall: Optional[str],
+    page_size: int,
+    typed: bool
+) -> Union[Iterator[Dict[str, Any]], Iterator[SignatureRequestView]]:
+    page_number = 0
+    while True:
+        page = list(account_email, search, signature_status, status_overall, page_number, page_size, typed)
+        yield from page
+        if len(page) < page_size:
+            return
+        page_number += 1
+
+def _list_params(
+    account_email: Optional[str],
+    search: Optional[str],
+    signature_status: Optional[str],
+    status_overall: Optional[str],
+    page_number: Optional[int],
+    page_size: int
+) -> Dict[str, Any]:
+    """
+    Build the query parameters for listing signature requests, dropping unset filters.
+    """
     params = {
         "account_email": account_email,
         "search": search,
         "signature_status": signature_status,
         "status_overall": status_overall,
+        "page_number": page_number or 0,
+        "page_size": page_size,
     }
     # Remove None values from params
-    params = {k: v for k, v in params.items() if v is not None}
-    
-    all_requests = get_client()._make_request("GET", "/signature-requests", params=params)
-    
-    # Apply pagination on the client side
-    start_index = (page_number or 0) * page_size
-    end_index = start_index + page_size
-    
-    return all_requests[start_index:end_index]
+    return {k: v for k, v in params.items() if v is not None}
 
 def update(signature_request_id: str, updated_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -149,14 +283,22 @@ def update(signature_request_id: str, updated_data: Dict[str, Any]) -> Dict[str,
     updated_data["id"] = signature_request_id
     return get_client()._make_request("PUT", "/signature-requests", data=updated_data)
 
-def add_signer(signature_request_id: str, signer_data: Dict[str, Any]) -> Dict[str, Any]:
+def add_signer(signature_request_id: str, signer_data: Dict[str, Any], signature_request: Optional[Dict[str, Any]] = None, check_signed: bool = True) -> Dict[str, Any]:
     """
     Add a signer to a signature request.
 
+    Before the change the signature request is fetched to make sure nobody has signed yet.
+    Pass the request you already have as ``signature_request`` to skip that fetch, or set
+    ``check_signed=False`` to let the API reject the change instead.
+
     :param signature_request_id: The ID of the signature request.
     :type signature_request_id: str
     :param signer_data: The signer data including email, name, etc.
     :type signer_data: Dict[str, Any]
+    :param signature_request: The current state of the signature request, if already known.
+    :type signature_request: Optional[Dict[str, Any]]
+    :param check_signed: Check for existing signatures before the change.
+    :type check_signed: bool
     :return: The response containing the added signer details.
     :rtype: Dict[str, Any]
     :raises SkribbleOperationError: If the operation fails.
@@ -176,29 +318,32 @@ def add_signer(signature_request_id: str, signer_data: Dict[str, Any]) -> Dict[s
     """
     try:
         client = get_client()
-
-        # Get the signature request and check if any of the signers status_code is SIGNED if so return
-        signature_request = client._make_request("GET", f"/signature-requests/{signature_request_id}")
-        for signer in signature_request.get('signatures', []):
-            if signer.get('status_code') == 'SIGNED':
-                raise SkribbleOperationError("add_signer", "One of the signers has already signed the document", None)
+        _check_not_signed(client, signature_request_id, signature_request, check_signed, "add_signer", _ALREADY_SIGNED)
 
         response = client._make_request("POST", f"/signature-requests/{signature_request_id}/signatures", data=signer_data)
         
         return response
+    except SkribbleOperationError:
+        raise
     except SkribbleAPIError as e:
-        raise SkribbleOperationError("add_signer", str(e), e)
+        raise _operation_error("add_signer", e, _ALREADY_SIGNED)
     except Exception as e:
         raise SkribbleOperationError("add_signer", f"Unexpected error: {str(e)}", e)
 
-def remove_signer(signature_request_id: str, signer_id: str) -> Dict[str, Any]:
+def remove_signer(signature_request_id: str, signer_id: str, signature_request: Optional[Dict[str, Any]] = None, check_signed: bool = True) -> Dict[str, Any]:
     """
     Remove a signer from a signature request.
 
+    ``signature_request`` and ``check_signed`` work as in :func:`add_signer`.
+
     :param signature_request_id: The ID of the signature request.
     :type signature_request_id: str
     :param signer_id: The ID of the signer to remove.
     :type signer_id: str
+    :param signature_request: The current state of the signature request, if already known.
+    :type signature_request: Optional[Dict[str, Any]]
+    :param check_signed: Check for existing signatures before the change.
+    :type check_signed: bool
     :return: A dictionary containing the status and message of the remove operation.
     :rtype: Dict[str, Any]
     :raises SkribbleOperationError: If the operation fails.
@@ -210,29 +355,32 @@ def remove_signer(signature_request_id: str, signer_id: str) -> Dict[str, Any]:
     """
     try:
         client = get_client()
-
-        # Get the signature request and check if any of the signers status_code is SIGNED if so return
-        signature_request = client._make_request("GET", f"/signature-requests/{signature_request_id}")
-        for signer in signature_request['signatures']:
-            if signer.get('status_code') == 'SIGNED':
-                raise SkribbleOperationError("remove_signer", "One of the signers has already signed the document", None)
+        _check_not_signed(client, signature_request_id, signature_request, check_signed, "remove_signer", _ALREADY_SIGNED)
 
         client._make_request("DELETE", f"/signature-requests/{signature_request_id}/signatures/{signer_id}")
         
         return {"status": "success", "message": f"Signer with ID {signer_id} removed successfully"}
+    except SkribbleOperationError:
+        raise
     except SkribbleAPIError as e:
-        raise SkribbleOperationError("remove_signer", str(e), e)
+        raise _operation_error("remove_signer", e, _ALREADY_SIGNED)
     except Exception as e:
         raise SkribbleOperationError("remove_signer", f"Unexpected error: {str(e)}", e)
 
-def replace_signers(signature_request_id: str, signatures: List[Dict[str, Any]]) -> Dict[str, Any]:
+def replace_signers(signature_request_id: str, signatures: List[Dict[str, Any]], signature_request: Optional[Dict[str, Any]] = None, check_signed: bool = True) -> Dict[str, Any]:
     """
     Replace all signers in a signature request.
 
+    ``signature_request`` and ``check_signed`` work as in :func:`add_signer`.
+
     :param signature_request_id: The ID of the signature request.
     :type signature_request_id: str
     :param signatures: A list of dictionaries containing signer information.
     :type signatures: List[Dict[str, Any]]
+    :param signature_request: The current state of the signature request, if already known.
+    :type signature_request: Optional[Dict[str, Any]]
+    :param check_signed: Check for existing signatures before the change.
+    :type check_signed: bool
     :return: The updated signature request details.
     :rtype: Dict[str, Any]
     :raises SkribbleOperationError: If the operation fails.
@@ -254,12 +402,7 @@ def replace_signers(signature_request_id: str, signatures: List[Dict[str, Any]])
     """
     try:
         client = get_client()
-
-        # Get the signature request and check if any of the signers have already signed
-        signature_request = client._make_request("GET", f"/signature-requests/{signature_request_id}")
-        for signer in signature_request['signatures']:
-            if signer.get('status_code') == 'SIGNED':
-                raise SkribbleOperationError("replace_signers", "Cannot replace signers: One or more signers have already signed the document", None)
+        _check_not_signed(client, signature_request_id, signature_request, check_signed, "replace_signers", _CANNOT_REPLACE_SIGNED)
 
         # Prepare the update data
         update_data = {
@@ -271,11 +414,104 @@ def replace_signers(signature_request_id: str, signatures: List[Dict[str, Any]])
         response = client._make_request("PUT", "/signature-requests", data=update_data)
         
         return response
+    except SkribbleOperationError:
+        raise
     except SkribbleAPIError as e:
-        raise SkribbleOperationError("replace_signers", str(e), e)
+        raise _operation_error("replace_signers", e, _CANNOT_REPLACE_SIGNED)
     except Exception as e:
         raise SkribbleOperationError("replace_signers", f"Unexpected error: {str(e)}", e)
 
+def update_signers(
+    signature_request_id: str,
+    add: Optional[List[Dict[str, Any]]] = None,
+    remove: Optional[List[str]] = None,
+    signature_request: Optional[Dict[str, Any]] = None,
+    check_signed: bool = True
+) -> Dict[str, Any]:
+    """
+    Add and remove several signers in a single update.
+
+    The current signers are read once (or taken from ``signature_request``), the changes
+    are applied locally and the result is sent in one request, instead of a fetch and a
+    request per signer as with :func:`add_signer` and :func:`remove_signer`.
+
+    :param signature_request_id: The ID of the signature request.
+    :type signature_request_id: str
+    :param add: Signer data of the signers to add.
+    :type add: Optional[List[Dict[str, Any]]]
+    :param remove: IDs (``sid``) of the signers to remove.
+    :type remove: Optional[List[str]]
+    :param signature_request: The current state of the signature request, if already known.
+    :type signature_request: Optional[Dict[str, Any]]
+    :param check_signed: Refuse the change if somebody has already signed.
+    :type check_signed: bool
+    :return: The updated signature request details.
+    :rtype: Dict[str, Any]
+    :raises SkribbleOperationError: If the operation fails.
+
+    Example:
+        >>> result = skribble.signature_request.update_signers(
+        ...     "5c33d0cb-84...",
+        ...     add=[{"account_email": "signer3@example.com"}],
+        ...     remove=["signer_456"]
+        ... )
+    """
+    try:
+        client = get_client()
+        if signature_request is None:
+            signature_request = client._make_request("GET", f"/signature-requests/{signature_request_id}")
+        if check_signed:
+            _ensure_not_signed(signature_request, "update_signers", _ALREADY_SIGNED)
+
+        update_data = {
+            "id": signature_request_id,
+            "signatures": _merge_signers(signature_request.get('signatures', []), add or [], remove or [])
+        }
+        return client._make_request("PUT", "/signature-requests", data=update_data)
+    except SkribbleOperationError:
+        raise
+    except SkribbleAPIError as e:
+        raise _operation_error("update_signers", e, _ALREADY_SIGNED)
+    except Exception as e:
+        raise SkribbleOperationError("update_signers", f"Unexpected error: {str(e)}", e)
+
+def _check_not_signed(client: Any, signature_request_id: str, signature_request: Optional[Dict[str, Any]], check_signed: bool, operation: str, message: str) -> None:
+    """
+    Raise if somebody has signed, fetching the signature request only if the caller did not pass it.
+    """
+    if not check_signed:
+        return
+    if signature_request is None:
+        signature_request = client._make_request("GET", f"/signature-requests/{signature_request_id}")
+    _ensure_not_signed(signature_request, operation, message)
+
+def _operation_error(operation: str, error: SkribbleAPIError, conflict_message: str) -> SkribbleOperationError:
+    """
+    Wrap an API error of a signer change, reporting a 409 Conflict like the pre-flight check would.
+    """
+    if error.status_code == 409:
+        return SkribbleOperationError(operation, conflict_message, error)
+    return SkribbleOperationError(operation, str(error), error)
+
+# Signer state reported by the API that cannot be written back
+_READ_ONLY_SIGNER_FIELDS = frozenset({"status_code", "signed_at", "signed_quality", "signed_legislation", "last_viewed_at"})
+
+def _merge_signers(current: List[Dict[str, Any]], add: List[Dict[str, Any]], remove: List[str]) -> List[Dict[str, Any]]:
+    """
+    Apply additions and removals to the signers of a signature request.
+
+    Kept signers are passed on as the API returned them, keeping their ``sid`` so the API
+    updates them in place instead of inviting them again; only their read-only state is
+    dropped. Only the added signers are validated.
+    """
+    removed = set(remove)
+    kept = [
+        {field: value for field, value in signer.items() if field not in _READ_ONLY_SIGNER_FIELDS}
+        for signer in current
+        if signer.get('sid') not in removed
+    ]
+    return kept + [Signature(**signer).model_dump(exclude_none=True) for signer in add]
+
 def remind(signature_request_id: str) -> None:
     """
     Send a reminder to open signers of a signature request.
@@ -323,12 +559,49 @@ def get_attachment(signature_request_id: str, attachment_id: str) -> bytes:
         bytes: The content of the attachment file.
     """
     try:
-        client = get_client()
-        response = client.session.get(f"{client.BASE_URL}/signature-requests/{signature_request_id}/attachments/{attachment_id}/content", headers={"Authorization": f"Bearer {client._authenticate()}"})
+        response = get_client()._request_raw("GET", f"/signature-requests/{signature_request_id}/attachments/{attachment_id}/content")
         if response.status_code == 200:
             return response.content
         else:
             raise SkribbleAPIError(f"Failed to get attachment: {response.text}")
     except Exception as e:
         print(f"Error getting attachment: {str(e)}")
-        return b''
\ No newline at end of file
+        return b''
+
+def iter_attachment(signature_request_id: str, attachment_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Stream a specific attached file from a signature request in chunks.
+
+    Unlike :func:`get_attachment`, failures are raised instead of returning empty content.
+
+    Args:
+        signature_request_id (str): The ID of the signature request.
+        attachment_id (str): The ID of the attachment to download.
+        chunk_size (int): Maximum number of bytes per chunk.
+
+    Returns:
+        Iterator[bytes]: An iterator over the content of the attachment file.
+
+    Raises:
+        SkribbleAPIError: If the download fails.
+    """
+    response = open_download(get_client(), f"/signature-requests/{signature_request_id}/attachments/{attachment_id}/content", "Failed to get attachment")
+    return iter_response(response, chunk_size)
+
+def get_attachment_to(signature_request_id: str, attachment_id: str, destination: Destination, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream a specific attached file from a signature request into a file path or binary file object.
+
+    Args:
+        signature_request_id (str): The ID of the signature request.
+        attachment_id (str): The ID of the attachment to download.
+        destination (Union[str, os.PathLike, BinaryIO]): A file path or a binary file object opened for writing.
+        chunk_size (int): Maximum number of bytes per chunk.
+
+    Returns:
+        int: The number of bytes written.
+
+    Raises:
+        SkribbleAPIError: If the download fails.
+    """
+    return write_chunks(iter_attachment(signature_request_id, attachment_id, chunk_size), destination)
\ No newline at end of file
@@ -0,0 +1,334 @@
+import base64
+import os
+import uuid
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar, Union
+from .codec import JSONCodec
+from .exceptions import SkribbleAPIError
+
+#: Default number of bytes read from the network or from disk per chunk when streaming content.
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+Destination = Union[str, "os.PathLike[str]", BinaryIO]
+ContentSource = Union["os.PathLike[str]", BinaryIO]
+
+T = TypeVar("T")
+
+# Stands in for streamed content while the payload is validated and serialized
+_CONTENT_PLACEHOLDER: str = f"skribble-streamed-content-{uuid.uuid4().hex}"
+
+def open_download(client: Any, endpoint: str, error_message: str) -> Any:
+    """
+    Start a streamed GET request for a binary endpoint and check its status.
+
+    The response body has not been read yet when this returns; the caller is responsible
+    for consuming it, e.g. via :func:`iter_response`.
+
+    Raises:
+        SkribbleAPIError: If the API does not answer with 200.
+    """
+    response = client._request_raw("GET", endpoint, stream=True)
+    if response.status_code != 200:
+        try:
+            raise SkribbleAPIError(f"{error_message}: {response.text}", status_code=response.status_code)
+        finally:
+            response.close()
+    return response
+
+def iter_response(response: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the body of a streamed response in chunks and release the connection afterwards.
+    """
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                yield chunk
+    finally:
+        response.close()
+
+def cached_download(client: Any, endpoint: str, error_message: str, use: Callable[[Any], T]) -> T:
+    """
+    Apply ``use`` to the content of a binary endpoint from the client's disk cache, e.g.
+    ``CachedFile.read``, downloading it into the cache first on a miss.
+
+    With ``revalidate`` enabled, a cached file that carries an ``ETag`` or ``Last-Modified``
+    is checked with a conditional request and served as is on 304 Not Modified. If another
+    process sharing the cache evicts the file before ``use`` opens it, it is downloaded again.
+
+    Raises:
+        SkribbleAPIError: If the download fails.
+    """
+    try:
+        return use(_cached_file(client, endpoint, error_message))
+    except FileNotFoundError:
+        client.disk_cache.discard(endpoint)
+        return use(_cached_file(client, endpoint, error_message))
+
+def _cached_file(client: Any, endpoint: str, error_message: str) -> Any:
+    disk_cache = client.disk_cache
+    cached = disk_cache.get(endpoint)
+    headers = cached.conditional_headers() if cached is not None and disk_cache.revalidate else {}
+    if cached is not None and not headers:
+        return cached
+
+    response = client._request_raw("GET", endpoint, stream=True, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        response.close()
+        return cached
+    if response.status_code != 200:
+        try:
+            raise SkribbleAPIError(f"{error_message}: {response.text}", status_code=response.status_code)
+        finally:
+            response.close()
+    return disk_cache.put(endpoint, iter_response(response), response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+async def async_cached_download(client: Any, endpoint: str, error_message: str, use: Callable[[Any], T]) -> T:
+    """
+    Asynchronous version of :func:`cached_download`.
+    """
+    try:
+        return use(await _async_cached_file(client, endpoint, error_message))
+    except FileNotFoundError:
+        client.disk_cache.discard(endpoint)
+        return use(await _async_cached_file(client, endpoint, error_message))
+
+async def _async_cached_file(client: Any, endpoint: str, error_message: str) -> Any:
+    disk_cache = client.disk_cache
+    cached = disk_cache.get(endpoint)
+    headers = cached.conditional_headers() if cached is not None and disk_cache.revalidate else {}
+    if cached is not None and not headers:
+        return cached
+
+    async with client._stream("GET", endpoint, error_message, headers=headers) as response:
+        if response.status_code == 304:
+            return cached
+
+        writer = disk_cache.writer(endpoint)
+        try:
+            async for chunk in response.aiter_bytes(DEFAULT_CHUNK_SIZE):
+                writer.write(chunk)
+        except BaseException:
+            writer.abort()
+            raise
+        return writer.commit(response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+def iter_file(file: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the content of an open binary file in chunks and close it afterwards.
+    """
+    with file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def write_chunks(chunks: Iterable[bytes], destination: Destination) -> int:
+    """
+    Write chunks to a binary file object or a file path and return the number of bytes written.
+
+    When a path is given the data is first written to ``<path>.part`` and moved into place once
+    complete, so an interrupted download never leaves a truncated file behind.
+    """
+    if hasattr(destination, "write"):
+        written = 0
+        for chunk in chunks:
+            destination.write(chunk)
+            written += len(chunk)
+        return written
+
+    path = os.fspath(destination)
+    partial_path = f"{path}.part"
+    try:
+        with open(partial_path, "wb") as file:
+            written = write_chunks(chunks, file)
+        os.replace(partial_path, path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    return written
+
+async def async_write_chunks(chunks: AsyncIterable[bytes], destination: Destination) -> int:
+    """
+    Asynchronous version of :func:`write_chunks` for chunks produced by an async iterator.
+    """
+    if hasattr(destination, "write"):
+        written = 0
+        async for chunk in chunks:
+            destination.write(chunk)
+            written += len(chunk)
+        return written
+
+    path = os.fspath(destination)
+    partial_path = f"{path}.part"
+    try:
+        with open(partial_path, "wb") as file:
+            written = await async_write_chunks(chunks, file)
+        os.replace(partial_path, path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    return written
+
+def is_content_source(value: Any) -> bool:
+    """
+    Return whether ``value`` is a file path or binary stream to be uploaded as base64 content.
+
+    Plain strings are always treated as already base64-encoded content, so file paths must
+    be passed as ``pathlib.Path`` (or any other ``os.PathLike``).
+    """
+    return isinstance(value, os.PathLike) or (hasattr(value, "read") and not isinstance(value, (str, bytes)))
+
+def extract_content_source(data: Dict[str, Any], field: str = "content") -> Tuple[Dict[str, Any], Optional[ContentSource]]:
+    """
+    Swap a path or stream in ``data[field]`` for a placeholder so the payload can be validated.
+
+    Returns a shallow copy of ``data`` and the extracted source, or ``data`` unchanged and
+    ``None`` when the field already holds a base64 string.
+    """
+    source = data.get(field)
+    if not is_content_source(source):
+        return data, None
+    return {**data, field: _CONTENT_PLACEHOLDER}, source
+
+class StreamingJSONBody:
+    """
+    A JSON request body whose base64 ``content`` field is encoded from a file while it is sent.
+
+    Only ``chunk_size`` bytes of the file are held in memory at a time. Paths are reopened and
+    seekable streams are rewound on every iteration, so the body can be sent more than once.
+    The rest of the payload is encoded with ``dumps``, normally the client's ``json_codec.dumps``,
+    so it matches bodies that are not streamed.
+    """
+
+    def __init__(self, payload: Dict[str, Any], field: str, source: ContentSource, chunk_size: int = DEFAULT_CHUNK_SIZE, dumps: Optional[Callable[[Any], bytes]] = None):
+        encoded = (dumps if dumps is not None else JSONCodec().dumps)({**payload, field: _CONTENT_PLACEHOLDER})
+        self._prefix, self._suffix = encoded.split(_CONTENT_PLACEHOLDER.encode("utf-8"), 1)
+        self._source: ContentSource = source
+        # base64 works on 3 byte groups, reading multiples of 3 avoids padding mid-stream
+        self._read_size: int = max(3, chunk_size - chunk_size % 3)
+        self._start: Optional[int] = None
+        if not isinstance(source, os.PathLike) and _is_seekable(source):
+            self._start = source.tell()
+        size = _source_size(source)
+        self.content_length: Optional[int] = None
+        if size is not None:
+            self.content_length = len(self._prefix) + 4 * ((size + 2) // 3) + len(self._suffix)
+
+    @property
+    def replayable(self) -> bool:
+        """
+        Whether the body can be sent again, e.g. when the request is retried.
+        """
+        return isinstance(self._source, os.PathLike) or self._start is not None
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._prefix
+        if isinstance(self._source, os.PathLike):
+            with open(self._source, "rb") as file:
+                yield from self._encode(file)
+        else:
+            if self._start is not None:
+                self._source.seek(self._start)
+            yield from self._encode(self._source)
+        yield self._suffix
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+    def _encode(self, file: BinaryIO) -> Iterator[bytes]:
+        remainder = b""
+        while True:
+            chunk = file.read(self._read_size)
+            if not chunk:
+                break
+            # Short reads from pipes or sockets are carried over until a full 3 byte group is available
+            chunk = remainder + chunk
+            usable = len(chunk) - len(chunk) % 3
+            remainder = chunk[usable:]
+            if usable:
+                yield base64.b64encode(chunk[:usable])
+        if remainder:
+            yield base64.b64encode(remainder)
+
+class SizedStreamingJSONBody(StreamingJSONBody):
+    """
+    A :class:`StreamingJSONBody` whose total size is known up front.
+
+    Exposing ``__len__`` lets ``requests`` send a ``Content-Length`` header instead of
+    falling back to chunked transfer encoding.
+    """
+
+    def __len__(self) -> int:
+        return self.content_length
+
+class AsyncBody:
+    """
+    Exposes only the asynchronous iteration of a streamed request body.
+
+    httpx checks for ``__iter__`` before ``__aiter__``, so a body offering both would be sent
+    as a synchronous stream, which ``httpx.AsyncClient`` refuses.
+    """
+
+    def __init__(self, body: Any):
+        self._body = body
+
+    @property
+    def content_length(self) -> Optional[int]:
+        return self._body.content_length
+
+    @property
+    def replayable(self) -> bool:
+        return self._body.replayable
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._body.__aiter__()
+
+def async_body(body: Any) -> Any:
+    """
+    Prepare a request body for an asynchronous transport: streamed bodies are wrapped in
+    :class:`AsyncBody`, encoded bodies are returned as they are.
+    """
+    if body is None or isinstance(body, bytes):
+        return body
+    return AsyncBody(body)
+
+def streaming_json_body(payload: Dict[str, Any], field: str, source: ContentSource, chunk_size: int = DEFAULT_CHUNK_SIZE, dumps: Optional[Callable[[Any], bytes]] = None) -> StreamingJSONBody:
+    """
+    Build a streamed JSON body for ``payload`` with ``field`` filled from ``source`` as base64.
+    """
+    if _source_size(source) is None:
+        return StreamingJSONBody(payload, field, source, chunk_size, dumps)
+    return SizedStreamingJSONBody(payload, field, source, chunk_size, dumps)
+
+def request_payload(payload: Dict[str, Any], source: Optional[ContentSource], chunk_size: int = DEFAULT_CHUNK_SIZE, field: str = "content", dumps: Optional[Callable[[Any], bytes]] = None) -> Dict[str, Any]:
+    """
+    Return the ``_make_request`` keyword arguments for sending ``payload``.
+
+    Payloads without an extracted content source are sent as regular JSON ``data``; streamed
+    payloads are encoded with ``dumps``, which callers take from the client's ``json_codec``.
+    """
+    if source is None:
+        return {"data": payload}
+    return {"body": streaming_json_body(payload, field, source, chunk_size, dumps)}
+
+def _source_size(source: ContentSource) -> Optional[int]:
+    """
+    Return the number of bytes left to read from ``source``, or ``None`` if it cannot be known.
+    """
+    if isinstance(source, os.PathLike):
+        return os.path.getsize(source)
+    if not _is_seekable(source):
+        return None
+    position = source.tell()
+    size = source.seek(0, os.SEEK_END) - position
+    source.seek(position)
+    return size
+
+def _is_seekable(file: Any) -> bool:
+    try:
+        return bool(file.seekable())
+    except (AttributeError, OSError, ValueError):
+        return False
@@ -0,0 +1,12 @@
+from .mock_api import MockSkribbleAPI, MockResponse
+from .server import MockSkribbleServer
+from .recording import Exchange, Recording, RecordingTransport
+
+__all__ = [
+    'MockSkribbleAPI',
+    'MockResponse',
+    'MockSkribbleServer',
+    'Exchange',
+    'Recording',
+    'RecordingTransport'
+]
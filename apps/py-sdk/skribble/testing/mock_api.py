@@ -0,0 +1,335 @@
+import gzip
+import json
+import os
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl
+from ..compression import gzip_compress
+from ..hooks import endpoint_template
+
+#: Path prefix of the API, as in ``SkribbleClient.BASE_URL``.
+API_PREFIX = "/v2"
+
+class MockResponse(NamedTuple):
+    """
+    Status, headers and body of an answer from :class:`MockSkribbleAPI`.
+    """
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+
+class MockSkribbleAPI:
+    """
+    In-memory stand-in for the Skribble v2 API, for tests and benchmarks.
+
+    Covers login, signature requests (including signers, reminders, withdrawal and
+    attachments), documents with downloads and page previews, and sealing. State is kept
+    in memory and shared by all connections; every request must carry the token returned
+    by ``/access/login``.
+
+    The API itself does no I/O. Serve it over HTTP with
+    :class:`~skribble.testing.MockSkribbleServer`, or call :meth:`handle` directly.
+
+    Args:
+        latency (float): Seconds every request is delayed before it is answered, to mimic the network and the API.
+        document_size (int): Size in bytes of downloaded documents and attachments.
+        page_count (int): Number of pages of every document.
+        preview_size (int): Size in bytes of a page preview.
+        preview_pending (int): Number of times a page preview answers 202 (still being generated) before it is ready.
+        signers (int): Number of signers of the signature requests created by :meth:`seed`.
+        token (str): Access token handed out by ``/access/login``.
+        accept_gzip (bool): Accept gzip-compressed request bodies; when disabled, they are
+            answered with 415 Unsupported Media Type, as by a server without support for them.
+        compress_min_size (int): JSON answers of at least this many bytes are gzip-compressed
+            when the request's ``Accept-Encoding`` allows it. Documents and previews are sent as is.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        document_size: int = 256 * 1024,
+        page_count: int = 4,
+        preview_size: int = 32 * 1024,
+        preview_pending: int = 0,
+        signers: int = 2,
+        token: str = "mock-access-token",
+        accept_gzip: bool = True,
+        compress_min_size: int = 1024
+    ):
+        self.latency: float = latency
+        self.page_count: int = page_count
+        self.preview_pending: int = preview_pending
+        self.signers: int = signers
+        self.token: str = token
+        self.accept_gzip: bool = accept_gzip
+        self.compress_min_size: int = compress_min_size
+        self.signature_requests: Dict[str, Dict[str, Any]] = {}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.request_count: int = 0
+        # Random bytes are as incompressible as real PDFs and images
+        self._document_content: bytes = b"%PDF-1.7\n" + os.urandom(max(document_size - 9, 0))
+        self._preview_content: bytes = b"\x89PNG\r\n\x1a\n" + os.urandom(max(preview_size - 8, 0))
+        self._preview_polls: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._routes: Dict[Tuple[str, str], Callable[..., MockResponse]] = {
+            ("POST", "/access/login"): self._login,
+            ("POST", "/signature-requests"): self._create_signature_request,
+            ("GET", "/signature-requests"): self._list_signature_requests,
+            ("PUT", "/signature-requests"): self._update_signature_request,
+            ("GET", "/signature-requests/{signature_request_id}"): self._get_signature_request,
+            ("DELETE", "/signature-requests/{signature_request_id}"): self._delete_signature_request,
+            ("POST", "/signature-requests/{signature_request_id}/signatures"): self._add_signer,
+            ("DELETE", "/signature-requests/{signature_request_id}/signatures/{signer_id}"): self._remove_signer,
+            ("POST", "/signature-requests/{signature_request_id}/remind"): self._remind,
+            ("POST", "/signature-requests/{signature_request_id}/withdraw"): self._withdraw,
+            ("POST", "/signature-requests/{signature_request_id}/attachments"): self._add_attachment,
+            ("GET", "/signature-requests/{signature_request_id}/attachments/{attachment_id}/content"): self._get_attachment,
+            ("DELETE", "/signature-requests/{signature_request_id}/attachments/{attachment_id}"): self._delete_attachment,
+            ("GET", "/documents"): self._list_documents,
+            ("POST", "/documents"): self._add_document,
+            ("GET", "/documents/{document_id}"): self._get_document,
+            ("DELETE", "/documents/{document_id}"): self._delete_document,
+            ("GET", "/documents/{document_id}/content"): self._download_document,
+            ("GET", "/documents/{document_id}/pages/{page_id}"): self._preview_page,
+            ("POST", "/seal"): self._seal
+        }
+
+    def seed(self, count: int, status_overall: str = "OPEN") -> List[str]:
+        """
+        Create ``count`` signature requests, each with its own document, and return their IDs.
+        """
+        with self._lock:
+            return [
+                self._new_signature_request({"title": f"Contract {index}", "signatures": [{"account_email": f"signer{signer}@example.com"} for signer in range(self.signers)]}, status_overall)["id"]
+                for index in range(count)
+            ]
+
+    def handle(self, method: str, path: str, query: str = "", headers: Optional[Mapping[str, str]] = None, body: bytes = b"") -> MockResponse:
+        """
+        Answer one request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path, with or without the ``/v2`` prefix.
+            query (str): The raw query string.
+            headers (Mapping[str, str], optional): The request headers; header names are matched case-insensitively.
+            body (bytes): The request body.
+
+        Returns:
+            MockResponse: The answer.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        method = method.upper()
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+        template = endpoint_template(path)
+        handler = self._routes.get((method, template))
+        if handler is None:
+            known = any(route == template for _, route in self._routes)
+            return _error(405 if known else 404, f"No route for {method} {path}")
+
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        if template != "/access/login" and headers.get("authorization") != f"Bearer {self.token}":
+            return _error(401, "Missing or invalid access token")
+
+        encoding = headers.get("content-encoding", "identity").lower()
+        if encoding == "gzip" and self.accept_gzip:
+            try:
+                body = gzip.decompress(body)
+            except (OSError, EOFError, zlib.error):
+                return _error(400, "Request body is not valid gzip")
+        elif encoding != "identity":
+            response = _error(415, f"Unsupported Content-Encoding: {encoding}")
+            response.headers["Accept-Encoding"] = "gzip" if self.accept_gzip else "identity"
+            return response
+
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            return _error(400, "Request body is not valid JSON")
+        path_params = {name[1:-1]: value for name, value in zip(template.split("/"), path.split("/")) if name.startswith("{")}
+        params = dict(parse_qsl(query))
+        with self._lock:
+            self.request_count += 1
+            response = handler(payload=payload, params=params, **path_params)
+        return self._compress(response, headers.get("accept-encoding", ""))
+
+    def _compress(self, response: MockResponse, accept_encoding: str) -> MockResponse:
+        if response.headers.get("Content-Type") != "application/json" or len(response.content) < self.compress_min_size:
+            return response
+        if "gzip" not in [encoding.split(";")[0].strip().lower() for encoding in accept_encoding.split(",")]:
+            return response
+        return MockResponse(response.status_code, {**response.headers, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"}, gzip_compress(response.content))
+
+    def _login(self, payload: Any, params: Dict[str, str]) -> MockResponse:
+        if not isinstance(payload, dict) or not payload.get("username") or not payload.get("api-key"):
+            return _error(401, "Invalid credentials")
+        return MockResponse(200, {"Content-Type": "text/plain"}, self.token.encode())
+
+    def _new_signature_request(self, payload: Dict[str, Any], status_overall: str = "OPEN") -> Dict[str, Any]:
+        document_id = payload.get("document_id") or self._new_document({"title": payload.get("title"), "content_type": payload.get("content_type")})["id"]
+        now = _now()
+        signature_request = {
+            **{key: value for key, value in payload.items() if key not in ("content", "file_url", "signatures")},
+            "id": str(uuid.uuid4()),
+            "document_id": document_id,
+            "status_overall": status_overall,
+            "signatures": [_new_signer(signer) for signer in payload.get("signatures") or []],
+            "attachments": [],
+            "owner": "api_user@example.com",
+            "created_at": now,
+            "updated_at": now
+        }
+        self.signature_requests[signature_request["id"]] = signature_request
+        return signature_request
+
+    def _new_document(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        document = {
+            "id": str(uuid.uuid4()),
+            "title": payload.get("title") or "Document",
+            "content_type": payload.get("content_type") or "application/pdf",
+            "size": len(self._document_content),
+            "page_count": self.page_count,
+            "page_width": 595,
+            "page_height": 842,
+            "owner": "api_user@example.com",
+            "created_at": _now()
+        }
+        self.documents[document["id"]] = document
+        return document
+
+    def _create_signature_request(self, payload: Any, params: Dict[str, str]) -> MockResponse:
+        if not isinstance(payload, dict) or not payload.get("title"):
+            return _error(400, "title is required")
+        return _json(self._new_signature_request(payload))
+
+    def _list_signature_requests(self, payload: Any, params: Dict[str, str]) -> MockResponse:
+        matches = [
+            signature_request for signature_request in self.signature_requests.values()
+            if params.get("status_overall") in (None, signature_request["status_overall"])
+            and (params.get("account_email") is None or any(signer.get("account_email") == params["account_email"] for signer in signature_request["signatures"]))
+        ]
+        page_number = int(params.get("page_number", 0))
+        page_size = int(params.get("page_size", 50))
+        return _json(matches[page_number * page_size:(page_number + 1) * page_size])
+
+    def _update_signature_request(self, payload: Any, params: Dict[str, str]) -> MockResponse:
+        signature_request = self.signature_requests.get((payload or {}).get("id"))
+        if signature_request is None:
+            return _error(404, "Signature request not found")
+        signature_request.update({key: value for key, value in payload.items() if key != "signatures"})
+        if "signatures" in payload:
+            signature_request["signatures"] = [_new_signer(signer) for signer in payload["signatures"]]
+        signature_request["updated_at"] = _now()
+        return _json(signature_request)
+
+    def _get_signature_request(self, payload: Any, params: Dict[str, str], signature_request_id: str) -> MockResponse:
+        signature_request = self.signature_requests.get(signature_request_id)
+        return _json(signature_request) if signature_request is not None else _error(404, "Signature request not found")
+
+    def _delete_signature_request(self, payload: Any, params: Dict[str, str], signature_request_id: str) -> MockResponse:
+        if self.signature_requests.pop(signature_request_id, None) is None:
+            return _error(404, "Signature request not found")
+        return MockResponse(204, {}, b"")
+
+    def _add_signer(self, payload: Any, params: Dict[str, str], signature_request_id: str) -> MockResponse:
+        signature_request = self.signature_requests.get(signature_request_id)
+        if signature_request is None:
+            return _error(404, "Signature request not found")
+        signer = _new_signer(payload or {})
+        signature_request["signatures"].append(signer)
+        return _json(signer)
+
+    def _remove_signer(self, payload: Any, params: Dict[str, str], signature_request_id: str, signer_id: str) -> MockResponse:
+        signature_request = self.signature_requests.get(signature_request_id)
+        if signature_request is None:
+            return _error(404, "Signature request not found")
+        signature_request["signatures"] = [signer for signer in signature_request["signatures"] if signer["sid"] != signer_id]
+        return MockResponse(204, {}, b"")
+
+    def _remind(self, payload: Any, params: Dict[str, str], signature_request_id: str) -> MockResponse:
+        if signature_request_id not in self.signature_requests:
+            return _error(404, "Signature request not found")
+        return MockResponse(204, {}, b"")
+
+    def _withdraw(self, payload: Any, params: Dict[str, str], signature_request_id: str) -> MockResponse:
+        signature_request = self.signature_requests.get(signature_request_id)
+        if signature_request is None:
+            return _error(404, "Signature request not found")
+        signature_request["status_overall"] = "WITHDRAWN"
+        signature_request["updated_at"] = _now()
+        return _json(signature_request)
+
+    def _add_attachment(self, payload: Any, params: Dict[str, str], signature_request_id: str) -> MockResponse:
+        signature_request = self.signature_requests.get(signature_request_id)
+        if signature_request is None:
+            return _error(404, "Signature request not found")
+        attachment = {"attachment_id": str(uuid.uuid4()), "filename": (payload or {}).get("filename", "attachment.pdf")}
+        signature_request["attachments"].append(attachment)
+        return _json(attachment)
+
+    def _get_attachment(self, payload: Any, params: Dict[str, str], signature_request_id: str, attachment_id: str) -> MockResponse:
+        if not any(attachment["attachment_id"] == attachment_id for attachment in self.signature_requests.get(signature_request_id, {}).get("attachments", [])):
+            return _error(404, "Attachment not found")
+        return MockResponse(200, {"Content-Type": "application/pdf"}, self._document_content)
+
+    def _delete_attachment(self, payload: Any, params: Dict[str, str], signature_request_id: str, attachment_id: str) -> MockResponse:
+        signature_request = self.signature_requests.get(signature_request_id)
+        if signature_request is None:
+            return _error(404, "Signature request not found")
+        signature_request["attachments"] = [attachment for attachment in signature_request["attachments"] if attachment["attachment_id"] != attachment_id]
+        return MockResponse(204, {}, b"")
+
+    def _list_documents(self, payload: Any, params: Dict[str, str]) -> MockResponse:
+        return _json(list(self.documents.values()))
+
+    def _add_document(self, payload: Any, params: Dict[str, str]) -> MockResponse:
+        if not isinstance(payload, dict) or not payload.get("title"):
+            return _error(400, "title is required")
+        return _json(self._new_document(payload))
+
+    def _get_document(self, payload: Any, params: Dict[str, str], document_id: str) -> MockResponse:
+        document = self.documents.get(document_id)
+        return _json(document) if document is not None else _error(404, "Document not found")
+
+    def _delete_document(self, payload: Any, params: Dict[str, str], document_id: str) -> MockResponse:
+        if self.documents.pop(document_id, None) is None:
+            return _error(404, "Document not found")
+        return MockResponse(204, {}, b"")
+
+    def _download_document(self, payload: Any, params: Dict[str, str], document_id: str) -> MockResponse:
+        if document_id not in self.documents:
+            return _error(404, "Document not found")
+        return MockResponse(200, {"Content-Type": "application/pdf"}, self._document_content)
+
+    def _preview_page(self, payload: Any, params: Dict[str, str], document_id: str, page_id: str) -> MockResponse:
+        document = self.documents.get(document_id)
+        if document is None or not page_id.isdigit() or int(page_id) >= document["page_count"]:
+            return _error(404, "Page not found")
+        polls = self._preview_polls.get((document_id, page_id), 0)
+        if polls < self.preview_pending:
+            self._preview_polls[(document_id, page_id)] = polls + 1
+            return MockResponse(202, {"Retry-After": "0"}, b"")
+        return MockResponse(200, {"Content-Type": "image/png"}, self._preview_content)
+
+    def _seal(self, payload: Any, params: Dict[str, str]) -> MockResponse:
+        if not isinstance(payload, dict) or not payload.get("content"):
+            return _error(400, "content is required")
+        return _json({"document_id": self._new_document({"title": payload.get("title") or "Sealed document"})["id"]})
+
+def _new_signer(signer: Dict[str, Any]) -> Dict[str, Any]:
+    return {**signer, "sid": str(uuid.uuid4()), "status_code": "OPEN", "notify": signer.get("notify", True)}
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+def _json(value: Any, status_code: int = 200) -> MockResponse:
+    return MockResponse(status_code, {"Content-Type": "application/json"}, json.dumps(value, separators=(",", ":")).encode())
+
+def _error(status_code: int, message: str) -> MockResponse:
+    return _json({"status": status_code, "message": message}, status_code)
@@ -0,0 +1,121 @@
+import base64
+import itertools
+import json
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+from ..transport import Body, Response, Transport, _path_and_query
+from .mock_api import API_PREFIX, MockResponse
+
+class Exchange(NamedTuple):
+    """
+    One recorded request and the response it received.
+    """
+    method: str
+    path: str
+    query: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+
+class Recording:
+    """
+    Recorded API traffic that can be saved, loaded and replayed.
+
+    Record with :class:`RecordingTransport`, then replay by passing :meth:`handle` to an
+    :class:`~skribble.transport.InMemoryTransport`. Requests are matched by method, path and
+    query string; the responses recorded for a request are replayed in order and then from
+    the start again, so a short recording can drive a long load test.
+
+    Args:
+        exchanges (Iterable[Exchange]): The recorded exchanges.
+
+    Example:
+        >>> recording = Recording.load("traffic.jsonl")
+        >>> client = SkribbleClient(username="user", api_key="key", transport=InMemoryTransport(recording.handle))
+    """
+
+    def __init__(self, exchanges: Iterable[Exchange] = ()):
+        self.exchanges: List[Exchange] = list(exchanges)
+        self._replay: Optional[Dict[Tuple[str, str, str], Iterator[Exchange]]] = None
+        self._lock = threading.Lock()
+
+    def add(self, exchange: Exchange) -> None:
+        with self._lock:
+            self.exchanges.append(exchange)
+            self._replay = None
+
+    def save(self, path: str) -> None:
+        """
+        Write the exchanges to ``path`` as JSON lines, with base64-encoded bodies.
+        """
+        with open(path, "w", encoding="utf-8") as output:
+            for exchange in self.exchanges:
+                output.write(json.dumps({**exchange._asdict(), "content": base64.b64encode(exchange.content).decode("ascii")}) + "\n")
+
+    @classmethod
+    def load(cls, path: str) -> "Recording":
+        """
+        Read exchanges written by :meth:`save`.
+        """
+        with open(path, encoding="utf-8") as source:
+            records = [json.loads(line) for line in source if line.strip()]
+        return cls(Exchange(**{**record, "content": base64.b64decode(record["content"])}) for record in records)
+
+    def handle(self, method: str, path: str, query: str = "", headers: Optional[Mapping[str, str]] = None, body: bytes = b"") -> MockResponse:
+        """
+        Answer a request with the next response recorded for it, or 404 if there is none.
+        """
+        key = (method.upper(), _strip_prefix(path), query)
+        with self._lock:
+            if self._replay is None:
+                grouped: Dict[Tuple[str, str, str], List[Exchange]] = {}
+                for exchange in self.exchanges:
+                    grouped.setdefault((exchange.method, exchange.path, exchange.query), []).append(exchange)
+                self._replay = {request: itertools.cycle(responses) for request, responses in grouped.items()}
+            responses = self._replay.get(key)
+            exchange = next(responses) if responses is not None else None
+        if exchange is None:
+            return MockResponse(404, {"Content-Type": "application/json"}, json.dumps({"message": f"No recorded response for {method} {path}"}).encode())
+        return MockResponse(exchange.status_code, exchange.headers, exchange.content)
+
+class RecordingTransport(Transport):
+    """
+    Transport that passes requests on to ``transport`` and records every exchange.
+
+    Streamed responses are read completely so they can be recorded.
+
+    Args:
+        transport (Transport): The transport that sends the requests.
+        recording (Recording, optional): Where the exchanges are added. Defaults to a new one.
+
+    Example:
+        >>> recorder = RecordingTransport(RequestsTransport())
+        >>> client = SkribbleClient(username, api_key, transport=recorder)
+        >>> ...
+        >>> recorder.recording.save("traffic.jsonl")
+    """
+
+    def __init__(self, transport: Transport, recording: Optional[Recording] = None):
+        self.transport: Transport = transport
+        self.recording: Recording = recording if recording is not None else Recording()
+
+    @property
+    def session(self) -> Any:
+        return getattr(self.transport, "session", None)
+
+    def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, data: Body = None, stream: bool = False) -> Any:
+        response = self.transport.send(method, url, headers=headers, params=params, data=data, stream=stream)
+        try:
+            content = response.content
+        finally:
+            response.close()
+        path, query = _path_and_query(url, params)
+        response_headers = {name: value for name, value in response.headers.items() if name.lower() not in ("content-length", "content-encoding", "transfer-encoding", "connection")}
+        self.recording.add(Exchange(method.upper(), _strip_prefix(path), query, response.status_code, response_headers, content))
+        return Response(response.status_code, response_headers, content=content)
+
+    def close(self) -> None:
+        self.transport.close()
+
+def _strip_prefix(path: str) -> str:
+    return path[len(API_PREFIX):] if path.startswith(API_PREFIX) else path
@@ -0,0 +1,212 @@
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, List, Optional
+from urllib.parse import urlsplit
+from .mock_api import API_PREFIX, MockSkribbleAPI
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open, like the real API, so the client's pool is exercised
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate segments; without TCP_NODELAY every
+    # keep-alive response stalls ~40ms on the client's delayed ACK.
+    disable_nagle_algorithm = True
+    api: MockSkribbleAPI
+    traffic: "_Traffic"
+
+    def setup(self) -> None:
+        super().setup()
+        self.rfile = _CountingFile(self.rfile, self.traffic.add_received)
+        self.wfile = _CountingFile(self.wfile, self.traffic.add_sent)
+
+    def _read_body(self) -> bytes:
+        if "chunked" not in self.headers.get("Transfer-Encoding", "").lower():
+            length = int(self.headers.get("Content-Length") or 0)
+            return self.rfile.read(length) if length else b""
+        # Streamed uploads of unknown length, e.g. compressed on the fly, arrive in chunks
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b";", 1)[0], 16)
+            if not size:
+                break
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+            pass
+        return b"".join(chunks)
+
+    def _respond(self) -> None:
+        url = urlsplit(self.path)
+        body = self._read_body()
+        response = self.api.handle(self.command, url.path, url.query, dict(self.headers.items()), body)
+
+        self.send_response(response.status_code)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.content)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(response.content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+class _CountingFile:
+    """
+    Passes reads and writes on to ``file`` and reports the number of bytes to ``count``.
+    """
+
+    def __init__(self, file: Any, count: Callable[[int], None]):
+        self._file = file
+        self._count = count
+
+    def read(self, *args: Any) -> bytes:
+        data = self._file.read(*args)
+        self._count(len(data))
+        return data
+
+    def readline(self, *args: Any) -> bytes:
+        line = self._file.readline(*args)
+        self._count(len(line))
+        return line
+
+    def write(self, data: bytes) -> int:
+        self._count(len(data))
+        return self._file.write(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
+class _Traffic:
+    def __init__(self):
+        self.received: int = 0
+        self.sent: int = 0
+        self._lock = threading.Lock()
+
+    def add_received(self, count: int) -> None:
+        with self._lock:
+            self.received += count
+
+    def add_sent(self, count: int) -> None:
+        with self._lock:
+            self.sent += count
+
+class MockSkribbleServer:
+    """
+    Serves a :class:`~skribble.testing.MockSkribbleAPI` over HTTP on localhost, in a
+    background thread with one thread per connection.
+
+    Args:
+        api (MockSkribbleAPI, optional): The API to serve. Defaults to ``MockSkribbleAPI()``.
+        host (str): The interface to listen on.
+        port (int): The port to listen on; 0 picks a free one.
+
+    Example:
+        >>> with MockSkribbleServer(MockSkribbleAPI(latency=0.05)) as server:
+        ...     with skribble.use_client(server.client()):
+        ...         skribble.signature_request.list()
+    """
+
+    def __init__(self, api: Optional[MockSkribbleAPI] = None, host: str = "127.0.0.1", port: int = 0):
+        self.api: MockSkribbleAPI = api if api is not None else MockSkribbleAPI()
+        self._traffic = _Traffic()
+        handler = type("Handler", (_Handler,), {"api": self.api, "traffic": self._traffic})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        The URL to use as the client's ``BASE_URL``, e.g. ``http://127.0.0.1:53127/v2``.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    @property
+    def bytes_received(self) -> int:
+        """
+        Bytes of HTTP requests (request lines, headers and bodies) read by the server so far.
+        """
+        return self._traffic.received
+
+    @property
+    def bytes_sent(self) -> int:
+        """
+        Bytes of HTTP responses (status lines, headers and bodies) written by the server so far.
+        """
+        return self._traffic.sent
+
+    def start(self) -> "MockSkribbleServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="skribble-mock-server", daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        Serve on the calling thread until interrupted, instead of in the background.
+        """
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "MockSkribbleServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def client(self, **client_options) -> Any:
+        """
+        Return a :class:`~skribble.client.SkribbleClient` that talks to this server.
+
+        ``client_options`` are passed to the client, e.g. ``config`` or ``hooks``.
+        """
+        from ..client import SkribbleClient
+        client = SkribbleClient(username="api_user", api_key="mock-api-key", **client_options)
+        client.BASE_URL = self.base_url
+        return client
+
+    def async_client(self, **client_options) -> Any:
+        """
+        Return an :class:`~skribble.aio.AsyncSkribbleClient` that talks to this server.
+        """
+        from ..aio.client import AsyncSkribbleClient
+        client = AsyncSkribbleClient(username="api_user", api_key="mock-api-key", **client_options)
+        client.BASE_URL = self.base_url
+        return client
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Run a mock server in the foreground: ``python -m skribble.testing --port 8080``.
+
+    Prints the base URL once the server is listening, so that another process can wait for it.
+    """
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the Skribble v2 API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds every request is delayed")
+    parser.add_argument("--document-size", type=int, default=256 * 1024, help="bytes per downloaded document")
+    parser.add_argument("--preview-size", type=int, default=32 * 1024, help="bytes per page preview")
+    parser.add_argument("--page-count", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0, help="number of signature requests to create up front")
+    args = parser.parse_args(argv)
+
+    api = MockSkribbleAPI(latency=args.latency, document_size=args.document_size, preview_size=args.preview_size, page_count=args.page_count)
+    api.seed(args.seed)
+    server = MockSkribbleServer(api, args.host, args.port)
+    print(server.base_url, flush=True)
+    server.serve_forever()
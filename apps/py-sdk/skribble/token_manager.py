@@ -0,0 +1,183 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from typing import Awaitable, Callable, Optional
+from .exceptions import SkribbleAuthError
+
+#: Seconds before the token's expiry at which it is proactively refreshed.
+DEFAULT_REFRESH_MARGIN: float = 60.0
+
+def token_expiry(token: str) -> Optional[float]:
+    """
+    Return the expiry of a JWT access token as a Unix timestamp.
+
+    The signature is not verified; the ``exp`` claim is only used to schedule refreshes.
+    Returns ``None`` if the token is not a JWT or carries no ``exp`` claim.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+class _TokenState:
+    """
+    Token bookkeeping shared by :class:`TokenManager` and :class:`AsyncTokenManager`.
+    """
+
+    def __init__(self, access_token: Optional[str] = None, refresh_margin: float = DEFAULT_REFRESH_MARGIN, clock: Callable[[], float] = time.time):
+        self.refresh_margin: float = refresh_margin
+        self._clock: Callable[[], float] = clock
+        self._token: Optional[str] = None
+        self._expires_at: Optional[float] = None
+        if access_token:
+            self.set_token(access_token)
+
+    @property
+    def token(self) -> Optional[str]:
+        """
+        The current token, without refreshing it.
+        """
+        return self._token
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """
+        Unix timestamp at which the current token expires, if known.
+        """
+        return self._expires_at
+
+    def set_token(self, token: Optional[str]) -> None:
+        self._token = token
+        self._expires_at = token_expiry(token) if token else None
+
+    def is_fresh(self) -> bool:
+        """
+        Whether a token is held and is not within ``refresh_margin`` of its expiry.
+
+        Tokens with an unknown expiry are considered fresh until the API rejects them.
+        """
+        if not self._token:
+            return False
+        if self._expires_at is None:
+            return True
+        return self._clock() < self._expires_at - self.refresh_margin
+
+    def _missing_credentials(self) -> SkribbleAuthError:
+        if self._token:
+            return SkribbleAuthError("Access token has expired and no credentials are available to refresh it")
+        return SkribbleAuthError("Username and API key are required for authentication")
+
+class TokenManager(_TokenState):
+    """
+    Keeps the access token of a :class:`~skribble.client.SkribbleClient` fresh.
+
+    The token is refreshed ``refresh_margin`` seconds ahead of the expiry read from its
+    ``exp`` claim. Logins are single-flight: while one thread logs in, concurrent callers
+    block and then reuse the new token instead of logging in themselves.
+
+    Args:
+        login (Callable[[], str], optional): Performs a login and returns a new token. Without
+            it the manager can only hand out the token it was created with.
+        access_token (str, optional): A pre-authenticated access token.
+        refresh_margin (float): Seconds before expiry at which the token is refreshed.
+    """
+
+    def __init__(self, login: Optional[Callable[[], str]] = None, access_token: Optional[str] = None, refresh_margin: float = DEFAULT_REFRESH_MARGIN, clock: Callable[[], float] = time.time):
+        super().__init__(access_token, refresh_margin, clock)
+        self._login: Optional[Callable[[], str]] = login
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def can_refresh(self) -> bool:
+        return self._login is not None
+
+    def get_token(self) -> str:
+        """
+        Return a usable token, logging in first if there is none or it is about to expire.
+        """
+        if self.is_fresh():
+            return self._token
+        if not self.can_refresh:
+            if self._token:
+                return self._token
+            raise self._missing_credentials()
+        with self._lock:
+            # Another thread may have refreshed while we were waiting for the lock
+            if not self.is_fresh():
+                self.set_token(self._login())
+            return self._token
+
+    def refresh(self, stale_token: Optional[str] = None) -> str:
+        """
+        Force a new login after the API rejected ``stale_token``.
+
+        If another thread already replaced ``stale_token`` in the meantime, its token is
+        returned without logging in again.
+
+        Raises:
+            SkribbleAuthError: If there are no credentials to log in with.
+        """
+        if not self.can_refresh:
+            raise self._missing_credentials()
+        with self._lock:
+            if self._token and self._token != stale_token:
+                return self._token
+            self.set_token(self._login())
+            return self._token
+
+class AsyncTokenManager(_TokenState):
+    """
+    Asynchronous counterpart of :class:`TokenManager` for :class:`~skribble.aio.AsyncSkribbleClient`.
+
+    Concurrent coroutines awaiting a refresh share a single login.
+    """
+
+    def __init__(self, login: Optional[Callable[[], Awaitable[str]]] = None, access_token: Optional[str] = None, refresh_margin: float = DEFAULT_REFRESH_MARGIN, clock: Callable[[], float] = time.time):
+        super().__init__(access_token, refresh_margin, clock)
+        self._login: Optional[Callable[[], Awaitable[str]]] = login
+        # Created lazily so the manager can be built outside of a running event loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def can_refresh(self) -> bool:
+        return self._login is not None
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def get_token(self) -> str:
+        """
+        Return a usable token, logging in first if there is none or it is about to expire.
+        """
+        if self.is_fresh():
+            return self._token
+        if not self.can_refresh:
+            if self._token:
+                return self._token
+            raise self._missing_credentials()
+        async with self._get_lock():
+            if not self.is_fresh():
+                self.set_token(await self._login())
+            return self._token
+
+    async def refresh(self, stale_token: Optional[str] = None) -> str:
+        """
+        Force a new login after the API rejected ``stale_token``.
+
+        Raises:
+            SkribbleAuthError: If there are no credentials to log in with.
+        """
+        if not self.can_refresh:
+            raise self._missing_credentials()
+        async with self._get_lock():
+            if self._token and self._token != stale_token:
+                return self._token
+            self.set_token(await self._login())
+            return self._token
@@ -0,0 +1,368 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode, urlsplit
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from .config import ClientConfig
+from .streaming import DEFAULT_CHUNK_SIZE
+
+Body = Union[bytes, Iterable[bytes], None]
+
+#: Signature of the handlers answering requests for :class:`InMemoryTransport`:
+#: ``handler(method, path, query, headers, body)`` returning an object with ``status_code``,
+#: ``headers`` and ``content``, such as :meth:`skribble.testing.MockSkribbleAPI.handle`.
+Handler = Callable[[str, str, str, Mapping[str, str], bytes], Any]
+
+class TransportError(Exception):
+    """
+    Raised by a transport when a request failed without a response.
+
+    Args:
+        message (str): Description of the failure.
+        retryable (bool): Whether the failure is transient (connection errors and timeouts)
+            and the request may be retried according to the client's retry policy.
+    """
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable: bool = retryable
+
+class Response:
+    """
+    A response as returned by the transports that do not hand out their library's own
+    response objects.
+
+    It offers the subset of the ``requests`` and ``httpx`` response interfaces the SDK
+    relies on: ``status_code``, case-insensitive ``headers``, ``content`` and ``text``,
+    chunked iteration and closing, both synchronously and asynchronously.
+
+    Args:
+        status_code (int): The HTTP status code.
+        headers (Mapping[str, str]): The response headers.
+        content (bytes, optional): The body, if it has been read already.
+        stream (Callable[[int], Iterator[bytes]], optional): Yields the unread body in chunks
+            of the given size; used when ``content`` is ``None``.
+        on_close (Callable[[], None], optional): Releases the underlying connection.
+    """
+
+    def __init__(self, status_code: int, headers: Mapping[str, str], content: Optional[bytes] = None, stream: Optional[Callable[[int], Iterator[bytes]]] = None, on_close: Optional[Callable[[], None]] = None):
+        self.status_code: int = status_code
+        self.headers: CaseInsensitiveDict = CaseInsensitiveDict(headers)
+        self._content: Optional[bytes] = content if content is not None or stream is not None else b""
+        self._stream = stream
+        self._on_close = on_close
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = b"".join(self._stream(DEFAULT_CHUNK_SIZE))
+        return self._content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def iter_content(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        if self._content is None:
+            return self._stream(chunk_size)
+        return (self._content[start:start + chunk_size] for start in range(0, len(self._content), chunk_size))
+
+    def close(self) -> None:
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    async def aread(self) -> bytes:
+        return self.content
+
+    async def aiter_bytes(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        for chunk in self.iter_content(chunk_size):
+            yield chunk
+
+    async def aclose(self) -> None:
+        self.close()
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests of a :class:`~skribble.client.SkribbleClient`.
+
+    Every request of the client, including logins and binary downloads, goes through
+    :meth:`send`, so a transport decides which HTTP library is used, or whether the network
+    is used at all. Subclass it and implement :meth:`send` to plug in another library.
+    """
+
+    @abstractmethod
+    def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, data: Body = None, stream: bool = False) -> Any:
+        """
+        Send a request and return the response, whatever its status code.
+
+        The response must provide ``status_code``, case-insensitive ``headers``, ``content``,
+        ``text``, ``iter_content(chunk_size)`` and ``close()``. With ``stream=True`` the body
+        must not be read before the caller consumes it.
+
+        Raises:
+            TransportError: If no response was received.
+        """
+
+    def close(self) -> None:
+        """
+        Release the connections held by the transport.
+        """
+
+class AsyncTransport(ABC):
+    """
+    Sends the HTTP requests of an :class:`~skribble.aio.AsyncSkribbleClient`.
+
+    The asynchronous counterpart of :class:`Transport`. Responses must provide
+    ``aread()``, ``aiter_bytes(chunk_size)`` and ``aclose()`` instead of the blocking methods.
+    """
+
+    @abstractmethod
+    async def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, data: Body = None, stream: bool = False) -> Any:
+        """
+        Send a request and return the response, whatever its status code.
+
+        Raises:
+            TransportError: If no response was received.
+        """
+
+    async def aclose(self) -> None:
+        pass
+
+class RequestsTransport(Transport):
+    """
+    Transport backed by a pooled ``requests.Session``; the default of the synchronous client.
+
+    Args:
+        config (ClientConfig, optional): Connection pool and timeout settings.
+    """
+
+    def __init__(self, config: Optional[ClientConfig] = None):
+        self.config: ClientConfig = config if config is not None else ClientConfig()
+        self.session: requests.Session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not self.config.keep_alive:
+            self.session.headers["Connection"] = "close"
+        if not self.config.compress_responses:
+            # requests asks for every encoding urllib3 can decode by default
+            self.session.headers["Accept-Encoding"] = "identity"
+
+    def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, data: Body = None, stream: bool = False) -> Any:
+        try:
+            return self.session.request(method, url, headers=headers, params=params, data=data, stream=stream, timeout=self.config.timeout)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as error:
+            raise TransportError(str(error), retryable=True) from error
+        except requests.exceptions.RequestException as error:
+            raise TransportError(str(error)) from error
+
+    def close(self) -> None:
+        self.session.close()
+
+class Urllib3Transport(Transport):
+    """
+    Transport backed by a ``urllib3.PoolManager``, without the per-request overhead of
+    ``requests`` (session merging, hooks, cookie handling).
+
+    Args:
+        config (ClientConfig, optional): Connection pool and timeout settings.
+    """
+
+    def __init__(self, config: Optional[ClientConfig] = None):
+        self.config: ClientConfig = config if config is not None else ClientConfig()
+        self.headers: Dict[str, str] = {"Accept-Encoding": _accept_encoding(self.config)}
+        if not self.config.keep_alive:
+            self.headers["Connection"] = "close"
+        self.pool = urllib3.PoolManager(
+            num_pools=self.config.pool_connections,
+            maxsize=self.config.pool_maxsize,
+            block=self.config.pool_block,
+            timeout=urllib3.Timeout(connect=self.config.connect_timeout, read=self.config.read_timeout),
+            retries=False
+        )
+
+    def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, data: Body = None, stream: bool = False) -> Any:
+        if params:
+            url = f"{url}{'&' if urlsplit(url).query else '?'}{urlencode(params, doseq=True)}"
+        exceptions = urllib3.exceptions
+        try:
+            response = self.pool.request(method, url, headers={**self.headers, **(headers or {})}, body=data, preload_content=not stream, redirect=False)
+        except (exceptions.NewConnectionError, exceptions.ConnectTimeoutError, exceptions.ReadTimeoutError, exceptions.ProtocolError) as error:
+            raise TransportError(str(error), retryable=True) from error
+        except exceptions.HTTPError as error:
+            raise TransportError(str(error)) from error
+
+        if not stream:
+            return Response(response.status, response.headers, content=response.data)
+        return Response(response.status, response.headers, stream=lambda chunk_size: response.stream(chunk_size), on_close=lambda: _release(response))
+
+    def close(self) -> None:
+        self.pool.clear()
+
+class HTTPXTransport(Transport):
+    """
+    Transport backed by a synchronous ``httpx.Client``.
+
+    With ``config.http2`` the client negotiates HTTP/2, and the requests of all threads are
+    multiplexed over a few connections; ``pool_maxsize`` then caps connections, not requests.
+
+    Args:
+        config (ClientConfig, optional): Connection pool, timeout and HTTP/2 settings.
+
+    Raises:
+        ImportError: If the optional ``httpx`` dependency, or ``h2`` for HTTP/2, is not installed.
+    """
+
+    def __init__(self, config: Optional[ClientConfig] = None):
+        self.config: ClientConfig = config if config is not None else ClientConfig()
+        self._httpx = _import_httpx("HTTPXTransport", self.config.http2)
+        self.session: Any = self._httpx.Client(http2=self.config.http2, headers=_httpx_headers(self.config), limits=_httpx_limits(self._httpx, self.config), timeout=_httpx_timeout(self._httpx, self.config))
+
+    def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, data: Body = None, stream: bool = False) -> Any:
+        httpx = self._httpx
+        try:
+            response = self.session.send(self.session.build_request(method, url, headers=headers, params=params, content=data), stream=stream)
+        except httpx.TransportError as error:
+            raise TransportError(str(error), retryable=True) from error
+        except httpx.HTTPError as error:
+            raise TransportError(str(error)) from error
+
+        if not stream:
+            return Response(response.status_code, response.headers, content=response.content)
+        return Response(response.status_code, response.headers, stream=response.iter_bytes, on_close=response.close)
+
+    def close(self) -> None:
+        self.session.close()
+
+class HTTPXAsyncTransport(AsyncTransport):
+    """
+    Transport backed by a pooled ``httpx.AsyncClient``; the default of the asynchronous client.
+
+    With ``config.http2`` the concurrent requests of the event loop are multiplexed over
+    a few HTTP/2 connections.
+
+    Args:
+        config (ClientConfig, optional): Connection pool, timeout and HTTP/2 settings.
+
+    Raises:
+        ImportError: If the optional ``httpx`` dependency, or ``h2`` for HTTP/2, is not installed.
+    """
+
+    def __init__(self, config: Optional[ClientConfig] = None):
+        self.config: ClientConfig = config if config is not None else ClientConfig()
+        self._httpx = _import_httpx("The asynchronous client", self.config.http2)
+        self.session: Any = self._httpx.AsyncClient(http2=self.config.http2, headers=_httpx_headers(self.config), limits=_httpx_limits(self._httpx, self.config), timeout=_httpx_timeout(self._httpx, self.config))
+
+    async def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, data: Body = None, stream: bool = False) -> Any:
+        httpx = self._httpx
+        try:
+            return await self.session.send(self.session.build_request(method, url, headers=headers, params=params, content=data), stream=stream)
+        except httpx.TransportError as error:
+            raise TransportError(str(error), retryable=True) from error
+        except httpx.HTTPError as error:
+            raise TransportError(str(error)) from error
+
+    async def aclose(self) -> None:
+        await self.session.aclose()
+
+class InMemoryTransport(Transport):
+    """
+    Transport that answers requests by calling ``handler`` in-process, without sockets.
+
+    Pair it with :class:`~skribble.testing.MockSkribbleAPI` or a replayed
+    :class:`~skribble.testing.Recording` to run the whole client stack (validation, retries,
+    caching, decoding) at full CPU speed in tests and load tests.
+
+    Args:
+        handler: Called as ``handler(method, path, query, headers, body)``; returns an
+            object with ``status_code``, ``headers`` and ``content``.
+
+    Example:
+        >>> api = MockSkribbleAPI()
+        >>> client = SkribbleClient(username="user", api_key="key", transport=InMemoryTransport(api.handle))
+    """
+
+    def __init__(self, handler: Handler):
+        self.handler: Handler = handler
+
+    def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, data: Body = None, stream: bool = False) -> Any:
+        path, query = _path_and_query(url, params)
+        body = data if data is None or isinstance(data, bytes) else b"".join(data)
+        answer = self.handler(method, path, query, dict(headers or {}), body or b"")
+        return Response(answer.status_code, answer.headers, content=answer.content)
+
+class AsyncInMemoryTransport(AsyncTransport):
+    """
+    Asynchronous version of :class:`InMemoryTransport`.
+
+    ``handler`` is called on the event loop and may be a coroutine function.
+    """
+
+    def __init__(self, handler: Handler):
+        self.handler: Handler = handler
+
+    async def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, data: Body = None, stream: bool = False) -> Any:
+        path, query = _path_and_query(url, params)
+        if data is not None and not isinstance(data, bytes):
+            data = b"".join([chunk async for chunk in data] if hasattr(data, "__aiter__") else data)
+        answer = self.handler(method, path, query, dict(headers or {}), data or b"")
+        if asyncio.iscoroutine(answer):
+            answer = await answer
+        return Response(answer.status_code, answer.headers, content=answer.content)
+
+def _path_and_query(url: str, params: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    parts = urlsplit(url)
+    return parts.path, "&".join(part for part in (parts.query, urlencode(params or {}, doseq=True)) if part)
+
+def _release(response: Any) -> None:
+    # A fully read body has released its connection already; a partly read one would leave
+    # unread bytes on a keep-alive connection, so that connection is dropped instead
+    if not response.closed:
+        response.close()
+    response.release_conn()
+
+def default_transport(config: ClientConfig) -> Transport:
+    """
+    The transport a :class:`~skribble.client.SkribbleClient` uses when none is given:
+    :class:`HTTPXTransport` if ``config.http2`` is set, otherwise :class:`RequestsTransport`.
+    """
+    return HTTPXTransport(config) if config.http2 else RequestsTransport(config)
+
+def _import_httpx(feature: str, http2: bool = False) -> Any:
+    # Imported when an httpx transport is created, so the default transport does not load httpx
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(f"{feature} requires httpx. Install it with: pip install skribble-sdk[async]") from None
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            raise ImportError("HTTP/2 requires the h2 package. Install it with: pip install skribble-sdk[http2]") from None
+    return httpx
+
+def _accept_encoding(config: ClientConfig) -> str:
+    # The encodings urllib3 can decode: gzip and deflate, plus br and zstd if brotli and zstandard are installed
+    return urllib3.util.make_headers(accept_encoding=True)["accept-encoding"] if config.compress_responses else "identity"
+
+def _httpx_headers(config: ClientConfig) -> Dict[str, str]:
+    # httpx asks for every encoding it can decode by default
+    return {} if config.compress_responses else {"Accept-Encoding": "identity"}
+
+def _httpx_limits(httpx: Any, config: ClientConfig) -> Any:
+    return httpx.Limits(
+        max_connections=config.pool_maxsize,
+        max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0,
+        keepalive_expiry=config.keepalive_expiry
+    )
+
+def _httpx_timeout(httpx: Any, config: ClientConfig) -> Any:
+    return httpx.Timeout(config.read_timeout, connect=config.connect_timeout)
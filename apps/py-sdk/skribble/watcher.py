@@ -0,0 +1,258 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+from .client_manager import get_client
+from .concurrency import DEFAULT_CONCURRENCY, ItemResult, bounded_map, _check_concurrency
+from .exceptions import SkribbleValidationError, SkribbleAPIError
+from .signature_request.operations import _list_params
+
+#: Seconds between two polls of a :class:`StatusWatcher`.
+DEFAULT_INTERVAL = 30.0
+
+class StatusChange(NamedTuple):
+    """
+    A change of a watched signature request, as emitted by :class:`StatusWatcher`.
+
+    Attributes:
+        signature_request_id (str): ID of the signature request.
+        previous_status (str, optional): ``status_overall`` before the change, or ``None`` if
+            the request had not been seen by the watcher yet.
+        status (str, optional): ``status_overall`` after the change, or ``None`` if the request was deleted.
+        signature_request (dict, optional): The current signature request, or ``None`` if it was deleted.
+        final (bool): The request left the watched status (or was deleted) and is no longer watched.
+    """
+    signature_request_id: str
+    previous_status: Optional[str]
+    status: Optional[str]
+    signature_request: Optional[Dict[str, Any]]
+    final: bool
+
+def _fingerprint(signature_request: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    The parts of a signature request whose change is reported: overall status, signer states
+    and the modification time.
+    """
+    signers = tuple(sorted(
+        (str(signature.get("sid")), str(signature.get("status_code")))
+        for signature in signature_request.get("signatures") or []
+    ))
+    return signature_request.get("status_overall"), signature_request.get("updated_at"), signers
+
+class _BaseStatusWatcher:
+    """
+    Bookkeeping shared by :class:`StatusWatcher` and the asynchronous watcher: the watched
+    IDs, the last snapshot of each and the diffing of new observations against it.
+    """
+
+    def __init__(
+        self,
+        signature_request_ids: Iterable[str] = (),
+        status_overall: Optional[str] = "OPEN",
+        account_email: Optional[str] = None,
+        interval: float = DEFAULT_INTERVAL,
+        page_size: int = 100,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fetch_details: bool = True
+    ):
+        if page_size <= 0:
+            raise SkribbleValidationError("'page_size' must be greater than 0")
+        _check_concurrency(concurrency)
+        self.status_overall: Optional[str] = status_overall
+        self.account_email: Optional[str] = account_email
+        self.interval: float = interval
+        self.page_size: int = page_size
+        self.concurrency: int = concurrency
+        self.fetch_details: bool = fetch_details
+        # Fingerprint of the last observation of each watched ID; None until first seen
+        self._snapshot: Dict[str, Optional[Tuple[Any, ...]]] = {}
+        self._lock = threading.Lock()
+        self.add(signature_request_ids)
+
+    def add(self, signature_request_ids: Iterable[str]) -> None:
+        """
+        Start watching ``signature_request_ids``; IDs already watched are ignored.
+        """
+        with self._lock:
+            for signature_request_id in signature_request_ids:
+                self._snapshot.setdefault(signature_request_id, None)
+
+    def remove(self, signature_request_ids: Iterable[str]) -> None:
+        """
+        Stop watching ``signature_request_ids``.
+        """
+        with self._lock:
+            for signature_request_id in signature_request_ids:
+                self._snapshot.pop(signature_request_id, None)
+
+    @property
+    def watching(self) -> List[str]:
+        """
+        IDs of the signature requests still being watched.
+        """
+        with self._lock:
+            return [*self._snapshot]
+
+    def __contains__(self, signature_request_id: str) -> bool:
+        return signature_request_id in self._snapshot
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def _page_params(self, page_number: int) -> Dict[str, Any]:
+        return _list_params(self.account_email, None, None, self.status_overall, page_number, self.page_size)
+
+    def _scan(self, page: List[Dict[str, Any]], seen: Set[str], to_fetch: List[str], changes: List[StatusChange]) -> bool:
+        """
+        Diff one page of the listing against the snapshot.
+
+        Changed requests are queued in ``to_fetch`` when details are fetched, otherwise
+        reported right away. Returns ``True`` once no further page needs to be requested.
+        """
+        with self._lock:
+            for signature_request in page:
+                signature_request_id = signature_request.get("id")
+                if signature_request_id not in self._snapshot or signature_request_id in seen:
+                    continue
+                seen.add(signature_request_id)
+                previous = self._snapshot[signature_request_id]
+                if self.fetch_details and previous is not None and previous != _fingerprint(signature_request):
+                    to_fetch.append(signature_request_id)
+                    continue
+                change = self._observe(signature_request_id, signature_request)
+                if change is not None:
+                    changes.append(change)
+            return len(page) < self.page_size or len(seen) >= len(self._snapshot)
+
+    def _unseen(self, seen: Set[str]) -> List[str]:
+        with self._lock:
+            return [signature_request_id for signature_request_id in self._snapshot if signature_request_id not in seen]
+
+    def _resolve(self, outcomes: Iterable[ItemResult], changes: List[StatusChange]) -> List[StatusChange]:
+        """
+        Diff the individually fetched requests against the snapshot.
+
+        A 404 means the request was deleted. On any other error the request keeps its
+        snapshot and is fetched again on the next poll.
+        """
+        with self._lock:
+            for outcome in outcomes:
+                if outcome.item not in self._snapshot:
+                    # Removed while the poll was running
+                    continue
+                if outcome.ok:
+                    change = self._observe(outcome.item, outcome.result)
+                elif isinstance(outcome.error, SkribbleAPIError) and outcome.error.status_code == 404:
+                    change = self._observe(outcome.item, None)
+                else:
+                    change = None
+                if change is not None:
+                    changes.append(change)
+        return changes
+
+    def _observe(self, signature_request_id: str, signature_request: Optional[Dict[str, Any]]) -> Optional[StatusChange]:
+        """
+        Record the current state of a request and return the change it represents, if any.
+
+        Must be called with the lock held.
+        """
+        previous = self._snapshot[signature_request_id]
+        previous_status = previous[0] if previous is not None else None
+        if signature_request is None:
+            del self._snapshot[signature_request_id]
+            return StatusChange(signature_request_id, previous_status, None, None, True)
+
+        fingerprint = _fingerprint(signature_request)
+        if self.status_overall is not None and fingerprint[0] != self.status_overall:
+            # Left the watched status, e.g. signed, declined or withdrawn
+            del self._snapshot[signature_request_id]
+            return StatusChange(signature_request_id, previous_status, fingerprint[0], signature_request, True)
+
+        self._snapshot[signature_request_id] = fingerprint
+        if previous is not None and previous != fingerprint:
+            return StatusChange(signature_request_id, previous_status, fingerprint[0], signature_request, False)
+        return None
+
+class StatusWatcher(_BaseStatusWatcher):
+    """
+    Follow the status of many signature requests with as few API calls as possible.
+
+    Instead of getting every request on each poll, the watcher pages through the listing of
+    requests in ``status_overall`` (open ones by default) and compares each watched request
+    with the previous poll. Only requests whose signers, status or modification time changed
+    are fetched in detail, as are watched requests missing from the listing, which have been
+    signed, declined, withdrawn or deleted in the meantime. Paging stops as soon as all watched
+    requests have been seen.
+
+    The first poll records the current state without reporting it, except for requests that
+    are already past ``status_overall``. A request that leaves ``status_overall`` is reported
+    with ``final=True`` and no longer watched; the watcher stops once none is left.
+
+    Args:
+        signature_request_ids (Iterable[str]): IDs to watch; more can be added with :meth:`add`.
+        status_overall (str, optional): Status of the watched requests. ``None`` lists all requests
+            and only stops watching deleted ones.
+        account_email (str, optional): Narrow the listing to requests of this signer, if all
+            watched requests share one.
+        interval (float): Seconds between two polls.
+        page_size (int): Number of requests listed per call.
+        concurrency (int): Maximum number of requests fetched in detail at once.
+        fetch_details (bool): Fetch changed requests in detail instead of reporting the listing entry.
+
+    Example:
+        >>> watcher = skribble.StatusWatcher(open_ids, interval=60)
+        >>> for change in watcher.watch():
+        ...     print(change.signature_request_id, change.previous_status, "->", change.status)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stopped = threading.Event()
+
+    def poll(self) -> List[StatusChange]:
+        """
+        Compare the watched requests with the previous poll once and return the changes.
+        """
+        changes: List[StatusChange] = []
+        if not self._snapshot:
+            return changes
+        client = get_client()
+
+        seen: Set[str] = set()
+        to_fetch: List[str] = []
+        page_number = 0
+        while True:
+            page = client._make_request("GET", "/signature-requests", params=self._page_params(page_number)) or []
+            if self._scan(page, seen, to_fetch, changes):
+                break
+            page_number += 1
+
+        to_fetch.extend(self._unseen(seen))
+        if to_fetch:
+            fetch = lambda signature_request_id: client._make_request("GET", f"/signature-requests/{signature_request_id}")
+            self._resolve(bounded_map(fetch, to_fetch, self.concurrency, ordered=False), changes)
+        return changes
+
+    def watch(self) -> Iterator[StatusChange]:
+        """
+        Poll every ``interval`` seconds and yield the changes, until no request is left
+        to watch or :meth:`stop` is called.
+        """
+        self._stopped.clear()
+        while self._snapshot and not self._stopped.is_set():
+            yield from self.poll()
+            if self._snapshot:
+                self._stopped.wait(self.interval)
+
+    def run(self, on_change: Callable[[StatusChange], Any]) -> None:
+        """
+        Like :meth:`watch`, but call ``on_change`` with every change. Blocks until the watcher stops.
+        """
+        for change in self.watch():
+            on_change(change)
+
+    def stop(self) -> None:
+        """
+        Stop :meth:`watch` or :meth:`run`, from another thread or from the callback.
+        """
+        self._stopped.set()
+
+    __iter__ = watch
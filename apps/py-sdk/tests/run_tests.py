@@ -10,6 +10,21 @@ from tests.test_signature_request import TestSignatureRequest
 from tests.test_attachment import TestAttachment
 from tests.test_document import TestDocument
 from tests.test_seal import TestSeal
+from tests.test_aio import TestAsyncOperations
+from tests.test_token_manager import TestTokenManager
+from tests.test_retry import TestRetryPolicy, TestClientRetries
+from tests.test_client import TestClientConfig, TestJSONCodec
+from tests.test_registry import TestClientScoping
+from tests.test_cache import TestResponseCache, TestClientCache
+from tests.test_disk_cache import TestDiskCache, TestClientDiskCache
+from tests.test_watcher import TestStatusWatcher, TestAsyncStatusWatcher
+from tests.test_callbacks import TestCallbackReceiver, TestAsyncCallbackReceiver
+from tests.test_responses import TestResponseViews
+from tests.test_imports import TestLazyImports
+from tests.test_hooks import TestRequestHooks, TestAsyncRequestHooks
+from tests.test_mock_server import TestMockSkribbleAPI, TestMockSkribbleServer
+from tests.test_transport import TestTransports, TestAsyncTransports
+from tests.test_compression import TestCompression, TestAsyncCompression
 
 if __name__ == '__main__':
     # Create a test suite
@@ -20,6 +35,31 @@ if __name__ == '__main__':
     test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestAttachment))
     test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestDocument))
     test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestSeal))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestAsyncOperations))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestTokenManager))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestRetryPolicy))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestClientRetries))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestClientConfig))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestJSONCodec))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestClientScoping))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestResponseCache))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestClientCache))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestDiskCache))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestClientDiskCache))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestStatusWatcher))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestAsyncStatusWatcher))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestCallbackReceiver))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestAsyncCallbackReceiver))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestResponseViews))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestLazyImports))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestRequestHooks))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestAsyncRequestHooks))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestMockSkribbleAPI))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestMockSkribbleServer))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestTransports))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestAsyncTransports))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestCompression))
+    test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestAsyncCompression))
 
     # Run the tests
     runner = unittest.TextTestRunner(verbosity=2)
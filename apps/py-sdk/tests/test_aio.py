@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+from skribble.aio import signature_request, document, seal
+from skribble.exceptions import SkribbleValidationError, SkribbleOperationError, SkribbleAPIError
+
+class TestAsyncOperations(unittest.IsolatedAsyncioTestCase):
+
+    @patch('skribble.aio.signature_request.get_client')
+    async def test_create_signature_request(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request = AsyncMock(return_value={"id": "test_id"})
+
+        result = await signature_request.create({
+            "title": "Test Signature Request",
+            "file_url": "https://example.com/test.pdf",
+            "signatures": [{"account_email": "signer1@example.com"}]
+        })
+        self.assertEqual(result, {"id": "test_id"})
+        method, endpoint = mock_client._make_request.call_args.args
+        self.assertEqual((method, endpoint), ("POST", "/signature-requests"))
+
+    @patch('skribble.aio.signature_request.get_client')
+    async def test_add_signer_refuses_signed_request(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request = AsyncMock(return_value={"signatures": [{"status_code": "SIGNED"}]})
+
+        with self.assertRaises(SkribbleOperationError):
+            await signature_request.add_signer("test_id", {"account_email": "signer@example.com"})
+        mock_client._make_request.assert_awaited_once_with("GET", "/signature-requests/test_id")
+
+    @patch('skribble.aio.document.get_client')
+    async def test_get_document(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request = AsyncMock(return_value={
+            "id": "doc1",
+            "title": "Test Document",
+            "content_type": "application/pdf",
+            "size": 1024,
+            "owner": "test_owner"
+        })
+
+        result = await document.get("doc1")
+        self.assertEqual(result["id"], "doc1")
+        self.assertIsNone(result["page_count"])
+
+    @patch('skribble.aio.signature_request.get_client')
+    async def test_create_many_yields_as_completed(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request = AsyncMock(side_effect=[{"id": "first"}, SkribbleAPIError("Server error", status_code=500)])
+
+        async def requests():
+            for title in ["First", "Second"]:
+                yield {"title": title, "file_url": "https://example.com/test.pdf", "signatures": [{"account_email": "signer@example.com"}]}
+
+        results = [result async for result in signature_request.create_many(requests(), concurrency=2, ordered=False)]
+        self.assertEqual(sorted(result.ok for result in results), [False, True])
+        self.assertEqual(len(results), 2)
+
+    @patch('skribble.aio.attachment.get_client')
+    async def test_get_attachment_raises_api_errors(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._request_raw = AsyncMock(return_value=MagicMock(status_code=404, text="Not found"))
+
+        with self.assertRaises(SkribbleAPIError):
+            await signature_request.get_attachment("test_id", "attachment_id")
+
+    async def test_iter_all_validates_page_size_when_called(self):
+        with self.assertRaises(SkribbleValidationError):
+            signature_request.iter_all(page_size=0)
+
+    async def test_create_seal_validation_error(self):
+        with self.assertRaises(SkribbleValidationError):
+            await seal.create({})
+
+if __name__ == '__main__':
+    unittest.main()
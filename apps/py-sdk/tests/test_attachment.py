@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from skribble.attachment import operations
-from skribble.exceptions import SkribbleValidationError, SkribbleAPIError
+from skribble.exceptions import SkribbleValidationError, SkribbleAPIError, SkribbleOperationError
 
 class TestAttachment(unittest.TestCase):
 
@@ -45,5 +45,27 @@ class TestAttachment(unittest.TestCase):
         with self.assertRaises(SkribbleAPIError):
             operations.delete("test_sig_req_id", "test_attachment_id")
 
+    @patch('skribble.attachment.operations.get_client')
+    def test_add_attachments_reports_partial_failure(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        def upload(method, endpoint, data):
+            if data["filename"] == "broken.pdf":
+                raise SkribbleAPIError("Upload failed", status_code=500)
+            return {"attachment_id": data["filename"]}
+
+        mock_client._make_request.side_effect = upload
+        attachments = [{"filename": filename, "content_type": "application/pdf", "content": "dGVzdA=="} for filename in ["a.pdf", "broken.pdf", "c.pdf"]]
+
+        result = operations.add("test_sig_req_id", attachments, concurrency=3)
+        self.assertFalse(result.ok)
+        self.assertEqual([upload.result["attachment_id"] for upload in result.succeeded], ["a.pdf", "c.pdf"])
+        self.assertEqual([upload.index for upload in result.failed], [1])
+        self.assertEqual(mock_client._make_request.call_count, 3)
+        with self.assertRaises(SkribbleOperationError) as context:
+            result.raise_for_errors()
+        self.assertIsInstance(context.exception.original_error, SkribbleAPIError)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+from skribble.cache import ResponseCache
+from skribble.client import SkribbleClient
+from skribble import signature_request
+
+def make_response(json_body):
+    response = MagicMock(status_code=200, text="{}", content=json.dumps(json_body).encode(), headers={})
+    response.json.return_value = json_body
+    return response
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_entries_expire_and_least_recently_used_is_evicted(self):
+        now = [0.0]
+        cache = ResponseCache(maxsize=2, ttl=5, clock=lambda: now[0])
+        for key in ["/a/1", "/a/2"]:
+            cache.store(key, {"key": key}, cache.lookup(key)[2])
+        cache.lookup("/a/1")
+        cache.store("/a/3", {"key": "/a/3"}, cache.lookup("/a/3")[2])
+
+        self.assertFalse(cache.lookup("/a/2")[0])
+        self.assertTrue(cache.lookup("/a/1")[0])
+        now[0] = 6.0
+        self.assertFalse(cache.lookup("/a/1")[0])
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 5, 1))
+
+    def test_writes_invalidate_the_resource_and_its_children(self):
+        cache = ResponseCache()
+        for key in ["/signature-requests/sr1", "/signature-requests/sr1/attachments", "/signature-requests/sr2"]:
+            cache.store(key, {}, cache.lookup(key)[2])
+
+        cache.invalidate("/signature-requests", {"id": "sr1", "title": "Updated"})
+        self.assertFalse(cache.lookup("/signature-requests/sr1")[0])
+        self.assertFalse(cache.lookup("/signature-requests/sr1/attachments")[0])
+        self.assertTrue(cache.lookup("/signature-requests/sr2")[0])
+
+    def test_response_fetched_across_an_invalidation_is_not_stored(self):
+        cache = ResponseCache()
+        generation = cache.lookup("/documents/doc1")[2]
+        cache.invalidate("/documents/doc1")
+        cache.store("/documents/doc1", {"title": "Old"}, generation)
+        self.assertFalse(cache.lookup("/documents/doc1")[0])
+
+class TestClientCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ResponseCache()
+        self.client = SkribbleClient(access_token="token", cache=self.cache)
+        self.client.session = MagicMock()
+
+    def test_reads_are_cached_until_a_write(self):
+        self.client.session.request.side_effect = [
+            make_response({"id": "sr1", "signatures": []}),
+            make_response({"sid": "signer_1"}),
+            make_response({"id": "sr1", "signatures": [{"sid": "signer_1"}]})
+        ]
+
+        with patch('skribble.signature_request.operations.get_client', return_value=self.client):
+            first = signature_request.get("sr1")
+            first["title"] = "Changed locally"
+            self.assertNotIn("title", signature_request.get("sr1"))
+
+            signature_request.add_signer("sr1", {"account_email": "signer@example.com"}, check_signed=False)
+            self.assertEqual(len(signature_request.get("sr1")["signatures"]), 1)
+
+        self.assertEqual(self.client.session.request.call_count, 3)
+        self.assertEqual(self.cache.stats().hits, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import io
+import json
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+from urllib.parse import urlsplit
+from skribble.callbacks import CallbackReceiver
+from skribble.exceptions import SkribbleValidationError
+
+def wsgi_call(app, query_string, method="GET", body=b"", content_type=None):
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": "/skribble",
+        "QUERY_STRING": query_string,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body)
+    }
+    if content_type:
+        environ["CONTENT_TYPE"] = content_type
+    start_response = MagicMock()
+    content = b"".join(app(environ, start_response))
+    return start_response.call_args[0][0], content
+
+class TestCallbackReceiver(unittest.TestCase):
+
+    def setUp(self):
+        self.receiver = CallbackReceiver()
+        self.received = []
+
+    def test_callback_urls_round_trip_through_wsgi(self):
+        self.receiver.on("success", self.received.append)
+        urls = self.receiver.callback_urls("https://example.com/skribble")
+        self.assertEqual(set(urls), {"callback_success_url", "callback_error_url", "callback_update_url"})
+
+        # Skribble replaces the placeholder before calling the URL
+        query_string = urlsplit(urls["callback_success_url"]).query.replace("SKRIBBLE_SIGNATURE_REQUEST_ID", "sr1")
+        status, _ = wsgi_call(self.receiver.wsgi, query_string)
+
+        self.assertEqual(status, "200 OK")
+        self.assertEqual([(callback.event, callback.signature_request_id) for callback in self.received], [("success", "sr1")])
+
+    def test_redeliveries_are_dispatched_once(self):
+        self.receiver.on("*", self.received.append)
+        body = json.dumps({"event": "success", "signature_request_id": "sr1"}).encode()
+
+        for _ in range(3):
+            status, _ = wsgi_call(self.receiver.wsgi, "", method="POST", body=body, content_type="application/json")
+            self.assertEqual(status, "200 OK")
+        self.assertEqual(len(self.received), 1)
+
+    def test_every_update_reaches_the_handlers(self):
+        # Skribble calls the same update URL for every change of a signature request
+        self.receiver.on("update", self.received.append)
+
+        for _ in range(2):
+            self.assertEqual(self.receiver.handle("GET", "/cb", "event=update&signature_request_id=abc"), (200, "OK"))
+        self.assertEqual(len(self.received), 2)
+
+    def test_update_repeats_can_be_collapsed_within_a_window(self):
+        now = [0.0]
+        receiver = CallbackReceiver(update_dedup_ttl=2.0, clock=lambda: now[0])
+        receiver.on("update", self.received.append)
+
+        receiver.handle("GET", "/cb", "event=update&signature_request_id=abc")
+        now[0] = 1.0
+        receiver.handle("GET", "/cb", "event=update&signature_request_id=abc")
+        now[0] = 2.5
+        receiver.handle("GET", "/cb", "event=update&signature_request_id=abc")
+        self.assertEqual(len(self.received), 2)
+
+    def test_failed_handler_lets_the_redelivery_through(self):
+        handler = MagicMock(side_effect=[RuntimeError("database down"), None])
+        self.receiver.on("error", handler)
+
+        self.assertEqual(self.receiver.handle("GET", "/skribble/error", "signature_request_id=sr1"), (500, "Callback handler failed"))
+        self.assertEqual(self.receiver.handle("GET", "/skribble/error", "signature_request_id=sr1"), (200, "OK"))
+        self.assertEqual(handler.call_count, 2)
+
+    def test_invalid_callbacks_are_rejected(self):
+        self.assertEqual(self.receiver.handle("GET", "/skribble", "event=success")[0], 400)
+        self.assertEqual(self.receiver.handle("GET", "/skribble", "event=signed&signature_request_id=sr1")[0], 400)
+        self.assertEqual(self.receiver.handle("DELETE", "/skribble/success", "signature_request_id=sr1")[0], 405)
+        with self.assertRaises(SkribbleValidationError):
+            self.receiver.on("signed", self.received.append)
+
+    @patch('skribble.signature_request.operations.get_client')
+    def test_signature_request_is_fetched_lazily_once(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client._make_request.return_value = {"id": "sr1", "status_overall": "SIGNED"}
+        mock_get_client.return_value = mock_client
+        callback = self.receiver.parse("/skribble/success", "signature_request_id=sr1")
+
+        mock_client._make_request.assert_not_called()
+        self.assertEqual(callback.fetch()["status_overall"], "SIGNED")
+        self.assertEqual(callback.fetch()["status_overall"], "SIGNED")
+        mock_client._make_request.assert_called_once()
+
+class TestAsyncCallbackReceiver(unittest.IsolatedAsyncioTestCase):
+
+    async def test_asgi_awaits_coroutine_handlers(self):
+        receiver = CallbackReceiver()
+        handler = AsyncMock()
+        receiver.on("success", handler)
+        messages = iter([{"type": "http.request", "body": b"signature_request_id=sr1", "more_body": False}])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/skribble/success",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/x-www-form-urlencoded")]
+        }
+        await receiver.asgi(scope, receive, send)
+
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual(handler.await_args[0][0].signature_request_id, "sr1")
+
+if __name__ == '__main__':
+    unittest.main()
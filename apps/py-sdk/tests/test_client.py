@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import MagicMock
+from skribble.client import SkribbleClient
+from skribble.config import ClientConfig
+from skribble.codec import JSONCodec, OrjsonCodec, default_codec
+
+class TestClientConfig(unittest.TestCase):
+
+    def test_session_uses_configured_pool(self):
+        client = SkribbleClient(access_token="token", config=ClientConfig(pool_maxsize=64, pool_block=True))
+        adapter = client.session.get_adapter("https://api.skribble.com/v2")
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(client.session.headers["Connection"], "keep-alive")
+
+    def test_keep_alive_can_be_disabled(self):
+        client = SkribbleClient(access_token="token", config=ClientConfig(keep_alive=False))
+        self.assertEqual(client.session.headers["Connection"], "close")
+
+    def test_requests_use_configured_timeouts(self):
+        client = SkribbleClient(access_token="token", config=ClientConfig(connect_timeout=2, read_timeout=30))
+        client.session = MagicMock()
+        client.session.request.return_value = MagicMock(status_code=204, text="", content=b"")
+
+        client._make_request("DELETE", "/documents/doc1")
+        self.assertEqual(client.session.request.call_args.kwargs["timeout"], (2, 30))
+
+class TestJSONCodec(unittest.TestCase):
+
+    def test_body_is_encoded_and_decoded_once_by_the_codec(self):
+        codec = MagicMock(wraps=JSONCodec())
+        client = SkribbleClient(access_token="token", json_codec=codec)
+        client.session = MagicMock()
+        response = MagicMock(status_code=200, content=b'{"id":"sr1","title":"Contrat sign\xc3\xa9"}')
+        client.session.request.return_value = response
+
+        result = client._make_request("POST", "/signature-requests", data={"title": "Contrat signé"})
+
+        kwargs = client.session.request.call_args.kwargs
+        self.assertEqual(kwargs["data"], '{"title":"Contrat signé"}'.encode("utf-8"))
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+        self.assertNotIn("json", kwargs)
+        self.assertEqual(result, {"id": "sr1", "title": "Contrat signé"})
+        codec.loads.assert_called_once_with(response.content)
+        response.json.assert_not_called()
+
+    def test_codecs_agree(self):
+        value = {"title": "Vertrag ü", "signatures": [{"sequence": 1, "notify": True}], "custom": None}
+        codecs = [JSONCodec(), default_codec()]
+        try:
+            codecs.append(OrjsonCodec())
+        except ImportError:
+            pass
+        for codec in codecs:
+            self.assertEqual(codec.loads(codec.dumps(value)), value)
+            self.assertEqual(codec.loads(JSONCodec().dumps(value)), value)
+
+if __name__ == '__main__':
+    unittest.main()
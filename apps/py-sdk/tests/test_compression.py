@@ -0,0 +1,123 @@
+import base64
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import skribble
+from skribble.aio import document as async_document
+from skribble.aio import seal as async_seal
+from skribble.aio.client import AsyncSkribbleClient
+from skribble.compression import GzipBody, compress_request
+from skribble.config import ClientConfig
+from skribble.streaming import streaming_json_body
+from skribble.transport import RequestsTransport, Urllib3Transport, HTTPXTransport, AsyncInMemoryTransport
+from skribble.testing import MockSkribbleAPI, MockSkribbleServer
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.api = MockSkribbleAPI()
+        self.api.seed(50)
+        self.upload = base64.b64encode(os.urandom(64 * 1024)).decode()
+        self.signers = [{"account_email": "signer@example.com"}]
+
+    def test_small_bodies_are_sent_as_is(self):
+        self.assertIsNone(compress_request({"Content-Type": "application/json"}, b"{}", 1024))
+        headers, body = compress_request({"Content-Length": "2048"}, b"x" * 2048, 1024)
+        self.assertEqual(headers, {"Content-Encoding": "gzip"})
+        self.assertEqual(gzip.decompress(body), b"x" * 2048)
+
+    def test_streamed_bodies_are_compressed_on_the_fly(self):
+        source = io.BytesIO(os.urandom(10000))
+        headers, body = compress_request({"Content-Type": "application/json"}, streaming_json_body({"title": "Contract"}, "content", source), 1024)
+        self.assertIsInstance(body, GzipBody)
+        self.assertTrue(body.replayable)
+        # Replaying the body compresses the source again from the start
+        self.assertEqual(gzip.decompress(b"".join(body)), gzip.decompress(b"".join(body)))
+        self.assertEqual(base64.b64decode(json.loads(gzip.decompress(b"".join(body)))["content"]), source.getvalue())
+
+    def test_responses_and_uploads_are_compressed_on_the_wire(self):
+        with MockSkribbleServer(self.api) as server:
+            for transport in (RequestsTransport, Urllib3Transport, HTTPXTransport):
+                with self.subTest(transport=transport.__name__):
+                    traffic = {}
+                    for compress in (False, True):
+                        config = ClientConfig(compress_responses=compress, compress_requests=compress)
+                        with server.client(config=config, transport=transport(config)) as client, skribble.use_client(client):
+                            skribble.signature_request.list(page_size=50)
+                            received, sent = server.bytes_received, server.bytes_sent
+                            self.assertEqual(len(skribble.signature_request.list(page_size=50)), 50)
+                            listed = server.bytes_sent - sent
+                            created = skribble.signature_request.create({"title": "Contract", "content": self.upload, "signatures": self.signers})
+                            traffic[compress] = (listed, server.bytes_received - received)
+                            self.assertIn(created["id"], self.api.signature_requests)
+                    self.assertLess(traffic[True][0], traffic[False][0] / 2)
+                    self.assertLess(traffic[True][1], traffic[False][1] * 0.85)
+
+    def test_streamed_uploads_are_compressed(self):
+        with tempfile.TemporaryDirectory() as directory, MockSkribbleServer(self.api) as server:
+            path = Path(directory, "contract.pdf")
+            path.write_bytes(os.urandom(32 * 1024))
+            with server.client(config=ClientConfig(compress_requests=True)) as client, skribble.use_client(client):
+                document = skribble.document.add({"title": "Contract", "content_type": "application/pdf", "content": path})
+            self.assertEqual(self.api.documents[document["id"]]["title"], "Contract")
+
+    def test_falls_back_when_the_server_rejects_compressed_bodies(self):
+        self.api.accept_gzip = False
+        with MockSkribbleServer(self.api) as server:
+            with server.client(config=ClientConfig(compress_requests=True)) as client, skribble.use_client(client):
+                first = skribble.seal.create({"title": "Sealed", "content": self.upload})
+                received = server.bytes_received
+                second = skribble.seal.create({"title": "Sealed", "content": self.upload})
+                self.assertFalse(client._compress_requests)
+            self.assertNotEqual(first["document_id"], second["document_id"])
+            # The second upload goes out uncompressed right away, without a rejected attempt
+            self.assertLess(server.bytes_received - received, 2 * len(self.upload))
+
+class TestAsyncCompression(unittest.IsolatedAsyncioTestCase):
+
+    async def test_uploads_are_compressed_and_fall_back(self):
+        api = MockSkribbleAPI()
+        received = []
+
+        def handle(method, path, query, headers, body):
+            received.append((headers.get("Content-Encoding"), len(body)))
+            return api.handle(method, path, query, headers, body)
+
+        upload = base64.b64encode(os.urandom(16 * 1024)).decode()
+        async with AsyncSkribbleClient(username="user", api_key="key", config=ClientConfig(compress_requests=True), transport=AsyncInMemoryTransport(handle)) as client:
+            with skribble.aio.use_client(client):
+                await async_seal.create({"title": "Sealed", "content": upload})
+                self.assertEqual(received[-1][0], "gzip")
+                self.assertLess(received[-1][1], len(upload))
+
+                api.accept_gzip = False
+                result = await async_seal.create({"title": "Sealed", "content": upload})
+                self.assertIn("document_id", result)
+                self.assertEqual([encoding for encoding, _ in received[-2:]], ["gzip", None])
+
+    async def test_streamed_uploads_are_compressed_over_httpx(self):
+        api = MockSkribbleAPI()
+        with tempfile.TemporaryDirectory() as directory, MockSkribbleServer(api) as server:
+            path = Path(directory, "contract.pdf")
+            path.write_bytes(os.urandom(32 * 1024))
+            async with server.async_client(config=ClientConfig(compress_requests=True)) as client:
+                with skribble.aio.use_client(client):
+                    await async_seal.create({"title": "Sealed", "content": path})
+                    received = server.bytes_received
+                    document = await async_document.add({"title": "Contract", "content_type": "application/pdf", "content": path})
+                    # Random content: gzip only undoes the base64 overhead
+                    self.assertLess(server.bytes_received - received, 4 * 32 * 1024 / 3)
+
+                    api.accept_gzip = False
+                    sealed = await async_seal.create({"title": "Sealed", "content": path})
+                    self.assertFalse(client._compress_requests)
+
+        self.assertEqual(api.documents[document["id"]]["title"], "Contract")
+        self.assertIn(sealed["document_id"], api.documents)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import hashlib
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+from skribble.client import SkribbleClient
+from skribble.disk_cache import DiskCache
+from skribble import document
+
+def make_response(status_code, content=b"", headers=None):
+    response = MagicMock(status_code=status_code, content=content, text="", headers=headers or {})
+    response.iter_content.side_effect = lambda chunk_size: iter([content[i:i + chunk_size] for i in range(0, len(content), chunk_size)])
+    return response
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(self.directory.name, max_size=10)
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def test_identical_content_is_stored_once(self):
+        first = self.cache.put("/documents/a/content", [b"%PDF", b"-1"])
+        second = self.cache.put("/documents/b/content", [b"%PDF-1"])
+        self.assertEqual(first.path, second.path)
+        self.assertEqual(self.cache.size, 6)
+        self.assertEqual(bytes(self.cache.get("/documents/b/content").map()), b"%PDF-1")
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.cache.put("a", [b"aaaa"])
+        self.cache.put("b", [b"bbbb"])
+        self.cache.get("a")
+        self.cache.put("c", [b"cccc"])
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a").read(), b"aaaa")
+        self.assertLessEqual(self.cache.size, 10)
+
+    def test_file_found_by_one_cache_is_not_deleted_by_another(self):
+        # A second instance on the same directory has its own connection and lock, like another process
+        other = DiskCache(self.directory.name, max_size=10)
+        self.addCleanup(other.close)
+        other.put("b", [b"%PDF"])
+        digest = hashlib.sha256(b"%PDF").hexdigest()
+        exists = os.path.exists
+        discards = []
+
+        def exists_then_discard(path):
+            found = exists(path)
+            if os.path.basename(path) == digest and not discards:
+                # The other cache drops the only entry using the file right after it was found
+                discards.append(threading.Thread(target=other.discard, args=("b",)))
+                discards[0].start()
+                discards[0].join(0.5)
+            return found
+
+        with patch("skribble.disk_cache.os.path.exists", side_effect=exists_then_discard):
+            self.cache.put("a", [b"%PDF"])
+        discards[0].join()
+
+        cached = self.cache.get("a")
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.read(), b"%PDF")
+        self.assertIsNone(other.get("b"))
+
+class TestClientDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.client = SkribbleClient(access_token="token", disk_cache=DiskCache(self.directory.name, revalidate=True))
+        self.client.session = MagicMock()
+
+    def tearDown(self):
+        self.client.disk_cache.close()
+        self.directory.cleanup()
+
+    def test_download_is_served_from_disk_after_revalidation(self):
+        self.client.session.request.side_effect = [
+            make_response(200, b"%PDF-1.7", headers={"ETag": '"v1"'}),
+            make_response(304)
+        ]
+
+        with patch('skribble.document.operations.get_client', return_value=self.client):
+            self.assertEqual(document.download("doc1"), b"%PDF-1.7")
+            self.assertEqual(bytes(document.download_mapped("doc1")), b"%PDF-1.7")
+
+        self.assertEqual(self.client.session.request.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+
+    def test_download_is_fetched_again_if_evicted_before_it_is_read(self):
+        self.client.session.request.side_effect = [make_response(200, b"%PDF-1.7"), make_response(200, b"%PDF-1.7")]
+        disk_cache = self.client.disk_cache
+        lookup = disk_cache.get
+
+        def get_then_evict(key):
+            cached = lookup(key)
+            if cached is not None:
+                # Another process evicts the file between the lookup and the read
+                os.remove(cached.path)
+            return cached
+
+        with patch('skribble.document.operations.get_client', return_value=self.client):
+            document.download("doc1")
+            with patch.object(disk_cache, "get", side_effect=get_then_evict):
+                self.assertEqual(document.download("doc1"), b"%PDF-1.7")
+            self.assertEqual(b"".join(document.iter_download("doc1")), b"%PDF-1.7")
+
+        self.assertEqual(self.client.session.request.call_count, 2)
+
+    def test_preview_is_cached_per_page_and_scale(self):
+        self.client.session.request.return_value = make_response(200, b"\x89PNG", headers={"Content-Type": "image/png"})
+
+        with patch('skribble.document.operations.get_client', return_value=self.client):
+            document.preview("doc1", 0, scale=20)
+            self.assertEqual(document.preview("doc1", 0, scale=20), b"\x89PNG")
+            document.preview("doc1", 0, scale=100)
+
+        self.assertEqual(self.client.session.request.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,13 @@
+import base64
+import io
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
+from skribble.codec import JSONCodec
 from skribble.document import operations
-from skribble.exceptions import SkribbleValidationError
+from skribble.exceptions import SkribbleValidationError, SkribbleAPIError
 
 class TestDocument(unittest.TestCase):
 
@@ -50,5 +56,105 @@ class TestDocument(unittest.TestCase):
         result = operations.add({"title": "New Document", "content": "base64_content", "content_type": "application/pdf"})
         self.assertEqual(result, {"id": "new_doc"})
 
+    @patch('skribble.document.operations.get_client')
+    def test_download_to_file_object_streams_chunks(self, mock_get_client):
+        mock_client = MagicMock(disk_cache=None)
+        mock_get_client.return_value = mock_client
+        response = mock_client._request_raw.return_value
+        response.status_code = 200
+        response.iter_content.return_value = iter([b"%PDF", b"-1.7"])
+
+        destination = io.BytesIO()
+        written = operations.download_to("doc1", destination, chunk_size=4)
+        self.assertEqual(written, 8)
+        self.assertEqual(destination.getvalue(), b"%PDF-1.7")
+        mock_client._request_raw.assert_called_once_with("GET", "/documents/doc1/content", stream=True)
+        response.iter_content.assert_called_once_with(chunk_size=4)
+        response.close.assert_called_once()
+
+    @patch('skribble.document.operations.get_client')
+    def test_download_to_path_leaves_no_partial_file_on_error(self, mock_get_client):
+        mock_client = MagicMock(disk_cache=None)
+        mock_get_client.return_value = mock_client
+        response = mock_client._request_raw.return_value
+        response.status_code = 200
+
+        def broken_stream(chunk_size):
+            yield b"%PDF"
+            raise ConnectionError("connection reset")
+        response.iter_content.side_effect = broken_stream
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "doc1.pdf")
+            with self.assertRaises(ConnectionError):
+                operations.download_to("doc1", path)
+            self.assertEqual(os.listdir(directory), [])
+
+    @patch('skribble.document.operations.get_client')
+    def test_iter_download_raises_on_error_status(self, mock_get_client):
+        mock_client = MagicMock(disk_cache=None)
+        mock_get_client.return_value = mock_client
+        response = mock_client._request_raw.return_value
+        response.status_code = 404
+        response.text = "not found"
+
+        with self.assertRaises(SkribbleAPIError):
+            operations.iter_download("doc1")
+        response.close.assert_called_once()
+
+    @patch('skribble.document.operations.get_client')
+    def test_add_document_streams_file_object_as_base64(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.json_codec = JSONCodec()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request.return_value = {"id": "new_doc"}
+        raw = os.urandom(1000)
+
+        result = operations.add({"title": "New Document", "content_type": "application/pdf", "content": io.BytesIO(raw)}, chunk_size=100)
+        self.assertEqual(result, {"id": "new_doc"})
+
+        body = mock_client._make_request.call_args.kwargs["body"]
+        encoded = b"".join(body)
+        self.assertEqual(len(encoded), body.content_length)
+        payload = json.loads(encoded)
+        self.assertEqual(payload["title"], "New Document")
+        self.assertEqual(base64.b64decode(payload["content"]), raw)
+        # The body can be replayed, e.g. when a request is retried
+        self.assertEqual(b"".join(body), encoded)
+
+    @patch('skribble.document.operations.get_client')
+    def test_streamed_upload_is_encoded_by_the_client_codec(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.json_codec = MagicMock(wraps=JSONCodec())
+        mock_get_client.return_value = mock_client
+
+        operations.add({"title": "Vertrag ü", "content_type": "application/pdf", "content": io.BytesIO(b"pdf")})
+
+        mock_client.json_codec.dumps.assert_called_once()
+        encoded = b"".join(mock_client._make_request.call_args.kwargs["body"])
+        # Same compact, UTF-8 encoding as bodies that are not streamed
+        self.assertEqual(encoded, JSONCodec().dumps({"title": "Vertrag ü", "content_type": "application/pdf", "content": base64.b64encode(b"pdf").decode()}))
+
+    @patch('skribble.document.operations.time.sleep')
+    @patch('skribble.document.operations.get_client')
+    def test_preview_all_polls_with_backoff(self, mock_get_client, mock_sleep):
+        mock_client = MagicMock(disk_cache=None)
+        mock_get_client.return_value = mock_client
+        mock_client._make_request.return_value = {"id": "doc1", "title": "Contract", "content_type": "application/pdf", "size": 1024, "owner": "test_owner", "page_count": 3}
+        pending = {1: 2}
+
+        def fetch_page(method, endpoint, params):
+            page_id = int(endpoint.rsplit("/", 1)[1])
+            if pending.get(page_id):
+                pending[page_id] -= 1
+                return MagicMock(status_code=202, headers={})
+            return MagicMock(status_code=200, headers={"Content-Type": "image/png"}, content=b"page%d" % page_id)
+        mock_client._request_raw.side_effect = fetch_page
+
+        with patch('skribble.retry.random.uniform', side_effect=lambda low, high: high):
+            pages = {page.index: page.result for page in operations.preview_all("doc1", concurrency=3, initial_delay=0.1)}
+        self.assertEqual(pages, {0: b"page0", 1: b"page1", 2: b"page2"})
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.1, 0.2])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import httpx
+import requests
+from skribble.client import SkribbleClient
+from skribble.aio.client import AsyncSkribbleClient
+from skribble.retry import RetryPolicy
+from skribble.hooks import RequestHooks, endpoint_template, operation_name
+from skribble.exceptions import SkribbleAPIError
+
+class Recorder(RequestHooks):
+
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, info):
+        self.events.append(("before_request", info))
+
+    def after_response(self, info):
+        self.events.append(("after_response", info))
+
+    def on_error(self, info, error):
+        self.events.append(("on_error", info))
+
+    def on_retry(self, info, delay):
+        self.events.append(("on_retry", info, delay))
+
+def make_response(status_code, content=b"", headers=None):
+    return MagicMock(status_code=status_code, headers=headers or {}, content=content, text=content.decode())
+
+class TestRequestHooks(unittest.TestCase):
+
+    def setUp(self):
+        self.recorder = Recorder()
+        self.client = SkribbleClient(access_token="token", retry_policy=RetryPolicy(jitter=False, backoff_factor=0.01), hooks=[self.recorder])
+        self.client.session = MagicMock()
+
+    def test_endpoint_templates_and_operation_names(self):
+        self.assertEqual(endpoint_template("/documents/doc1/pages/2"), "/documents/{document_id}/pages/{page_id}")
+        self.assertEqual(endpoint_template("/signature-requests/sr1/signatures"), "/signature-requests/{signature_request_id}/signatures")
+        self.assertEqual(operation_name("get", "/documents/{document_id}/content"), "document.download")
+        self.assertEqual(operation_name("PATCH", "/documents"), "PATCH /documents")
+
+    @patch('skribble.client.time.sleep')
+    def test_reports_every_attempt_of_a_retried_request(self, mock_sleep):
+        self.client.session.request.side_effect = [make_response(503), make_response(200, b'{"id":"sr1"}')]
+
+        self.client._make_request("PUT", "/signature-requests", data={"id": "sr1"})
+
+        self.assertEqual([event[0] for event in self.recorder.events], ["before_request", "after_response", "on_retry", "before_request", "after_response"])
+        info = self.recorder.events[-1][1]
+        self.assertEqual((info.operation, info.endpoint, info.attempt, info.status_code), ("signature_request.update", "/signature-requests", 1, 200))
+        self.assertEqual((info.request_bytes, info.response_bytes), (len(b'{"id":"sr1"}'), len(b'{"id":"sr1"}')))
+        self.assertGreaterEqual(info.duration, 0)
+        self.assertEqual(self.recorder.events[2][2], 0.01)
+
+    def test_reports_connection_errors_and_streamed_sizes(self):
+        self.client.session.request.side_effect = [requests.exceptions.ConnectionError("reset"), make_response(200, headers={"Content-Length": "2048"})]
+
+        with self.assertRaises(SkribbleAPIError):
+            self.client._make_request("POST", "/documents", data={"title": "Contract"})
+        self.client._request_raw("GET", "/documents/doc1/content", stream=True)
+
+        self.assertEqual(self.recorder.events[1][0], "on_error")
+        info = self.recorder.events[-1][1]
+        self.assertEqual((info.operation, info.path, info.response_bytes), ("document.download", "/documents/doc1/content", 2048))
+
+    def test_failing_hook_does_not_break_the_request(self):
+        broken = MagicMock(spec=RequestHooks)
+        broken.before_request.side_effect = RuntimeError("metrics backend down")
+        self.client.hooks.insert(0, broken)
+        self.client.session.request.return_value = make_response(200, b'{"id":"doc1"}')
+
+        with self.assertLogs('skribble.hooks', level='ERROR'):
+            self.assertEqual(self.client._make_request("GET", "/documents/doc1"), {"id": "doc1"})
+        self.assertEqual(self.recorder.events[-1][1].operation, "document.get")
+
+class TestAsyncRequestHooks(unittest.IsolatedAsyncioTestCase):
+
+    async def test_reports_async_requests(self):
+        recorder = Recorder()
+        client = AsyncSkribbleClient(access_token="token", hooks=[recorder])
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[{"id": "sr1"}])))
+
+        async with client:
+            await client._make_request("GET", "/signature-requests", params={"page_size": 1})
+
+        self.assertEqual([event[0] for event in recorder.events], ["before_request", "after_response"])
+        info = recorder.events[-1][1]
+        self.assertEqual((info.operation, info.status_code, info.request_bytes, info.response_bytes), ("signature_request.list", 200, 0, len(b'[{"id":"sr1"}]')))
+
+if __name__ == '__main__':
+    unittest.main()
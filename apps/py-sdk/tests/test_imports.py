@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+import unittest
+import skribble
+import skribble.aio
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+def loaded_after(code):
+    probe = code + "\nimport sys; print(','.join(name for name in ('requests', 'pydantic', 'httpx') if name in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=PACKAGE_ROOT)
+    output = subprocess.run([sys.executable, "-c", probe], env=env, check=True, capture_output=True, text=True).stdout
+    return set(filter(None, output.strip().split(',')))
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        self.assertEqual(loaded_after("import skribble, skribble.aio"), set())
+
+    def test_dependencies_load_on_first_use(self):
+        self.assertEqual(loaded_after("import skribble; skribble.SkribbleClient"), {"requests"})
+        self.assertIn("pydantic", loaded_after("from skribble import SignatureRequest"))
+
+    def test_init_does_not_load_models(self):
+        code = ("import skribble; from skribble.transport import InMemoryTransport; from skribble.testing import MockSkribbleAPI\n"
+                "skribble.init(access_token='mock-access-token', transport=InMemoryTransport(MockSkribbleAPI().handle))")
+        self.assertNotIn("pydantic", loaded_after(code))
+
+    def test_public_names_resolve(self):
+        from skribble.client import SkribbleClient
+        from skribble.aio.client import AsyncSkribbleClient
+
+        self.assertIs(skribble.SkribbleClient, SkribbleClient)
+        self.assertIs(skribble.AsyncSkribbleClient, AsyncSkribbleClient)
+        self.assertIs(skribble.aio.AsyncSkribbleClient, AsyncSkribbleClient)
+        for module in (skribble, skribble.aio):
+            for name in module.__all__:
+                self.assertTrue(hasattr(module, name), name)
+            self.assertTrue(set(module.__all__).issubset(dir(module)))
+
+    def test_unknown_attribute_raises(self):
+        with self.assertRaises(AttributeError):
+            skribble.does_not_exist
+
+if __name__ == '__main__':
+    unittest.main()
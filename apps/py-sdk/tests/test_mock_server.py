@@ -0,0 +1,47 @@
+import json
+import unittest
+import skribble
+from skribble.testing import MockSkribbleAPI, MockSkribbleServer
+
+class TestMockSkribbleAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.api = MockSkribbleAPI(document_size=1024, preview_pending=1)
+        self.auth = {"Authorization": f"Bearer {self.api.token}"}
+
+    def test_requires_the_issued_token(self):
+        login = self.api.handle("POST", "/v2/access/login", body=json.dumps({"username": "user", "api-key": "key"}).encode())
+        self.assertEqual((login.status_code, login.content.decode()), (200, self.api.token))
+        self.assertEqual(self.api.handle("GET", "/v2/documents").status_code, 401)
+        self.assertEqual(self.api.handle("GET", "/v2/documents", headers={"authorization": "Bearer other"}).status_code, 401)
+
+    def test_routes_and_pages(self):
+        self.api.seed(5)
+        page = self.api.handle("GET", "/v2/signature-requests", "page_number=1&page_size=2", self.auth)
+        self.assertEqual(len(json.loads(page.content)), 2)
+        self.assertEqual(self.api.handle("GET", "/v2/signature-requests/unknown", headers=self.auth).status_code, 404)
+        self.assertEqual(self.api.handle("PATCH", "/v2/documents", headers=self.auth).status_code, 405)
+        self.assertEqual(self.api.handle("GET", "/v2/unknown", headers=self.auth).status_code, 404)
+
+    def test_previews_are_pending_first(self):
+        document_id = json.loads(self.api.handle("POST", "/documents", headers=self.auth, body=b'{"title": "Contract"}').content)["id"]
+        path = f"/documents/{document_id}/pages/0"
+
+        self.assertEqual(self.api.handle("GET", path, headers=self.auth).status_code, 202)
+        preview = self.api.handle("GET", path, headers=self.auth)
+        self.assertEqual((preview.status_code, preview.headers["Content-Type"]), (200, "image/png"))
+
+class TestMockSkribbleServer(unittest.TestCase):
+
+    def test_operations_over_http(self):
+        with MockSkribbleServer(MockSkribbleAPI(document_size=2048)) as server, skribble.use_client(server.client()):
+            created = skribble.signature_request.create({"title": "Contract", "content": "aGVsbG8=", "signatures": [{"account_email": "signer@example.com"}]})
+
+            self.assertEqual(skribble.signature_request.get(created["id"])["status_overall"], "OPEN")
+            self.assertEqual([request["id"] for request in skribble.signature_request.list()], [created["id"]])
+            self.assertEqual(len(skribble.document.download(created["document_id"])), 2048)
+            self.assertEqual(skribble.signature_request.withdraw(created["id"])["status_overall"], "WITHDRAWN")
+            self.assertIn("document_id", skribble.seal.create({"content": "aGVsbG8="}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+import skribble
+from skribble import aio
+from skribble.client import SkribbleClient
+from skribble.registry import ClientRegistry
+from skribble.aio.registry import AsyncClientRegistry
+from skribble.exceptions import SkribbleValidationError
+
+class TestClientScoping(unittest.TestCase):
+
+    @patch('skribble.client_manager._client', new_callable=MagicMock)
+    def test_use_client_overrides_global_client(self, global_client):
+        scoped = SkribbleClient(access_token="tenant")
+        with skribble.use_client(scoped):
+            self.assertIs(skribble.get_client(), scoped)
+        self.assertIs(skribble.get_client(), global_client)
+
+    def test_binding_is_local_to_thread(self):
+        seen = []
+        with skribble.use_client(SkribbleClient(access_token="tenant")):
+            thread = threading.Thread(target=lambda: seen.append(skribble.client_manager._scoped_client.get()))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [None])
+
+    def test_registry_routes_operations_per_tenant(self):
+        with ClientRegistry() as tenants:
+            acme = tenants.register("acme", access_token="acme-token")
+            globex = tenants.register("globex", username="api_globex", api_key="key")
+            self.assertEqual(tenants.tenants, ["acme", "globex"])
+
+            acme._make_request = MagicMock(return_value={"id": "acme_request"})
+            with tenants.use("acme"):
+                self.assertEqual(skribble.signature_request.get("acme_request")["id"], "acme_request")
+            self.assertIs(tenants.get("globex"), globex)
+
+            with self.assertRaises(SkribbleValidationError):
+                tenants.register("acme", access_token="other")
+            tenants.remove("acme")
+            self.assertNotIn("acme", tenants)
+            with self.assertRaises(SkribbleValidationError):
+                tenants.use("acme")
+        self.assertEqual(len(tenants), 0)
+
+    def test_async_tasks_keep_their_own_client(self):
+        async def run():
+            async with AsyncClientRegistry() as tenants:
+                for tenant in ("acme", "globex"):
+                    tenants.register(tenant, access_token=f"{tenant}-token")
+
+                async def current_token(tenant):
+                    with tenants.use(tenant):
+                        await asyncio.sleep(0)
+                        return aio.get_client().access_token
+
+                return await asyncio.gather(current_token("acme"), current_token("globex"))
+
+        self.assertEqual(asyncio.run(run()), ["acme-token", "globex-token"])
+
+if __name__ == '__main__':
+    unittest.main()
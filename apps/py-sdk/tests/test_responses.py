@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from skribble.responses import SignatureRequestView, SignatureView, DocumentView
+from skribble import signature_request, document
+
+RESPONSE = {
+    "id": "sr1",
+    "title": "Contract",
+    "status_overall": "OPEN",
+    "signatures": [{"sid": "signer_1", "status_code": "SIGNED"}, {"sid": "signer_2", "status_code": "OPEN"}],
+    "future_field": 42
+}
+
+class TestResponseViews(unittest.TestCase):
+
+    def test_fields_are_read_from_the_response(self):
+        view = SignatureRequestView(RESPONSE)
+
+        self.assertEqual((view.id, view.title, view.status_overall), ("sr1", "Contract", "OPEN"))
+        self.assertIsNone(view.message)
+        self.assertEqual(view["future_field"], 42)
+        self.assertIs(view.to_dict(), RESPONSE)
+        self.assertFalse(hasattr(view, "__dict__"))
+
+    def test_nested_lists_are_wrapped_on_first_access(self):
+        view = SignatureRequestView(RESPONSE)
+        self.assertIsNone(view._nested)
+
+        signatures = view.signatures
+        self.assertEqual([signer.status_code for signer in signatures], ["SIGNED", "OPEN"])
+        self.assertIsInstance(signatures[0], SignatureView)
+        self.assertIs(view.signatures, signatures)
+        self.assertEqual(view.attachments, ())
+
+    @patch('skribble.signature_request.operations.get_client')
+    def test_list_returns_views_when_typed(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client._make_request.return_value = [RESPONSE]
+        mock_get_client.return_value = mock_client
+
+        self.assertEqual(signature_request.list(typed=True), [SignatureRequestView(RESPONSE)])
+        self.assertEqual(signature_request.list(), [RESPONSE])
+
+    @patch('skribble.document.operations.get_client')
+    def test_typed_document_get_skips_validation(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client._make_request.return_value = {"id": "doc1", "title": "Contract", "page_count": 3}
+        mock_get_client.return_value = mock_client
+
+        view = document.get("doc1", typed=True)
+        self.assertIsInstance(view, DocumentView)
+        self.assertEqual((view.page_count, view.owner), (3, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from skribble.client import SkribbleClient
+from skribble.retry import RetryPolicy
+from skribble.exceptions import SkribbleAPIError
+
+def make_response(status_code, headers=None, json_body=None):
+    content = b"" if json_body is None else json.dumps(json_body).encode()
+    response = MagicMock(status_code=status_code, headers=headers or {}, text=content.decode(), content=content)
+    response.json.return_value = json_body
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code} Error")
+    return response
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_exponential_backoff_without_jitter(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+        self.assertEqual([policy.backoff(attempt) for attempt in range(4)], [0.5, 1.0, 2.0, 3])
+
+    def test_retry_after_and_budget(self):
+        now = [0.0]
+        policy = RetryPolicy(max_retries=5, total_timeout=10, clock=lambda: now[0])
+        started = policy.start()
+        self.assertEqual(policy.next_delay(0, started, {"Retry-After": "4"}), 4.0)
+        now[0] = 7.0
+        self.assertIsNone(policy.next_delay(1, started, {"Retry-After": "4"}))
+        self.assertIsNone(policy.next_delay(5, started))
+
+    def test_only_idempotent_methods_by_default(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.allows("GET"))
+        self.assertTrue(policy.allows("put"))
+        self.assertFalse(policy.allows("POST"))
+        self.assertTrue(policy.allows("POST", idempotent=True))
+        self.assertTrue(RetryPolicy(retry_non_idempotent=True).allows("POST"))
+        self.assertFalse(RetryPolicy(max_retries=0).allows("GET"))
+
+class TestClientRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.client = SkribbleClient(access_token="token", retry_policy=RetryPolicy(jitter=False, backoff_factor=0.01))
+        self.client.session = MagicMock()
+
+    @patch('skribble.client.time.sleep')
+    def test_retries_transient_status_for_get(self, mock_sleep):
+        self.client.session.request.side_effect = [
+            make_response(503),
+            make_response(429, headers={"Retry-After": "2"}),
+            make_response(200, json_body={"id": "1"})
+        ]
+
+        self.assertEqual(self.client._make_request("GET", "/signature-requests/1"), {"id": "1"})
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.01, 2.0])
+
+    @patch('skribble.client.time.sleep')
+    def test_does_not_retry_post(self, mock_sleep):
+        self.client.session.request.side_effect = [make_response(503), make_response(200)]
+
+        with self.assertRaises(SkribbleAPIError) as context:
+            self.client._make_request("POST", "/signature-requests", data={"title": "Test"})
+        self.assertEqual(context.exception.status_code, 503)
+        self.assertEqual(self.client.session.request.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch('skribble.client.time.sleep')
+    def test_retries_connection_errors_until_exhausted(self, mock_sleep):
+        self.client.session.request.side_effect = requests.exceptions.ConnectionError("connection reset")
+
+        with self.assertRaises(SkribbleAPIError):
+            self.client._make_request("DELETE", "/documents/doc1")
+        self.assertEqual(self.client.session.request.call_count, 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from skribble.signature_request import operations
-from skribble.exceptions import SkribbleValidationError
+from skribble.exceptions import SkribbleValidationError, SkribbleAPIError, SkribbleOperationError
 
 class TestSignatureRequest(unittest.TestCase):
 
@@ -58,6 +58,34 @@ class TestSignatureRequest(unittest.TestCase):
         result = operations.list(limit=10, offset=0)
         self.assertEqual(result, [{"id": "test_id1"}, {"id": "test_id2"}])
 
+    @patch('skribble.signature_request.operations.get_client')
+    def test_list_sends_paging_params(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request.return_value = [{"id": "test_id1"}]
+
+        result = operations.list(status_overall="OPEN", page_number=2, page_size=10)
+        self.assertEqual(result, [{"id": "test_id1"}])
+        mock_client._make_request.assert_called_once_with(
+            "GET", "/signature-requests", params={"status_overall": "OPEN", "page_number": 2, "page_size": 10}
+        )
+
+    @patch('skribble.signature_request.operations.get_client')
+    def test_iter_all_fetches_pages_lazily(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request.side_effect = [[{"id": "1"}, {"id": "2"}], [{"id": "3"}]]
+
+        iterator = operations.iter_all(page_size=2)
+        self.assertEqual(next(iterator), {"id": "1"})
+        self.assertEqual(mock_client._make_request.call_count, 1)
+        self.assertEqual([item["id"] for item in iterator], ["2", "3"])
+        self.assertEqual(mock_client._make_request.call_args.kwargs["params"], {"page_number": 1, "page_size": 2})
+
+    def test_iter_all_validates_page_size_when_called(self):
+        with self.assertRaises(SkribbleValidationError):
+            operations.iter_all(page_size=0)
+
     @patch('skribble.signature_request.operations.get_client')
     def test_delete_signature_request(self, mock_get_client):
         mock_client = MagicMock()
@@ -81,5 +109,96 @@ class TestSignatureRequest(unittest.TestCase):
         with self.assertRaises(SkribbleValidationError):
             operations.create(invalid_data)
 
+    def test_validate_signature_request_once(self):
+        request = {
+            "title": "Test Signature Request",
+            "file_url": "https://example.com/test.pdf",
+            "signatures": [{"signer_identity_data": {"email_address": "guest@example.com", "first_name": "Guest"}}]
+        }
+
+        validated = operations._validate_signature_request(request)
+        self.assertEqual(validated["signatures"], [{"signer_identity_data": {"email_address": "guest@example.com", "first_name": "Guest"}, "notify": True}])
+        self.assertIsInstance(request["signatures"][0], dict)
+
+        with self.assertRaises(SkribbleValidationError) as context:
+            operations._validate_signature_request({**request, "titel": "Typo"})
+        self.assertIn("Did you mean 'title'?", str(context.exception))
+
+    @patch('skribble.signature_request.operations.get_client')
+    def test_create_many_reports_results_in_order(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request.side_effect = lambda method, endpoint, **kwargs: {"id": kwargs["data"]["title"]}
+        consumed = []
+
+        def requests():
+            for title in ["First", "Second", None, "Fourth"]:
+                consumed.append(title)
+                yield {"title": title, "file_url": "https://example.com/test.pdf", "signatures": [{"account_email": "signer@example.com"}]}
+
+        results = operations.create_many(requests(), concurrency=2)
+        self.assertEqual(consumed, [])
+
+        results = [*results]
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertEqual([result.result["id"] for result in results if result.ok], ["First", "Second", "Fourth"])
+        self.assertIsInstance(results[2].error, SkribbleValidationError)
+        self.assertEqual(mock_client._make_request.call_count, 3)
+
+    @patch('skribble.signature_request.operations.get_client')
+    def test_add_signer_uses_known_state(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request.return_value = {"sid": "signer_2"}
+
+        known = {"id": "test_id", "signatures": [{"sid": "signer_1", "status_code": "OPEN"}]}
+        operations.add_signer("test_id", {"account_email": "new@example.com"}, signature_request=known)
+        mock_client._make_request.assert_called_once_with("POST", "/signature-requests/test_id/signatures", data={"account_email": "new@example.com"})
+
+    @patch('skribble.signature_request.operations.get_client')
+    def test_optimistic_remove_signer_maps_conflict(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request.side_effect = SkribbleAPIError("Conflict", status_code=409)
+
+        with self.assertRaises(SkribbleOperationError) as context:
+            operations.remove_signer("test_id", "signer_1", check_signed=False)
+        self.assertIn("One of the signers has already signed the document", str(context.exception))
+        mock_client._make_request.assert_called_once_with("DELETE", "/signature-requests/test_id/signatures/signer_1")
+
+    @patch('skribble.signature_request.operations.get_client')
+    def test_update_signers_sends_one_update(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client._make_request.side_effect = [
+            {"id": "test_id", "signatures": [
+                {"sid": "signer_1", "account_email": "keep@example.com", "status_code": "OPEN", "notify": True},
+                {"sid": "signer_2", "account_email": "drop@example.com", "status_code": "OPEN", "notify": True}
+            ]},
+            {"id": "test_id"}
+        ]
+
+        operations.update_signers("test_id", add=[{"account_email": "new@example.com"}], remove=["signer_2"])
+        self.assertEqual(mock_client._make_request.call_count, 2)
+        method, endpoint = mock_client._make_request.call_args.args
+        self.assertEqual((method, endpoint), ("PUT", "/signature-requests"))
+        self.assertEqual(
+            [signer["account_email"] for signer in mock_client._make_request.call_args.kwargs["data"]["signatures"]],
+            ["keep@example.com", "new@example.com"]
+        )
+
+    def test_merge_signers_keeps_existing_signers_in_place(self):
+        current = [
+            {"sid": "s1", "account_email": "keep@example.com", "status_code": "OPEN", "notify": False, "last_viewed_at": "2024-01-01T00:00:00Z"},
+            # Identity data as returned by the API, incomplete for the write model
+            {"sid": "s2", "signer_identity_data": {"email_address": "guest@example.com"}, "status_code": "OPEN"}
+        ]
+        merged = operations._merge_signers(current, [{"account_email": "new@example.com"}], [])
+        self.assertEqual(merged[0], {"sid": "s1", "account_email": "keep@example.com", "notify": False})
+        self.assertEqual(merged[1], {"sid": "s2", "signer_identity_data": {"email_address": "guest@example.com"}})
+        self.assertNotIn("sid", merged[2])
+        with self.assertRaises(ValueError):
+            operations._merge_signers(current, [{"notify": True}], [])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
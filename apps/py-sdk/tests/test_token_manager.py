@@ -0,0 +1,96 @@
+import base64
+import json
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from skribble.client import SkribbleClient
+from skribble.streaming import streaming_json_body
+from skribble.testing import MockResponse
+from skribble.transport import InMemoryTransport
+from skribble.token_manager import TokenManager, token_expiry
+from skribble.exceptions import SkribbleAuthError
+
+def make_token(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+class TestTokenManager(unittest.TestCase):
+
+    def test_token_expiry(self):
+        self.assertEqual(token_expiry(make_token(1700000000)), 1700000000)
+        self.assertIsNone(token_expiry("not-a-jwt"))
+
+    def test_refreshes_ahead_of_expiry(self):
+        now = [1000.0]
+        login = MagicMock(side_effect=[make_token(1100), make_token(1200)])
+        manager = TokenManager(login=login, refresh_margin=60, clock=lambda: now[0])
+
+        first = manager.get_token()
+        self.assertEqual(manager.get_token(), first)
+        now[0] = 1050.0
+        self.assertNotEqual(manager.get_token(), first)
+        self.assertEqual(login.call_count, 2)
+
+    def test_concurrent_callers_share_one_login(self):
+        def slow_login():
+            time.sleep(0.05)
+            return make_token(time.time() + 3600)
+        login = MagicMock(side_effect=slow_login)
+        manager = TokenManager(login=login)
+
+        tokens = []
+        threads = [threading.Thread(target=lambda: tokens.append(manager.get_token())) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(login.call_count, 1)
+        self.assertEqual(len(set(tokens)), 1)
+
+    def test_refresh_without_credentials(self):
+        manager = TokenManager(access_token="token")
+        self.assertEqual(manager.get_token(), "token")
+        with self.assertRaises(SkribbleAuthError):
+            manager.refresh(stale_token="token")
+
+    @patch.object(SkribbleClient, '_login', side_effect=["old", "new"])
+    def test_client_replays_request_once_after_401(self, mock_login):
+        client = SkribbleClient(username="user", api_key="key")
+        unauthorized = MagicMock(status_code=401)
+        ok = MagicMock(status_code=200, text='{"id": "1"}', content=b'{"id": "1"}')
+        ok.json.return_value = {"id": "1"}
+        client.session = MagicMock()
+        client.session.request.side_effect = [unauthorized, ok]
+
+        self.assertEqual(client._make_request("GET", "/signature-requests/1"), {"id": "1"})
+        authorization = [call.kwargs["headers"]["Authorization"] for call in client.session.request.call_args_list]
+        self.assertEqual(authorization, ["Bearer old", "Bearer new"])
+
+    @patch.object(SkribbleClient, '_login', side_effect=["old", "new"])
+    def test_client_does_not_replay_a_consumed_stream_after_401(self, mock_login):
+        bodies = []
+
+        def handle(method, path, query, headers, body):
+            bodies.append((headers["Authorization"], body))
+            status = 401 if headers["Authorization"] == "Bearer old" else 201
+            return MockResponse(status, {"Content-Type": "application/json"}, b'{"id": "1"}')
+
+        client = SkribbleClient(username="user", api_key="key", transport=InMemoryTransport(handle))
+        read_end, write_end = os.pipe()
+        os.write(write_end, b"hello world")
+        os.close(write_end)
+        with os.fdopen(read_end, "rb") as pipe:
+            body = streaming_json_body({"title": "Contract"}, "content", pipe)
+            with self.assertRaises(SkribbleAuthError):
+                client._make_request("POST", "/documents", body=body)
+
+        self.assertEqual(len(bodies), 1)
+        self.assertEqual(json.loads(bodies[0][1])["content"], base64.b64encode(b"hello world").decode())
+        # The token is refreshed all the same, for the requests that follow
+        self.assertEqual(client._make_request("GET", "/documents/1"), {"id": "1"})
+        self.assertEqual(bodies[-1][0], "Bearer new")
+
+if __name__ == '__main__':
+    unittest.main()
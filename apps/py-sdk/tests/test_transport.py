@@ -0,0 +1,132 @@
+import io
+import os
+import pathlib
+import socket
+import tempfile
+import unittest
+import skribble
+from skribble.aio import document as async_document
+from skribble.aio import seal as async_seal
+from skribble.aio import signature_request as async_signature_request
+from skribble.aio.client import AsyncSkribbleClient
+from skribble.client import SkribbleClient
+from skribble.config import ClientConfig
+from skribble.retry import RetryPolicy
+from skribble.transport import Transport, AsyncTransport, TransportError, RequestsTransport, Urllib3Transport, HTTPXTransport, InMemoryTransport, AsyncInMemoryTransport
+from skribble.testing import MockSkribbleAPI, MockSkribbleServer, Recording, RecordingTransport
+
+class TestTransports(unittest.TestCase):
+
+    def setUp(self):
+        self.api = MockSkribbleAPI(document_size=200 * 1024)
+        self.signature_request_id = self.api.seed(1)[0]
+        self.document_id = self.api.signature_requests[self.signature_request_id]["document_id"]
+
+    def exercise(self, client):
+        with client, skribble.use_client(client):
+            self.assertEqual(skribble.signature_request.get(self.signature_request_id)["id"], self.signature_request_id)
+            self.assertEqual(len(skribble.signature_request.list(page_size=10)), 1)
+            self.assertEqual(len(skribble.document.download(self.document_id)), 200 * 1024)
+            self.assertEqual(sum(map(len, skribble.document.iter_download(self.document_id))), 200 * 1024)
+            with self.assertRaises(skribble.SkribbleAPIError) as context:
+                skribble.document.get("unknown")
+            self.assertEqual(context.exception.status_code, 404)
+
+    def test_in_memory_transport_runs_the_full_client(self):
+        self.exercise(SkribbleClient(username="user", api_key="key", transport=InMemoryTransport(self.api.handle)))
+
+    def test_network_transports_are_interchangeable(self):
+        with MockSkribbleServer(self.api) as server:
+            for transport in (RequestsTransport(), Urllib3Transport(), HTTPXTransport()):
+                with self.subTest(transport=type(transport).__name__):
+                    client = SkribbleClient(username="user", api_key="key", transport=transport)
+                    client.BASE_URL = server.base_url
+                    self.exercise(client)
+
+    def test_connection_errors_are_retryable(self):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        for transport in (RequestsTransport(), Urllib3Transport(), HTTPXTransport()):
+            with self.subTest(transport=type(transport).__name__), self.assertRaises(TransportError) as context:
+                transport.send("GET", f"http://127.0.0.1:{port}/v2/documents")
+            self.assertTrue(context.exception.retryable)
+
+        client = SkribbleClient(access_token="token", retry_policy=RetryPolicy(max_retries=0), transport=Urllib3Transport())
+        client.BASE_URL = f"http://127.0.0.1:{port}/v2"
+        with self.assertRaises(skribble.SkribbleAPIError):
+            client._make_request("GET", "/documents")
+
+    def test_transport_without_send_cannot_be_created(self):
+        class Incomplete(Transport):
+            def close(self):
+                pass
+
+        class IncompleteAsync(AsyncTransport):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+        with self.assertRaises(TypeError):
+            IncompleteAsync()
+
+    def test_http2_is_opt_in(self):
+        self.assertIsInstance(SkribbleClient(access_token="token").transport, RequestsTransport)
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            with self.assertRaisesRegex(ImportError, r"skribble-sdk\[http2\]"):
+                SkribbleClient(access_token="token", config=ClientConfig(http2=True))
+        else:
+            self.assertIsInstance(SkribbleClient(access_token="token", config=ClientConfig(http2=True)).transport, HTTPXTransport)
+
+    def test_recorded_traffic_is_replayed(self):
+        recorder = RecordingTransport(InMemoryTransport(self.api.handle))
+        with skribble.use_client(SkribbleClient(username="user", api_key="key", transport=recorder)):
+            listing = skribble.signature_request.list()
+            content = skribble.document.download(self.document_id)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traffic.jsonl")
+            recorder.recording.save(path)
+            recording = Recording.load(path)
+
+        self.api.signature_requests.clear()
+        with skribble.use_client(SkribbleClient(username="user", api_key="key", transport=InMemoryTransport(recording.handle))):
+            for _ in range(3):
+                self.assertEqual(skribble.signature_request.list(), listing)
+            self.assertEqual(skribble.document.download(self.document_id), content)
+            with self.assertRaises(skribble.SkribbleAPIError) as context:
+                skribble.signature_request.get(self.signature_request_id)
+            self.assertEqual(context.exception.status_code, 404)
+
+class TestAsyncTransports(unittest.IsolatedAsyncioTestCase):
+
+    async def test_in_memory_transport(self):
+        api = MockSkribbleAPI(document_size=1024)
+        document_id = api.signature_requests[api.seed(1)[0]]["document_id"]
+
+        async with AsyncSkribbleClient(username="user", api_key="key", transport=AsyncInMemoryTransport(api.handle)) as client:
+            with skribble.aio.use_client(client):
+                self.assertEqual(len(await async_document.download(document_id)), 1024)
+                self.assertEqual((await async_document.get(document_id))["id"], document_id)
+
+    async def test_streamed_uploads_over_httpx(self):
+        api = MockSkribbleAPI()
+        raw = os.urandom(50 * 1024)
+        with tempfile.TemporaryDirectory() as directory, MockSkribbleServer(api) as server:
+            path = pathlib.Path(directory, "contract.pdf")
+            path.write_bytes(raw)
+            async with server.async_client() as client:
+                with skribble.aio.use_client(client):
+                    document = await async_document.add({"title": "From path", "content_type": "application/pdf", "content": path})
+                    created = await async_signature_request.create({"title": "From stream", "content": io.BytesIO(raw), "signatures": [{"account_email": "signer@example.com"}]})
+                    sealed = await async_seal.create({"title": "Sealed", "content": path})
+
+        self.assertEqual(api.documents[document["id"]]["title"], "From path")
+        self.assertIn(created["id"], api.signature_requests)
+        self.assertIn(sealed["document_id"], api.documents)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+from skribble.watcher import StatusWatcher, StatusChange
+from skribble.aio.watcher import AsyncStatusWatcher
+from skribble.exceptions import SkribbleAPIError
+
+def signature_request(id, status="OPEN", signer_status="OPEN"):
+    return {"id": id, "status_overall": status, "signatures": [{"sid": f"{id}-signer", "status_code": signer_status}]}
+
+class FakeAPI:
+    """
+    Serves a listing of the open requests in ``state`` and the details of every request.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.calls = []
+
+    def __call__(self, method, endpoint, params=None, **kwargs):
+        self.calls.append((endpoint, params and params.get("page_number")))
+        if endpoint == "/signature-requests":
+            open_requests = [request for request in self.state.values() if request["status_overall"] == params["status_overall"]]
+            start = params["page_number"] * params["page_size"]
+            return open_requests[start:start + params["page_size"]]
+        id = endpoint.rsplit("/", 1)[1]
+        if id not in self.state:
+            raise SkribbleAPIError("Not found", status_code=404)
+        return self.state[id]
+
+class TestStatusWatcher(unittest.TestCase):
+
+    def test_poll_lists_and_fetches_only_changed_requests(self):
+        api = FakeAPI({
+            "sr1": signature_request("sr1"),
+            "sr2": signature_request("sr2"),
+            "sr3": signature_request("sr3", status="SIGNED", signer_status="SIGNED")
+        })
+        mock_client = MagicMock()
+        mock_client._make_request.side_effect = api
+        watcher = StatusWatcher(["sr1", "sr2", "sr3"], page_size=2)
+
+        with patch('skribble.watcher.get_client', return_value=mock_client):
+            # The first poll only reports the request that is already finished
+            self.assertEqual(watcher.poll(), [StatusChange("sr3", None, "SIGNED", api.state["sr3"], True)])
+            self.assertEqual(api.calls, [("/signature-requests", 0), ("/signature-requests", 1), ("/signature-requests/sr3", None)])
+            self.assertEqual(sorted(watcher.watching), ["sr1", "sr2"])
+
+            api.calls.clear()
+            self.assertEqual(watcher.poll(), [])
+            self.assertEqual(api.calls, [("/signature-requests", 0)])
+
+            api.calls.clear()
+            api.state["sr1"] = signature_request("sr1", signer_status="SIGNED")
+            del api.state["sr2"]
+            changes = {change.signature_request_id: change for change in watcher.poll()}
+            self.assertEqual(sorted(api.calls), [("/signature-requests", 0), ("/signature-requests/sr1", None), ("/signature-requests/sr2", None)])
+
+        self.assertEqual(changes["sr1"], StatusChange("sr1", "OPEN", "OPEN", api.state["sr1"], False))
+        self.assertEqual(changes["sr2"], StatusChange("sr2", "OPEN", None, None, True))
+        self.assertEqual(watcher.watching, ["sr1"])
+
+    def test_failed_fetch_keeps_watching(self):
+        mock_client = MagicMock()
+        mock_client._make_request.side_effect = [[], SkribbleAPIError("Unavailable", status_code=503)]
+        watcher = StatusWatcher(["sr1"])
+
+        with patch('skribble.watcher.get_client', return_value=mock_client):
+            self.assertEqual(watcher.poll(), [])
+        self.assertIn("sr1", watcher)
+
+    def test_run_stops_when_nothing_is_left(self):
+        api = FakeAPI({"sr1": signature_request("sr1")})
+        mock_client = MagicMock()
+        mock_client._make_request.side_effect = api
+        watcher = StatusWatcher(["sr1"], interval=0)
+        changes = []
+
+        def on_change(change):
+            changes.append(change)
+
+        def sign_on_second_poll(*args, **kwargs):
+            if len(api.calls) == 1:
+                api.state["sr1"] = signature_request("sr1", status="SIGNED", signer_status="SIGNED")
+            return api(*args, **kwargs)
+
+        mock_client._make_request.side_effect = sign_on_second_poll
+        with patch('skribble.watcher.get_client', return_value=mock_client):
+            watcher.run(on_change)
+
+        self.assertEqual([(change.status, change.final) for change in changes], [("SIGNED", True)])
+        self.assertEqual(len(watcher), 0)
+
+class TestAsyncStatusWatcher(unittest.IsolatedAsyncioTestCase):
+
+    @patch('skribble.aio.watcher.get_client')
+    async def test_watch_yields_changes(self, mock_get_client):
+        api = FakeAPI({"sr1": signature_request("sr1"), "sr2": signature_request("sr2")})
+
+        async def make_request(*args, **kwargs):
+            if len(api.calls) == 1:
+                api.state["sr2"] = signature_request("sr2", status="DECLINED", signer_status="DECLINED")
+            return api(*args, **kwargs)
+
+        mock_client = MagicMock()
+        mock_client._make_request = AsyncMock(side_effect=make_request)
+        mock_get_client.return_value = mock_client
+        watcher = AsyncStatusWatcher(["sr1", "sr2"], interval=0)
+
+        async for change in watcher.watch():
+            watcher.stop()
+
+        self.assertEqual(change, StatusChange("sr2", "OPEN", "DECLINED", api.state["sr2"], True))
+        self.assertEqual(watcher.watching, ["sr1"])
+
+if __name__ == '__main__':
+    unittest.main()